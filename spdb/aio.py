@@ -0,0 +1,248 @@
+import asyncio
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from spdb.base import SPDB
+from spdb.model import BaseModel, TModel
+from spdb.provider import SharePointProvider
+from spdb.query import Condition, to_filter
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one thread call.
+
+    The first caller of a key starts the call in a worker thread; callers
+    arriving while it is in flight await the same result. Cancelling one
+    caller does not cancel the shared call.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Hashable, asyncio.Future] = {}
+
+    async def run(
+        self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``func`` in a thread unless a call with ``key`` is in flight."""
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                asyncio.to_thread(func, *args, **kwargs)
+            )
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+
+class AsyncSharePointProvider:
+    """Asyncio interface of a :class:`spdb.provider.SharePointProvider`.
+
+    Requests run in worker threads, so they do not block the event loop.
+    Concurrent requests for the same list and projection share a single
+    in-flight request.
+
+    Example:
+        provider = AsyncSharePointProvider(SharePointProvider(url, user, pwd))
+        items = await provider.get_list_items("Server")
+    """
+
+    def __init__(self, provider: SharePointProvider):
+        """
+        Args:
+            provider: Synchronous provider performing the requests.
+        """
+        self.provider = provider
+        self._flights = SingleFlight()
+
+    async def fetch_list_items(
+        self,
+        list_name: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        where: list[Condition] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch raw list items, see :meth:`SharePointProvider.fetch_list_items`."""
+        key = (
+            "fetch",
+            list_name,
+            _key(select),
+            _key(expand),
+            to_filter(where) if where else None,
+        )
+        return await self._flights.run(
+            key,
+            self.provider.fetch_list_items,
+            list_name,
+            select=select,
+            expand=expand,
+            where=where,
+        )
+
+    async def get_list_items(
+        self,
+        list_name: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get cached raw list items, see :meth:`SharePointProvider.get_list_items`."""
+        key = ("get", list_name, _key(select), _key(expand))
+        return await self._flights.run(
+            key,
+            self.provider.get_list_items,
+            list_name,
+            select=select,
+            expand=expand,
+        )
+
+    async def get_list_version(self, list_name: str) -> str | None:
+        """Get the list version, see :meth:`SharePointProvider.get_list_version`."""
+        return await self._flights.run(
+            ("version", list_name), self.provider.get_list_version, list_name
+        )
+
+    async def clear_cache(
+        self, list_name: str | None = None, persistent: bool = True
+    ) -> None:
+        """Clear cached payloads, see :meth:`SharePointProvider.clear_cache`."""
+        await asyncio.to_thread(
+            self.provider.clear_cache, list_name, persistent=persistent
+        )
+
+
+class AsyncSPDB:
+    """Asyncio interface of :class:`spdb.base.SPDB`.
+
+    Lists missing from the cache are loaded in worker threads, one
+    in-flight load per list shared by all concurrent callers. Plain reads
+    served from the cache run directly on the event loop; expansions and
+    ID lookups run in worker threads.
+
+    Example:
+        aspdb = AsyncSPDB(SPDB(provider, models=[Server, Application]))
+        servers = await aspdb.get_model_items(Server, expanded=True)
+    """
+
+    def __init__(self, spdb: SPDB):
+        """
+        Args:
+            spdb: Synchronous SPDB instance holding models and caches.
+        """
+        self.spdb = spdb
+        self._flights = SingleFlight()
+
+    async def load_models(
+        self, model_classes: Iterable[type[TModel]] | None = None
+    ) -> None:
+        """Load models missing from the cache concurrently.
+
+        Args:
+            model_classes: Models to load, or None to load all registered models.
+
+        Raises:
+            ModelLoadError: If loading any of the models fails.
+        """
+        if model_classes is None:
+            model_classes = self.spdb._models.values()
+        missing = [
+            m for m in model_classes if m.__name__ not in self.spdb._cache
+        ]
+        await asyncio.gather(
+            *(
+                self._flights.run(m.__name__, self.spdb._get_items, m)
+                for m in missing
+            )
+        )
+
+    async def get_model_items(
+        self,
+        model_cls: type[TModel],
+        expanded: bool = False,
+        lazy: bool = False,
+        depth: int | None = 1,
+    ) -> list[TModel]:
+        """Retrieve list of models, see :meth:`SPDB.get_model_items`.
+
+        Expansions run in a worker thread, shared by concurrent callers.
+        With ``lazy`` every list reachable from ``model_cls`` is loaded and
+        indexed up front, so relations resolved on attribute access are
+        served from the cache without blocking the event loop.
+        """
+        self.spdb._check_model(model_cls)
+        related = self._related_models(model_cls, expanded, lazy, depth)
+        await self.load_models([model_cls, *related])
+        if not expanded and not lazy:
+            return self.spdb.get_model_items(model_cls)
+        key = ("items", model_cls.__name__, lazy, None if lazy else depth)
+        return await self._flights.run(
+            key, self._get_model_items, model_cls, related, lazy, depth
+        )
+
+    async def get_models_by_ids(
+        self,
+        model_cls: type[TModel],
+        ids: list[int | str],
+        expanded: bool = False,
+        lazy: bool = False,
+    ) -> list[TModel]:
+        """Retrieve models by their IDs, see :meth:`SPDB.get_models_by_ids`.
+
+        Lookups run in a worker thread, as they may query the list or build
+        its indexes. Related lists are loaded like in
+        :meth:`get_model_items`.
+        """
+        self.spdb._check_model(model_cls)
+        related = self._related_models(model_cls, expanded, lazy, 1)
+        await self.load_models(related)
+        return await asyncio.to_thread(
+            self._get_models_by_ids, model_cls, ids, related, expanded, lazy
+        )
+
+    def _related_models(
+        self,
+        model_cls: type[TModel],
+        expanded: bool,
+        lazy: bool,
+        depth: int | None,
+    ) -> list[type[BaseModel]]:
+        """Get the related models to load before a read."""
+        if lazy or (expanded and depth is None):
+            return self.spdb._related_models(model_cls, len(self.spdb._models))
+        if expanded:
+            return self.spdb._related_models(model_cls, depth)
+        return []
+
+    def _get_model_items(
+        self,
+        model_cls: type[TModel],
+        related: list[type[BaseModel]],
+        lazy: bool,
+        depth: int | None,
+    ) -> list[TModel]:
+        if lazy:
+            self.spdb._ensure_lookups(related)
+            return self.spdb.get_model_items(model_cls, lazy=True)
+        return self.spdb.get_model_items(model_cls, expanded=True, depth=depth)
+
+    def _get_models_by_ids(
+        self,
+        model_cls: type[TModel],
+        ids: list[int | str],
+        related: list[type[BaseModel]],
+        expanded: bool,
+        lazy: bool,
+    ) -> list[TModel]:
+        if lazy:
+            self.spdb._ensure_lookups(related)
+        return self.spdb.get_models_by_ids(model_cls, ids, expanded, lazy)
+
+    async def refresh_cache(
+        self, model_cls: type[BaseModel] | None = None
+    ) -> None:
+        """Refresh cached data, see :meth:`SPDB.refresh_cache`."""
+        self.spdb.refresh_cache(model_cls)
+
+
+def _key(columns: list[str] | None) -> tuple[str, ...] | None:
+    return None if columns is None else tuple(columns)
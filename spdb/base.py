@@ -1,9 +1,88 @@
 import logging
-from typing import Any
+from collections.abc import (
+    Collection,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice, repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from spdb.error import ModelLoadError
+from spdb.cache import Cache, CacheBudget, CacheStats
+from spdb.columnar import to_columns, to_table, write_parquet
+from spdb.compact import CompactList
+from spdb.error import (
+    ModelLoadError,
+    ModelWriteError,
+    RelationCycleError,
+    WriteConflictError,
+)
+from spdb.index import CompactIndex, ModelIndex, relation_key
+from spdb.intern import InternTable
+from spdb.locks import KeyedLocks
 from spdb.model import BaseModel, TModel
-from spdb.provider import SharePointProvider
+from spdb.provider import (
+    DEFAULT_PAGE_SIZE,
+    ETAG_COLUMN,
+    MODIFIED_COLUMN,
+    ETagMismatchError,
+    PartialWriteError,
+    SharePointProvider,
+)
+from spdb.query import build_conditions
+from spdb.throttle import status_code
+
+if TYPE_CHECKING:
+    import pyarrow
+
+DEFAULT_MAX_WORKERS = 4
+
+VALIDATION_BATCH_SIZE = 1000
+"""Number of raw items validated at once by :meth:`SPDB.build_model_items`."""
+
+DEFAULT_PROCESS_CHUNK_SIZE = 10_000
+"""Number of raw items sent to a worker process at once."""
+
+MAX_REPORTED_ERRORS = 5
+"""Number of invalid items detailed when validating in worker processes."""
+
+ID_FILTER_CHUNK_SIZE = 100
+"""Number of IDs per ``$filter`` of an uncached :meth:`SPDB.get_models_by_ids`."""
+
+
+def _validate_items(
+    model_cls: type[TModel], raw_items: Iterable[dict]
+) -> tuple[list[TModel], list[tuple[Any, str]]]:
+    """Validate raw items in batches, collecting errors of invalid items.
+
+    Defined at module level so it can run in worker processes.
+
+    Args:
+        model_cls: The model class to instantiate.
+        raw_items: Raw SharePoint items.
+
+    Returns:
+        Valid model instances in input order, and ``(Id, error)`` pairs of
+        the skipped items.
+    """
+    adapter = model_cls.get_list_adapter()
+    loaded = []
+    errors = []
+    raw_iter = iter(raw_items)
+    while batch := list(islice(raw_iter, VALIDATION_BATCH_SIZE)):
+        try:
+            loaded.extend(adapter.validate_python(batch))
+        except Exception:
+            for item_data in batch:
+                try:
+                    loaded.append(model_cls(**item_data))
+                except Exception as e:
+                    errors.append((item_data.get("Id", "Unknown"), str(e)))
+    return loaded, errors
 
 
 class SPDB:
@@ -22,78 +101,355 @@ class SPDB:
     default_provider: type[SharePointProvider] = SharePointProvider
 
     def __init__(
-        self, provider: SharePointProvider, models: list[type[TModel]]
+        self,
+        provider: SharePointProvider,
+        models: list[type[TModel]],
+        page_size: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_ttl: float | None = None,
+        cache_max_bytes: int | None = None,
+        trusted: bool = False,
+        processes: int | None = None,
+        process_chunk_size: int = DEFAULT_PROCESS_CHUNK_SIZE,
+        batch: bool = False,
+        compact: bool = False,
     ):
         """Initialize SPDB with provider and model classes.
 
         Args:
             provider: SharePoint provider instance for data access.
             models: List of BaseModel classes representing SharePoint lists.
+            page_size: If set, lists are streamed from the provider in pages
+                of this size and validated as they arrive, instead of being
+                downloaded in full before validation.
+            max_workers: Maximum number of lists loaded concurrently when
+                several models are needed at once. ``1`` loads sequentially.
+            cache_ttl: Seconds after which cached models are reloaded, None
+                to keep them until refreshed. Models can override it with
+                their ``_cache_ttl`` class variable.
+            cache_max_bytes: Approximate memory limit shared by cached models,
+                their indexes, memoized expansions and lazy copies; least
+                recently used entries of any of them are evicted beyond it.
+            trusted: Build all models from raw items without validation, see
+                :meth:`spdb.model.BaseModel.construct_trusted`. Models can
+                opt in individually with their ``_trusted`` class variable.
+                Loads are not faster than with validation, as building the
+                instances dominates either way.
+            processes: If set, lists larger than ``process_chunk_size`` are
+                validated in chunks on a pool of this many processes. Models
+                must be importable by the worker processes.
+            process_chunk_size: Number of raw items per worker process task.
+            batch: If True, lists loaded together are requested with a
+                single ``$batch`` request instead of one request per list.
+            compact: Cache models as column arrays, see
+                :class:`spdb.compact.CompactList`. Models can opt in
+                individually with their ``_compact`` class variable.
         """
         self.provider = provider
+        self.trusted = trusted
+        self.processes = processes
+        self.process_chunk_size = process_chunk_size
+        self.batch = batch
+        self.compact = compact
+        self.page_size = page_size
+        self.max_workers = max_workers
         self._models: dict[str, type[TModel]] = {m.__name__: m for m in models}
-        self._cache: dict[str, list[TModel]] = {}
-        self._lookups: dict[str, dict[Any, TModel]] = {}
+        budget = (
+            None if cache_max_bytes is None else CacheBudget(cache_max_bytes)
+        )
+        self._cache: Cache[str, list[TModel]] = Cache(
+            ttl=cache_ttl, on_evict=self._on_evict, budget=budget
+        )
+        self._lookups: Cache[str, ModelIndex[TModel] | CompactIndex[TModel]] = (
+            Cache(budget=budget)
+        )
+        self._expanded: Cache[tuple[str, int], list[TModel]] = Cache(
+            budget=budget
+        )
+        self._lazy_items: Cache[str, list[TModel]] = Cache(budget=budget)
+        self._sync_marks: dict[str, str] = {}
+        self._etags: dict[str, dict[Any, str]] = {}
+        self._locks: KeyedLocks[str] = KeyedLocks()
+
+    @property
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Hit, miss and eviction counters of the model and index caches."""
+        return {
+            "models": self._cache.stats,
+            "lookups": self._lookups.stats,
+            "expanded": self._expanded.stats,
+            "lazy": self._lazy_items.stats,
+        }
+
+    def _on_evict(self, model_name: str, items: list[TModel]) -> None:
+        """Drop indexes and other data derived from an evicted model."""
+        logging.debug(f"Evicted {len(items)} {model_name} items from cache")
+        self._lookups.pop(model_name, None)
+        self._sync_marks.pop(model_name, None)
+        self._etags.pop(model_name, None)
+        self._invalidate_expanded(model_name)
+        model_cls = self._models.get(model_name)
+        if model_cls is not None:
+            self.provider.clear_cache(
+                model_cls.get_list_name(), persistent=False
+            )
 
     def get_model_items(
         self,
         model_cls: type[TModel],
         expanded: bool = False,
+        lazy: bool = False,
+        depth: int | None = 1,
     ) -> list[TModel]:
         """Retrieve list of models of specified type.
 
         Args:
             model_cls: The :class:`spdb.model.TModel` model subclass to load.
             expanded: If True, expand all related fields.
+            lazy: If True, return copies whose related fields are expanded
+                only when accessed, loading the related list on first use.
+                The copies are memoized like expanded lists.
+            depth: Number of relation levels to expand, e.g. ``2`` also
+                expands ``Server.application.owner``. None expands all
+                reachable levels; for self-referencing models such as
+                ``Employee.manager`` it follows the longest chain in the
+                loaded items.
 
         Returns:
-            List of Pydantic model instances.
+            List of Pydantic model instances. Expanded lists are memoized
+            until the model or one of its related models is refreshed,
+            except for compact models, which are expanded on every call.
 
         Raises:
             ValueError: If model_cls is not a registered model.
             ModelLoadError: If loading fails.
+            RelationCycleError: If depth is None and items reference each
+                other in a cycle.
         """
-        if not issubclass(model_cls, BaseModel):
-            raise TypeError(
-                f"model_cls must be a BaseModel subclass, got {type(model_cls)}"
-            )
-
-        if model_cls.__name__ not in self._models:
-            raise ValueError(
-                f"Model {model_cls.__name__} not registered with this SPDB instance"
-            )
-
-        name = model_cls.__name__
-        if name not in self._cache:
-            self._cache[name] = self.load_model_items(model_cls)
-        items = self._cache[name]
+        self._check_model(model_cls)
+        if expanded and not lazy:
+            if depth is None:
+                depth = self._relation_depth(model_cls)
+            related = self._related_models(model_cls, depth)
+            if all(self._is_cached(m) for m in [model_cls, *related]):
+                expanded_items = self._expanded.get((model_cls.__name__, depth))
+                if expanded_items is not None:
+                    return expanded_items
+        items = self._get_items(model_cls)
+        if lazy:
+            lazy_items = self._lazy_items.get(model_cls.__name__)
+            if lazy_items is None:
+                lazy_items = self._lazy(items)
+                self._lazy_items[model_cls.__name__] = lazy_items
+            return lazy_items
         if not expanded:
             return items
-        return self._expand(items, model_cls)
+        expanded_items = self._expand(items, model_cls, depth)
+        if not isinstance(items, CompactList):
+            self._expanded[(model_cls.__name__, depth)] = expanded_items
+        return expanded_items
 
     def get_models_by_ids(
         self,
         model_cls: type[TModel],
         ids: list[int | str],
         expanded: bool = False,
+        lazy: bool = False,
     ) -> list[TModel]:
         """Retrieve specific models by their IDs for efficient lookups.
 
+        If the model is already cached the IDs are looked up in its ID
+        index, otherwise only the requested items are fetched with
+        :meth:`query`, in chunks of :data:`ID_FILTER_CHUNK_SIZE` IDs so the
+        ``$filter`` stays within query string limits. Results follow the
+        order of ``ids``.
+
         Args:
             model_cls: The :class:`spdb.model.TModel` model subclass to load.
             ids: List of model IDs to retrieve.
             expanded: If True, expand all related fields.
+            lazy: If True, expand related fields only when accessed.
 
         Returns:
             List of Pydantic model instances matching the IDs.
         """
-        all_models = self.get_model_items(model_cls, expanded=expanded)
-        id_set = set(ids)
-        return [model for model in all_models if model.id in id_set]
+        if not ids:
+            return []
+        if model_cls.__name__ not in self._cache:
+            unique = list(dict.fromkeys(ids))
+            by_id = {}
+            for start in range(0, len(unique), ID_FILTER_CHUNK_SIZE):
+                chunk = unique[start : start + ID_FILTER_CHUNK_SIZE]
+                for obj in self.query(model_cls, where={"id": chunk}):
+                    by_id[obj.id] = obj
+        else:
+            self._check_model(model_cls)
+            cached = self._cache.get(model_cls.__name__)
+            if isinstance(cached, CompactList):
+                by_id = cached.get_by_ids(ids)
+            else:
+                by_id = self._index(model_cls).by_id
+        items = [by_id[i] for i in ids if i in by_id]
+        if lazy:
+            return self._lazy(items)
+        if not expanded:
+            return items
+        return self._expand(items, model_cls)
+
+    def find(
+        self,
+        model_cls: type[TModel],
+        field: str,
+        value: Any,
+        expanded: bool = False,
+    ) -> list[TModel]:
+        """Retrieve models whose field equals, or for lists contains, a value.
+
+        Uses a hash index on the field. Fields listed in the model's
+        ``_indexes`` class variable are indexed when the model is loaded,
+        other fields are indexed on first use.
+
+        Example:
+            spdb.find(Server, "roles", "Web Server")
+
+        Args:
+            model_cls: The :class:`spdb.model.TModel` model subclass to load.
+            field: Name of the model field to match.
+            value: Value to look up.
+            expanded: If True, expand all related fields.
+
+        Returns:
+            List of Pydantic model instances matching the value.
+
+        Raises:
+            ValueError: If the field does not exist on the model.
+        """
+        self._check_model(model_cls)
+        if field not in model_cls.model_fields:
+            raise ValueError(
+                f"Unknown field '{field}' for model {model_cls.__name__}"
+            )
+        index = self._index(model_cls)
+        with self._locks[model_cls.__name__]:
+            index.add_field(field)
+            items = index.find(field, value)
+        if not expanded:
+            return items
+        return self._expand(items, model_cls)
+
+    def query(
+        self,
+        model_cls: type[TModel],
+        where: Mapping[str, Any],
+        expanded: bool = False,
+    ) -> list[TModel]:
+        """Retrieve models matching field predicates, filtered by SharePoint.
+
+        Predicates are translated to an OData ``$filter`` on the model's
+        column aliases, so only matching items are downloaded. Results are
+        not cached. See :func:`spdb.query.build_conditions` for the syntax.
+
+        Example:
+            spdb.query(Server, where={"location": "DC1", "id__lt": 100})
+
+        Args:
+            model_cls: The :class:`spdb.model.TModel` model subclass to load.
+            where: Mapping of field predicates to values.
+            expanded: If True, expand all related fields.
+
+        Returns:
+            List of Pydantic model instances matching all predicates.
+
+        Raises:
+            ValueError: If a predicate refers to an unknown field.
+            ModelLoadError: If loading fails.
+        """
+        self._check_model(model_cls)
+        conditions = build_conditions(model_cls, where)
+        try:
+            raw_items = self.provider.fetch_list_items(
+                model_cls.get_list_name(),
+                select=model_cls.get_select_fields(),
+                expand=model_cls.get_expand_fields(),
+                where=conditions,
+            )
+        except Exception as e:
+            raise self._load_error(model_cls, e) from e
+        etags = self._etags.setdefault(model_cls.__name__, {})
+        for item in raw_items:
+            if item.get(ETAG_COLUMN) is not None:
+                etags[item.get("Id")] = item[ETAG_COLUMN]
+        items = self.build_model_items(model_cls, raw_items)
+        if not expanded:
+            return items
+        return self._expand(items, model_cls)
+
+    def _get_items(self, model_cls: type[TModel]) -> list[TModel]:
+        """Return cached items of a model, loading them on a cache miss.
+
+        Loads are serialized per model, so threads missing the cache at the
+        same time wait for a single load instead of each fetching the list.
+        Models declaring ``_indexes`` get their indexes built with the load.
+        """
+        items = self._cache.get(model_cls.__name__)
+        if items is not None:
+            return items
+        with self._locks[model_cls.__name__]:
+            items = self._cache.get(model_cls.__name__)
+            if items is None:
+                items = self._store(model_cls, self.load_model_items(model_cls))
+                if model_cls._indexes:
+                    self._index(model_cls)
+        return items
+
+    def _is_cached(self, model_cls: type[BaseModel]) -> bool:
+        """Check whether items of a model are cached.
+
+        The check expires stale items, and their eviction drops indexes and
+        expansions derived from them, so it must precede any use of those.
+        """
+        return model_cls.__name__ in self._cache
+
+    def _store(
+        self, model_cls: type[TModel], items: list[TModel]
+    ) -> Sequence[TModel]:
+        """Cache model items, honoring the model's own TTL if it has one.
+
+        Items of compact models are converted to a
+        :class:`spdb.compact.CompactList`, which is returned. As its indexes
+        hold row positions, an existing index is rebuilt for the new list.
+        """
+        if not (self.compact or model_cls._compact):
+            self._cache.set(model_cls.__name__, items, ttl=model_cls._cache_ttl)
+            return items
+        if not isinstance(items, CompactList):
+            items = CompactList(model_cls, items)
+        self._cache.set(model_cls.__name__, items, ttl=model_cls._cache_ttl)
+        index = self._lookups.get(model_cls.__name__)
+        if index is not None:
+            self._lookups[model_cls.__name__] = CompactIndex(
+                items, fields=index.fields
+            )
+        return items
+
+    def _check_model(self, model_cls: type[TModel]) -> None:
+        if not issubclass(model_cls, BaseModel):
+            raise TypeError(
+                f"model_cls must be a BaseModel subclass, got {type(model_cls)}"
+            )
+
+        if model_cls.__name__ not in self._models:
+            raise ValueError(
+                f"Model {model_cls.__name__} not registered with this SPDB instance"
+            )
 
     def load_model_items(self, model_cls: type[TModel]) -> list[TModel]:
         """Load raw data from SharePoint into Pydantic models.
 
+        When ``page_size`` is set, raw items are streamed page by page and
+        each page is validated before the next one is requested, so only one
+        page of raw data is held in memory at a time.
+
         Args:
             model_cls: The model class to instantiate.
 
@@ -103,68 +459,670 @@ class SPDB:
         Raises:
             ModelLoadError: If data retrieval from provider fails.
         """
+        if self.page_size:
+            raw_items = self._iter_raw_items(model_cls, self.page_size)
+        else:
+            try:
+                raw_items = self.provider.get_list_items(
+                    model_cls.get_list_name(),
+                    select=self._select_fields(model_cls),
+                    expand=model_cls.get_expand_fields(),
+                )
+            except Exception as e:
+                raise self._load_error(model_cls, e) from e
+
+        return self.build_model_items(
+            model_cls, self._track_items(model_cls, raw_items)
+        )
+
+    def iter_model_items(
+        self, model_cls: type[TModel], page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[list[TModel]]:
+        """Stream models page by page without caching them.
+
+        Args:
+            model_cls: The model class to instantiate.
+            page_size: Number of items requested per page.
+
+        Yields:
+            Lists of model instances, one list per page.
+
+        Raises:
+            ModelLoadError: If data retrieval from provider fails.
+        """
+        for page in self._iter_raw_pages(model_cls, page_size):
+            yield self.build_model_items(model_cls, page)
+
+    def to_columns(self, model_cls: type[TModel]) -> dict[str, list[Any]]:
+        """Download a list as one list of values per model field.
+
+        Values are read from the raw payloads without building models, see
+        :func:`spdb.columnar.to_columns`. The model cache is not used.
+
+        Args:
+            model_cls: The model class describing the list.
+
+        Returns:
+            Mapping of field names to column values.
+
+        Raises:
+            ModelLoadError: If data retrieval from provider fails.
+        """
+        self._check_model(model_cls)
+        columns: dict[str, list[Any]] = {}
+        for page in self._iter_raw_column_pages(model_cls):
+            for name, values in to_columns(model_cls, page).items():
+                columns.setdefault(name, []).extend(values)
+        return columns or {name: [] for name in model_cls.model_fields}
+
+    def to_arrow(self, model_cls: type[TModel]) -> "pyarrow.Table":
+        """Download a list as an Arrow table with one column per model field.
+
+        Raw payloads are converted to typed Arrow arrays without building
+        models, one record batch per page when ``page_size`` is set. Use
+        ``table.column(name).to_numpy()`` or ``table.to_pandas()`` for
+        NumPy or pandas.
+
+        Args:
+            model_cls: The model class describing the list.
+
+        Returns:
+            Arrow table of the list items.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ModelLoadError: If data retrieval from provider fails.
+        """
+        self._check_model(model_cls)
+        return to_table(model_cls, self._iter_raw_column_pages(model_cls))
+
+    def write_parquet(
+        self, model_cls: type[TModel], path: str | Path, **kwargs: Any
+    ) -> None:
+        """Write a snapshot of a list to a Parquet file.
+
+        Args:
+            model_cls: The model class describing the list.
+            path: Destination file.
+            **kwargs: Options passed to ``pyarrow.parquet.write_table``.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ModelLoadError: If data retrieval from provider fails.
+        """
+        table = self.to_arrow(model_cls)
+        write_parquet(table, str(path), **kwargs)
+        logging.info(
+            f"Wrote {table.num_rows} {model_cls.__name__} items to {path}"
+        )
+
+    def _iter_raw_column_pages(
+        self, model_cls: type[TModel]
+    ) -> Iterator[list[dict]]:
+        """Yield raw items for export, page by page if ``page_size`` is set."""
+        if self.page_size:
+            yield from self._iter_raw_pages(model_cls, self.page_size)
+            return
         try:
-            raw_items = self.provider.get_list_items(model_cls.get_list_name())
+            yield self.provider.get_list_items(
+                model_cls.get_list_name(),
+                select=self._select_fields(model_cls),
+                expand=model_cls.get_expand_fields(),
+            )
         except Exception as e:
-            logging.error(
-                f"Failed to retrieve data for {model_cls.__name__}: {e}"
+            raise self._load_error(model_cls, e) from e
+
+    def _iter_raw_pages(
+        self, model_cls: type[TModel], page_size: int
+    ) -> Iterator[list[dict]]:
+        """Yield raw provider pages, wrapping provider failures."""
+        try:
+            pages = iter(
+                self.provider.iter_list_pages(
+                    model_cls.get_list_name(),
+                    select=self._select_fields(model_cls),
+                    expand=model_cls.get_expand_fields(),
+                    page_size=page_size,
+                )
             )
-            raise ModelLoadError(
-                f"Failed to retrieve data for {model_cls.__name__}: {e}"
-            ) from e
+        except Exception as e:
+            raise self._load_error(model_cls, e) from e
+        while True:
+            try:
+                page = next(pages)
+            except StopIteration:
+                return
+            except Exception as e:
+                raise self._load_error(model_cls, e) from e
+            yield page
+
+    def _iter_raw_items(
+        self, model_cls: type[TModel], page_size: int
+    ) -> Iterator[dict]:
+        """Yield raw provider items one by one across pages."""
+        for page in self._iter_raw_pages(model_cls, page_size):
+            yield from page
 
-        return self.build_model_items(model_cls, raw_items)
+    def _select_fields(self, model_cls: type[TModel]) -> list[str]:
+        """Get model columns plus the column used for incremental sync."""
+        select = model_cls.get_select_fields()
+        if MODIFIED_COLUMN in select:
+            return select
+        return [*select, MODIFIED_COLUMN]
+
+    def _track_items(
+        self, model_cls: type[TModel], raw_items: Iterable[dict]
+    ) -> Iterator[dict]:
+        """Pass raw items through, recording ETags and the latest ``Modified``."""
+        name = model_cls.__name__
+        mark = self._sync_marks.get(name)
+        etags = self._etags.setdefault(name, {})
+        for item in raw_items:
+            modified = item.get(MODIFIED_COLUMN)
+            if modified and (mark is None or modified > mark):
+                mark = modified
+            etag = item.get(ETAG_COLUMN)
+            if etag is not None:
+                etags[item.get("Id")] = etag
+            yield item
+        if mark:
+            self._sync_marks[name] = mark
+
+    def _load_error(
+        self, model_cls: type[TModel], error: Exception
+    ) -> ModelLoadError:
+        message = f"Failed to retrieve data for {model_cls.__name__}: {error}"
+        logging.error(message)
+        return ModelLoadError(message)
 
     def build_model_items(
+        self, model_cls: type[TModel], raw_items: Iterable[dict]
+    ) -> list[TModel]:
+        """Validate raw SharePoint items into model instances.
+
+        Items are validated in batches of :data:`VALIDATION_BATCH_SIZE`
+        with the model's list ``TypeAdapter``. Only batches containing an
+        invalid item are validated again row by row to skip that item.
+        Trusted models are constructed without validation. Large lists are
+        validated in worker processes if ``processes`` is set. Equal string
+        values of trusted items and of items returned by worker processes,
+        such as lookup titles, are replaced by one shared instance per load,
+        see :class:`spdb.intern.InternTable`.
+
+        Args:
+            model_cls: The model class to instantiate.
+            raw_items: Raw items, either a list or a lazily fetched stream.
+
+        Returns:
+            List of valid model instances; invalid items are skipped.
+        """
+        return self._build_model_items(model_cls, raw_items)
+
+    def _build_model_items(
+        self, model_cls: type[TModel], raw_items: Iterable[dict]
+    ) -> list[TModel]:
+        if self.trusted or model_cls._trusted:
+            loaded = model_cls.construct_trusted_many(raw_items)
+            logging.info(
+                f"Successfully loaded {len(loaded)} trusted {model_cls.__name__} instances"
+            )
+            return self._intern(model_cls, loaded)
+        if self.processes:
+            raw_items = list(raw_items)
+            if len(raw_items) > self.process_chunk_size:
+                return self._intern(
+                    model_cls, self._build_in_processes(model_cls, raw_items)
+                )
+        loaded, errors = _validate_items(model_cls, raw_items)
+        for item_id, error in errors:
+            logging.warning(
+                f"Skipping invalid {model_cls.__name__} item {item_id}: {error}"
+            )
+        logging.info(
+            f"Successfully loaded {len(loaded)} {model_cls.__name__} instances"
+        )
+        return loaded
+
+    def _intern(
+        self, model_cls: type[TModel], loaded: list[TModel]
+    ) -> list[TModel]:
+        """Share equal strings of items not built by validation in-process.
+
+        Validation already returns one shared object for short repeated
+        strings, but values taken from raw items or unpickled from worker
+        processes are distinct. Compact models are skipped, as their
+        columns are dictionary-encoded when cached.
+        """
+        if not (self.compact or model_cls._compact):
+            InternTable().intern_models(loaded)
+        return loaded
+
+    def _build_in_processes(
         self, model_cls: type[TModel], raw_items: list[dict]
     ) -> list[TModel]:
+        """Validate chunks of raw items in worker processes.
+
+        Chunks are mapped in order, so the result keeps the order of
+        ``raw_items``. Invalid items are reported in a single warning.
+        """
+        size = self.process_chunk_size
+        chunks = [
+            raw_items[start : start + size]
+            for start in range(0, len(raw_items), size)
+        ]
+        workers = min(self.processes, len(chunks))
         loaded = []
-        for item_data in raw_items:
-            try:
-                instance = model_cls(**item_data)
-                for rel_field in model_cls.get_relation_fields().keys():
-                    value = getattr(instance, rel_field)
-                    instance.__dict__[rel_field] = value
-                loaded.append(instance)
-            except Exception as e:
-                logging.warning(
-                    f"Skipping invalid {model_cls.__name__} item {item_data.get('Id', 'Unknown')}: {e}"
-                )
+        errors = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_loaded, chunk_errors in pool.map(
+                _validate_items, repeat(model_cls), chunks
+            ):
+                loaded.extend(chunk_loaded)
+                errors.extend(chunk_errors)
+        if errors:
+            sample = "; ".join(
+                f"{item_id}: {error}"
+                for item_id, error in errors[:MAX_REPORTED_ERRORS]
+            )
+            logging.warning(
+                f"Skipping {len(errors)} invalid {model_cls.__name__} items, e.g. {sample}"
+            )
         logging.info(
             f"Successfully loaded {len(loaded)} {model_cls.__name__} instances"
+            f" in {workers} processes"
         )
         return loaded
 
-    def _ensure_lookups(self) -> None:
-        """Build lookup dictionaries for all registered models."""
-        for model_name, model_cls in self._models.items():
-            if model_name not in self._cache:
-                self._cache[model_name] = self.load_model_items(model_cls)
-            if model_name not in self._lookups:
-                self._lookups[model_name] = {
-                    getattr(obj, "name", obj.id): obj
-                    for obj in self._cache[model_name]
-                }
-
-    def _expand(self, items, model_cls):
-        self._ensure_lookups()
-        relations = model_cls.get_relation_fields()
+    def load_models(
+        self, model_classes: Iterable[type[TModel]] | None = None
+    ) -> None:
+        """Load several models into the cache, fetching their lists in parallel.
+
+        Lists are fetched on a thread pool limited by ``max_workers``, so the
+        cold-start latency is close to the slowest list rather than the sum
+        of all of them. With ``batch`` enabled, the lists are instead
+        requested in a single ``$batch`` round trip. Models that are already
+        cached are skipped.
+
+        Args:
+            model_classes: Models to load, or None to load all registered models.
+
+        Raises:
+            ModelLoadError: If loading any of the models fails.
+        """
+        if model_classes is None:
+            model_classes = self._models.values()
+        missing = [m for m in model_classes if m.__name__ not in self._cache]
+        if len(missing) > 1 and self.batch and not self.page_size:
+            self._prefetch(missing)
+            for model_cls in missing:
+                self._get_items(model_cls)
+        elif len(missing) > 1 and self.max_workers > 1:
+            workers = min(self.max_workers, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(self._get_items, missing))
+        else:
+            for model_cls in missing:
+                self._get_items(model_cls)
+
+    def _prefetch(self, model_classes: list[type[TModel]]) -> None:
+        """Fill the provider cache of several lists with one batch request.
+
+        If the batch request fails, the lists are left to be fetched one by
+        one, which reports errors per model.
+        """
+        lists = {
+            m.get_list_name(): (self._select_fields(m), m.get_expand_fields())
+            for m in model_classes
+        }
+        try:
+            self.provider.get_many_list_items(lists)
+        except Exception as e:
+            logging.warning(f"Batch request for {list(lists)} failed: {e}")
+
+    def related(
+        self,
+        obj: BaseModel,
+        model_cls: type[TModel],
+        expanded: bool = False,
+    ) -> list[TModel]:
+        """Retrieve models of a type that reference an item.
+
+        This is the reverse of relationship expansion, e.g. all servers
+        running an application. It is answered from the relation field
+        indexes of ``model_cls``, which are rebuilt on :meth:`refresh_cache`
+        and updated on :meth:`sync`.
+
+        Example:
+            spdb.related(app, Server)
+
+        Args:
+            obj: The referenced item.
+            model_cls: The :class:`spdb.model.TModel` model subclass referencing it.
+            expanded: If True, expand all related fields.
+
+        Returns:
+            List of Pydantic model instances referencing ``obj``.
+
+        Raises:
+            ValueError: If ``model_cls`` has no relation to the type of ``obj``.
+        """
+        self._check_model(model_cls)
+        target = type(obj).__name__
+        fields = [
+            field
+            for field, rel_name in model_cls.get_relation_fields().items()
+            if rel_name == target
+        ]
+        if not fields:
+            raise ValueError(
+                f"Model {model_cls.__name__} has no relation to {target}"
+            )
+        index = self._index(model_cls)
+        key = relation_key(obj)
+        found: dict[Any, TModel] = {}
+        for field in fields:
+            for item in index.find(field, key):
+                found.setdefault(item.id, item)
+        items = list(found.values())
+        if not expanded:
+            return items
+        return self._expand(items, model_cls)
+
+    def _related_models(
+        self, model_cls: type[TModel], depth: int = 1
+    ) -> list[type[BaseModel]]:
+        """Collect registered models reachable from ``model_cls``.
+
+        Walks the relation graph from :meth:`BaseModel.get_relation_fields`
+        breadth-first, up to ``depth`` hops. Relations pointing to models not
+        registered with this instance are ignored.
+        """
+        related: dict[str, type[BaseModel]] = {}
+        frontier = [model_cls]
+        for _ in range(depth):
+            next_frontier = []
+            for current in frontier:
+                for rel_name in current.get_relation_fields().values():
+                    rel_cls = self._models.get(rel_name)
+                    if rel_cls is not None and rel_name not in related:
+                        related[rel_name] = rel_cls
+                        next_frontier.append(rel_cls)
+            frontier = next_frontier
+        return list(related.values())
+
+    def _index(
+        self, model_cls: type[TModel]
+    ) -> ModelIndex[TModel] | CompactIndex[TModel]:
+        """Return the indexes of a model, building them on first use.
+
+        Besides the declared ``_indexes``, every relation field is indexed,
+        which provides the reverse (back-reference) lookups of :meth:`related`.
+        Indexes are dropped together with expired or evicted items, so they
+        are rebuilt from reloaded items. Compact lists get a
+        :class:`spdb.index.CompactIndex` of row positions.
+        """
+        if self._is_cached(model_cls):
+            index = self._lookups.get(model_cls.__name__)
+            if index is not None:
+                return index
+        with self._locks[model_cls.__name__]:
+            index = self._lookups.get(model_cls.__name__)
+            if index is None:
+                fields = dict.fromkeys(
+                    [*model_cls._indexes, *model_cls.get_relation_fields()]
+                )
+                items = self._get_items(model_cls)
+                if isinstance(items, CompactList):
+                    index = CompactIndex(items, fields=fields)
+                else:
+                    index = ModelIndex(items, fields=fields)
+                self._lookups[model_cls.__name__] = index
+        return index
+
+    def _mutable_index(self, model_name: str) -> ModelIndex | None:
+        """Get the index of a model if it can be updated in place.
+
+        Indexes of compact lists are rebuilt by :meth:`_store` instead.
+        """
+        index = self._lookups.get(model_name)
+        return index if isinstance(index, ModelIndex) else None
+
+    def _dependents(self, model_name: str) -> set[str]:
+        """Get names of registered models that reach a model through relations."""
+        dependents = {model_name}
+        frontier = [model_name]
+        while frontier:
+            target = frontier.pop()
+            for name, model_cls in self._models.items():
+                if name in dependents:
+                    continue
+                if target in model_cls.get_relation_fields().values():
+                    dependents.add(name)
+                    frontier.append(name)
+        return dependents
+
+    def _invalidate_expanded(self, model_name: str) -> None:
+        """Drop memoized expansions and lazy copies that reach a model."""
+        dependents = self._dependents(model_name)
+        for key in list(self._expanded):
+            if key[0] in dependents:
+                self._expanded.pop(key, None)
+        for name in dependents:
+            self._lazy_items.pop(name, None)
+
+    def _ensure_lookups(self, model_classes: list[type[BaseModel]]) -> None:
+        """Build indexes for the given models, loading them in parallel."""
+        self.load_models(model_classes)
+        for model_cls in model_classes:
+            self._index(model_cls)
+
+    def _expand(self, items, model_cls, depth: int = 1):
+        """Expand relations of items up to ``depth`` levels.
+
+        Related collections are expanded once per level in dependency order
+        and memoized, so related instances are shared across the graph
+        instead of being copied for every referencing item.
+        """
+        if depth <= 0:
+            return items
+        self._ensure_lookups(self._related_models(model_cls, depth))
+        key_maps: dict[tuple[str, int], dict[Any, BaseModel]] = {}
+        for cls, level in self._expansion_plan(model_cls, depth)[:-1]:
+            self._expanded_collection(cls, level, key_maps)
+        return self._expand_level(items, model_cls, depth, key_maps)
+
+    def _expansion_plan(
+        self, model_cls: type[TModel], depth: int
+    ) -> list[tuple[type[BaseModel], int]]:
+        """Order the (model, depth) expansions needed to expand a model.
+
+        Every entry comes after the entries it depends on; the requested
+        model itself is the last entry.
+        """
+        plan: list[tuple[type[BaseModel], int]] = []
+        seen: set[tuple[str, int]] = set()
+
+        def visit(cls: type[BaseModel], level: int) -> None:
+            if (cls.__name__, level) in seen:
+                return
+            seen.add((cls.__name__, level))
+            if level > 0:
+                for rel_cls in self._related_models(cls):
+                    visit(rel_cls, level - 1)
+            plan.append((cls, level))
+
+        visit(model_cls, depth)
+        return plan
+
+    def _expanded_collection(
+        self,
+        model_cls: type[TModel],
+        depth: int,
+        key_maps: dict[tuple[str, int], dict[Any, BaseModel]],
+    ) -> None:
+        """Expand all items of a model to ``depth`` and register their keys.
+
+        Compact models are not expanded up front: only the items referenced
+        during the expansion are built and expanded, once each.
+        """
+        name = model_cls.__name__
+        index = self._index(model_cls)
+        if isinstance(index, CompactIndex):
+            transform = None
+            if depth > 0:
+
+                def transform(obj):
+                    return self._expand_level(
+                        [obj], model_cls, depth, key_maps
+                    )[0]
+
+            key_maps[(name, depth)] = index.by_key.memoized(transform)
+            return
+        if depth == 0:
+            key_maps[(name, 0)] = index.by_key
+            return
+        items = self._expanded.get((name, depth))
+        if items is None:
+            items = self._expand_level(
+                self._get_items(model_cls), model_cls, depth, key_maps
+            )
+            self._expanded[(name, depth)] = items
+        key_maps[(name, depth)] = {relation_key(obj): obj for obj in items}
+
+    def _expand_level(self, items, model_cls, depth, key_maps):
+        """Replace relation values with related items expanded to ``depth - 1``."""
+        lookups = {
+            field_name: key_maps.get((rel_model_name, depth - 1), {})
+            for field_name, rel_model_name in model_cls.get_relation_fields().items()
+        }
         expanded_items = []
 
         for obj in items:
-            updates = self._expand_object_relations(obj, relations)
+            updates = self._expand_object_relations(obj, lookups)
             if updates:
                 obj = obj.model_copy(update=updates)
             expanded_items.append(obj)
 
         return expanded_items
 
-    def _expand_object_relations(self, obj, relations):
+    def _relation_depth(self, model_cls: type[TModel]) -> int:
+        """Get the length of the longest relation chain starting at a model.
+
+        The chain follows the schema unless the related models reference
+        themselves, directly or through other models, such as
+        ``Employee.manager``. Such chains are followed through the loaded
+        items instead, so they end where the data ends.
+
+        Raises:
+            RelationCycleError: If items reference each other in a cycle.
+        """
+        depths: dict[str, int] = {}
+
+        def visit(cls: type[BaseModel], path: list[str]) -> int | None:
+            name = cls.__name__
+            if name in path:
+                return None
+            if name not in depths:
+                related = [
+                    visit(r, [*path, name]) for r in self._related_models(cls)
+                ]
+                if None in related:
+                    return None
+                depths[name] = 1 + max(related, default=-1)
+            return depths[name]
+
+        depth = visit(model_cls, [])
+        if depth is None:
+            depth = self._item_depth(model_cls)
+        return depth
+
+    def _item_depth(self, model_cls: type[TModel]) -> int:
+        """Get the length of the longest reference chain between loaded items.
+
+        Raises:
+            RelationCycleError: If items reference each other in a cycle.
+        """
+        self._ensure_lookups(self._related_models(model_cls, len(self._models)))
+        depths: dict[tuple[str, Any], int] = {}
+        deepest = 0
+        for obj in self._get_items(model_cls):
+            root = (model_cls.__name__, obj.id)
+            # Depth-first without recursion, as chains can be long; a frame
+            # holds an item, its unvisited references and its depth so far.
+            frames = [[root, self._referenced(model_cls, obj), 0]]
+            on_path = {root}
+            while root not in depths:
+                frame = frames[-1]
+                ref = next(frame[1], None)
+                if ref is None:
+                    frames.pop()
+                    on_path.discard(frame[0])
+                    depths[frame[0]] = frame[2]
+                    if frames:
+                        frames[-1][2] = max(frames[-1][2], frame[2] + 1)
+                    continue
+                rel_cls, target = ref
+                node = (rel_cls.__name__, target.id)
+                if node in depths:
+                    frame[2] = max(frame[2], depths[node] + 1)
+                    continue
+                if node in on_path:
+                    path = [f[0] for f in frames]
+                    cycle = " -> ".join(
+                        f"{name} {item_id}"
+                        for name, item_id in [*path[path.index(node) :], node]
+                    )
+                    raise RelationCycleError(
+                        f"Relation cycle detected: {cycle}"
+                    )
+                frames.append([node, self._referenced(rel_cls, target), 0])
+                on_path.add(node)
+            deepest = max(deepest, depths[root])
+        return deepest
+
+    def _referenced(
+        self, model_cls: type[TModel], obj: TModel
+    ) -> Iterator[tuple[type[BaseModel], BaseModel]]:
+        """Yield the registered items that ``obj`` references."""
+        relations = model_cls.get_relation_fields()
+        for field_name, rel_model_name in relations.items():
+            rel_cls = self._models.get(rel_model_name)
+            raw_val = getattr(obj, field_name)
+            if rel_cls is None or raw_val is None:
+                continue
+            by_key = self._index(rel_cls).by_key
+            for value in raw_val if isinstance(raw_val, list) else [raw_val]:
+                target = (
+                    by_key.get(value) if isinstance(value, Hashable) else None
+                )
+                if target is not None:
+                    yield rel_cls, target
+
+    def _lazy(self, items: list[TModel]) -> list[TModel]:
+        """Wrap items so relations are resolved through lookups on access."""
+        return [obj.lazy_copy(self._resolve_relation) for obj in items]
+
+    def _resolve_relation(self, rel_model_name: str, raw_val: Any) -> Any:
+        """Resolve a raw relation value to lazy related instances.
+
+        Unknown references are returned unchanged, like in :meth:`_expand`.
+        """
+        rel_cls = self._models.get(rel_model_name)
+        if rel_cls is None:
+            return raw_val
+        expanded = self._expand_field(raw_val, self._index(rel_cls).by_key)
+        if expanded is None:
+            return raw_val
+        if isinstance(expanded, list):
+            return self._lazy(expanded)
+        return expanded.lazy_copy(self._resolve_relation)
+
+    def _expand_object_relations(self, obj, lookups):
         """Expand all relation fields for a single object."""
         updates = {}
-        for field_name, rel_model_name in relations.items():
+        for field_name, lookup in lookups.items():
             raw_val = getattr(obj, field_name)
-            lookup = self._lookups.get(rel_model_name, {})
             expanded = self._expand_field(raw_val, lookup)
             if expanded is not None:
                 updates[field_name] = expanded
@@ -181,6 +1139,224 @@ class SPDB:
             return lookup[raw_val]
         return None
 
+    def save_many(
+        self, model_cls: type[TModel], items: Iterable[TModel]
+    ) -> list[TModel]:
+        """Create or update items in SharePoint with batched requests.
+
+        Items whose ``id`` is None or 0 are created, all other items are
+        updated. Fields are written by alias; relations, expanded or not,
+        are written as lookup IDs of the related items. Cached items and
+        indexes of the model are updated in place instead of being reloaded.
+
+        Example:
+            server.location = "DC2"
+            spdb.save_many(Server, [server])
+
+        Args:
+            model_cls: The :class:`spdb.model.TModel` model subclass to save.
+            items: Items to save.
+
+        Returns:
+            The saved items as cached, with IDs assigned to created items.
+
+        Raises:
+            ValueError: If a lookup value does not match a related item.
+            ModelWriteError: If writing to SharePoint fails.
+        """
+        self._check_model(model_cls)
+        items = list(items)
+        new = [obj for obj in items if not obj.id]
+        updates = {
+            obj.id: (obj, obj.to_sharepoint(self._lookup_id))
+            for obj in items
+            if obj.id
+        }
+        return self._write(model_cls, new, updates)
+
+    def delete_many(
+        self, model_cls: type[TModel], items: Iterable[TModel | int]
+    ) -> None:
+        """Delete items from SharePoint with batched requests.
+
+        Deleted items are removed from the cache and indexes in place.
+
+        Args:
+            model_cls: The :class:`spdb.model.TModel` model subclass to delete.
+            items: Items or IDs of items to delete.
+
+        Raises:
+            ModelWriteError: If deleting in SharePoint fails.
+        """
+        self._check_model(model_cls)
+        ids = [obj.id if isinstance(obj, BaseModel) else obj for obj in items]
+        self._write(model_cls, deleted=ids)
+
+    def get_etag(self, model_cls: type[TModel], item_id: Any) -> str | None:
+        """Get the ETag an item was loaded with, if the provider returned one.
+
+        ETags of updated items are forgotten, as SharePoint does not return
+        the new ETag of a ``MERGE``.
+        """
+        return self._etags.get(model_cls.__name__, {}).get(item_id)
+
+    def _write(
+        self,
+        model_cls: type[TModel],
+        new: Sequence[TModel] = (),
+        updates: Mapping[Any, tuple[TModel, dict[str, Any]]] | None = None,
+        deleted: Sequence[Any] = (),
+        etags: Mapping[Any, str] | None = None,
+    ) -> list[TModel]:
+        """Send creates, updates and deletes of a model in shared batches.
+
+        Payloads of ``new`` items are built here, so lookups to items
+        created by an earlier write already resolve to their IDs.
+
+        Returns:
+            Cached copies of updated and created items.
+
+        Raises:
+            ModelWriteError: If writing fails. Changes committed before the
+                failure are merged into the cache and reported on the error.
+        """
+        updates = updates or {}
+        created_payloads = [obj.to_sharepoint(self._lookup_id) for obj in new]
+        try:
+            created = self.provider.write_list_items(
+                model_cls.get_list_name(),
+                create=created_payloads,
+                update={
+                    item_id: payload
+                    for item_id, (_, payload) in updates.items()
+                },
+                delete=deleted,
+                etags=etags,
+            )
+        except PartialWriteError as e:
+            updated, saved_new = self._apply_written(
+                model_cls,
+                new[: len(e.created)],
+                {i: updates[i] for i in e.updated},
+                e.created,
+                e.deleted,
+            )
+            raise self._write_error(
+                model_cls,
+                e.__cause__ or e,
+                updated=updated,
+                created=saved_new,
+                deleted=e.deleted,
+            ) from e
+        except Exception as e:
+            raise self._write_error(model_cls, e) from e
+        updated, saved_new = self._apply_written(
+            model_cls, new, updates, created, deleted
+        )
+        return [*updated, *saved_new]
+
+    def _apply_written(
+        self,
+        model_cls: type[TModel],
+        new: Sequence[TModel],
+        updates: Mapping[Any, tuple[TModel, dict[str, Any]]],
+        created: list[dict[str, Any]],
+        deleted: Sequence[Any],
+    ) -> tuple[list[TModel], list[TModel]]:
+        """Merge written items into the cache, returning their cached copies.
+
+        Returns:
+            Cached copies of the updated and of the created items.
+        """
+        updated = [
+            self._cached_copy(model_cls, obj) for obj, _ in updates.values()
+        ]
+        saved_new = [
+            self._cached_copy(model_cls, obj, id=props["Id"])
+            for obj, props in zip(new, created, strict=True)
+        ]
+        etags_cache = self._etags.setdefault(model_cls.__name__, {})
+        for item_id in [*updates, *deleted]:
+            etags_cache.pop(item_id, None)
+        for props in created:
+            if props.get(ETAG_COLUMN) is not None:
+                etags_cache[props["Id"]] = props[ETAG_COLUMN]
+        self._merge_cached(
+            model_cls, [*updated, *saved_new], deleted=set(deleted)
+        )
+        return updated, saved_new
+
+    def _lookup_id(self, rel_model_name: str | None, value: Any) -> Any:
+        """Get the ID of a related item given the item or its relation key."""
+        if isinstance(value, BaseModel):
+            return value.id
+        rel_cls = self._models.get(rel_model_name) if rel_model_name else None
+        if rel_cls is None:
+            raise ValueError(
+                f"Cannot resolve lookup value {value!r} without a registered model"
+            )
+        obj = self._index(rel_cls).by_key.get(value)
+        if obj is None:
+            raise ValueError(f"Unknown {rel_model_name} {value!r}")
+        return obj.id
+
+    def _cached_copy(
+        self, model_cls: type[TModel], obj: TModel, **changes: Any
+    ) -> TModel:
+        """Copy an item into its cached form, with unexpanded relations."""
+        values = dict(obj.__dict__)
+        for field in model_cls.get_relation_fields():
+            value = values.get(field)
+            if isinstance(value, list):
+                values[field] = [
+                    relation_key(v) if isinstance(v, BaseModel) else v
+                    for v in value
+                ]
+            elif isinstance(value, BaseModel):
+                values[field] = relation_key(value)
+        values.update(changes)
+        return model_cls.model_construct(
+            _fields_set=set(obj.model_fields_set), **values
+        )
+
+    def _merge_cached(
+        self,
+        model_cls: type[TModel],
+        saved: list[TModel],
+        deleted: Collection[Any] = (),
+    ) -> None:
+        """Apply written items to the cache and indexes of a model."""
+        name = model_cls.__name__
+        with self._locks[name]:
+            cached = self._cache.get(name)
+            if isinstance(cached, CompactList):
+                self._store(model_cls, cached.merge(saved, deleted))
+            elif cached is not None:
+                index = self._mutable_index(name)
+                updates = {obj.id: obj for obj in saved}
+                merged = []
+                for obj in cached:
+                    if obj.id in deleted:
+                        if index is not None:
+                            index.remove(obj)
+                        continue
+                    merged.append(updates.pop(obj.id, obj))
+                merged.extend(updates.values())
+                if index is not None:
+                    for obj in saved:
+                        index.add(obj)
+                self._store(model_cls, merged)
+            self._invalidate_expanded(name)
+
+    def _write_error(
+        self, model_cls: type[TModel], error: BaseException, **written: Any
+    ) -> ModelWriteError:
+        message = f"Failed to write data for {model_cls.__name__}: {error}"
+        logging.error(message)
+        if isinstance(error, ETagMismatchError) or status_code(error) == 412:
+            return WriteConflictError(message, **written)
+        return ModelWriteError(message, **written)
+
     def refresh_cache(self, model_cls: type[BaseModel] | None = None) -> None:
         """Refresh cached data for specified model or all models.
 
@@ -189,10 +1365,108 @@ class SPDB:
         """
         if model_cls:
             model_name = model_cls.__name__
-            if model_name in self._cache:
-                del self._cache[model_name]
-            if model_name in self._lookups:
-                del self._lookups[model_name]
+            with self._locks[model_name]:
+                self._cache.pop(model_name, None)
+                self._lookups.pop(model_name, None)
+                self._sync_marks.pop(model_name, None)
+                self._etags.pop(model_name, None)
+                self._invalidate_expanded(model_name)
         else:
             self._cache.clear()
             self._lookups.clear()
+            self._expanded.clear()
+            self._lazy_items.clear()
+            self._sync_marks.clear()
+            self._etags.clear()
+
+    def sync(self, model_cls: type[BaseModel] | None = None) -> None:
+        """Incrementally refresh cached data for specified model or all models.
+
+        Only items modified since the last load or sync are downloaded and
+        merged into the cache; items deleted in SharePoint are dropped.
+        Indexes of the model are updated in place, and only changed rows of
+        compact lists are encoded. If nothing changed, the cache, indexes
+        and memoized expansions are kept. Models whose items carry
+        no ``Modified`` column cannot be synced incrementally and are fully
+        reloaded on next access instead. Each model is synced while holding
+        its lock, so concurrent loads and :meth:`find` calls do not
+        interleave with the merge.
+
+        Args:
+            model_cls: Specific model to sync, or None to sync all cached models.
+
+        Raises:
+            ModelLoadError: If retrieving the changes fails.
+        """
+        if model_cls:
+            model_classes = [model_cls]
+        else:
+            model_classes = [self._models[name] for name in list(self._cache)]
+        for cls in model_classes:
+            with self._locks[cls.__name__]:
+                self._sync_model(cls)
+
+    def _sync_model(self, cls: type[BaseModel]) -> None:
+        """Merge changes of one cached model, see :meth:`sync`."""
+        name = cls.__name__
+        cached = self._cache.get(name)
+        if cached is None:
+            return
+        mark = self._sync_marks.get(name)
+        if mark is None:
+            self.provider.clear_cache(cls.get_list_name())
+            self.refresh_cache(cls)
+            return
+        try:
+            changed, live_ids = self.provider.fetch_changes(
+                cls.get_list_name(),
+                mark,
+                select=self._select_fields(cls),
+                expand=cls.get_expand_fields(),
+            )
+        except Exception as e:
+            raise self._load_error(cls, e) from e
+        updates = {
+            obj.id: obj
+            for obj in self.build_model_items(
+                cls, self._track_items(cls, changed)
+            )
+            if obj.id in live_ids
+        }
+        # The Modified filter is inclusive, so items modified at the mark
+        # come back on every sync; only those differing from the cache count
+        if isinstance(cached, CompactList):
+            cached_ids = cached.column_values("id")
+            current = cached.get_by_ids(updates)
+        else:
+            cached_ids = [obj.id for obj in cached]
+            current = {obj.id: obj for obj in cached if obj.id in updates}
+        updates = {
+            item_id: obj
+            for item_id, obj in updates.items()
+            if current.get(item_id) != obj
+        }
+        removed = {item_id for item_id in cached_ids if item_id not in live_ids}
+        if not updates and not removed:
+            logging.debug(f"No changes of {name} items since the last sync")
+            return
+        if isinstance(cached, CompactList):
+            self._store(cls, cached.merge(updates.values(), removed))
+        else:
+            index = self._mutable_index(name)
+            if index is not None:
+                for obj in updates.values():
+                    index.add(obj)
+            merged = []
+            for obj in cached:
+                if obj.id not in removed:
+                    merged.append(updates.pop(obj.id, obj))
+                elif index is not None:
+                    index.remove(obj)
+            merged.extend(updates.values())
+            self._store(cls, merged)
+        self._invalidate_expanded(name)
+        logging.info(
+            f"Synced {len(changed)} changed and {len(removed)} deleted"
+            f" {name} items"
+        )
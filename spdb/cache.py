@@ -0,0 +1,276 @@
+import itertools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel as PydanticBaseModel
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+SIZE_SAMPLE = 64
+"""Number of items sampled when estimating the size of large collections."""
+
+_ticks = itertools.count()
+"""Source of increasing timestamps ordering uses of entries across caches."""
+
+
+def _object_size(obj: Any, depth: int = 2) -> int:
+    """Estimate the size of an object and its direct contents in bytes."""
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+    if isinstance(obj, PydanticBaseModel):
+        obj = obj.__dict__
+        size += sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            _object_size(k, depth - 1) + _object_size(v, depth - 1)
+            for k, v in obj.items()
+        )
+    elif isinstance(obj, list | tuple | set):
+        size += sum(_object_size(v, depth - 1) for v in obj)
+    return size
+
+
+def approximate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value in bytes.
+
+    Lists are measured by sampling up to :data:`SIZE_SAMPLE` items, so the
+    estimate stays cheap for lists of hundreds of thousands of rows.
+    """
+    if isinstance(value, list) and value:
+        step = max(1, len(value) // SIZE_SAMPLE)
+        sample = value[::step]
+        per_item = sum(_object_size(item) for item in sample) / len(sample)
+        return sys.getsizeof(value) + int(per_item * len(value))
+    return _object_size(value)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a cache is used."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    size: int
+    expires_at: float | None
+    used: int = 0
+
+
+class CacheBudget:
+    """Memory limit shared by several caches.
+
+    When the caches together exceed ``max_bytes``, the least recently used
+    entries across all of them are evicted, calling the ``on_evict`` of
+    the cache each entry belongs to. The caches share one lock.
+
+    Example:
+        budget = CacheBudget(max_bytes=256 * 1024**2)
+        models = Cache(budget=budget)
+        indexes = Cache(budget=budget)
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Args:
+            max_bytes: Upper bound of the approximate size of all entries.
+        """
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.caches: list[Cache] = []
+
+    @property
+    def size(self) -> int:
+        """Approximate size of the entries of all caches in bytes."""
+        return sum(cache.size for cache in self.caches)
+
+    def _evict_over_limit(self) -> list[tuple["Cache", Any, Any]]:
+        evicted = []
+        while self.size > self.max_bytes:
+            oldest = [
+                (next(iter(cache._entries.values())).used, cache)
+                for cache in self.caches
+                if cache._entries
+            ]
+            if not oldest:
+                break
+            _, cache = min(oldest, key=lambda candidate: candidate[0])
+            key, entry = cache._entries.popitem(last=False)
+            cache._size -= entry.size
+            cache.stats.evictions += 1
+            evicted.append((cache, key, entry.value))
+        return evicted
+
+
+class Cache(MutableMapping[K, V]):
+    """Thread-safe mapping with per-entry TTL and size-bounded LRU eviction.
+
+    Entries expire ``ttl`` seconds after being stored. When ``max_bytes`` or
+    ``max_entries`` is exceeded, the least recently used entries are evicted.
+    Caches sharing a :class:`CacheBudget` are also evicted together.
+    ``on_evict`` is called for every entry removed by expiry or eviction, so
+    dependent caches can be kept consistent; explicit deletes do not call it.
+
+    Example:
+        cache = Cache(max_bytes=256 * 1024**2, ttl=600)
+        cache.set("Server", servers, ttl=60)
+        cache.stats.hits
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        sizeof: Callable[[V], int] = approximate_size,
+        on_evict: Callable[[K, V], None] | None = None,
+        budget: CacheBudget | None = None,
+    ):
+        """
+        Args:
+            ttl: Default time to live of entries in seconds, None for no expiry.
+            max_bytes: Upper bound of the approximate size of all entries.
+            max_entries: Upper bound of the number of entries.
+            sizeof: Function estimating the size of a value in bytes.
+            on_evict: Callback invoked with key and value of removed entries.
+            budget: Memory limit shared with other caches.
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.stats = CacheStats()
+        self._entries: OrderedDict[K, _Entry[V]] = OrderedDict()
+        self._size = 0
+        self.budget = budget
+        if budget is None:
+            self._lock = threading.RLock()
+        else:
+            self._lock = budget.lock
+            budget.caches.append(self)
+
+    @property
+    def size(self) -> int:
+        """Approximate size of all entries in bytes."""
+        return self._size
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, overriding the default TTL if ``ttl`` is given."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        measured = self.max_bytes is not None or self.budget is not None
+        size = self.sizeof(value) if measured else 0
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _Entry(value, size, expires_at, next(_ticks))
+            self._size += size
+            evicted = self._purge_expired() + self._evict_over_limit()
+            shared = self.budget._evict_over_limit() if self.budget else []
+        self._notify(evicted)
+        for cache, shared_key, shared_value in shared:
+            cache._notify([(shared_key, shared_value)])
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.set(key, value)
+
+    def __getitem__(self, key: K) -> V:
+        expired = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                expired.append((key, self._discard(key).value))
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                entry.used = next(_ticks)
+                self._entries.move_to_end(key)
+        self._notify(expired)
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __contains__(self, key: object) -> bool:
+        expired = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                expired.append((key, self._discard(key).value))
+                self.stats.expirations += 1
+                entry = None
+        self._notify(expired)
+        return entry is not None
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            if self._discard(key) is None:
+                raise KeyError(key)
+
+    def __iter__(self) -> Iterator[K]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _is_expired(self, entry: _Entry[V]) -> bool:
+        return (
+            entry.expires_at is not None
+            and entry.expires_at <= time.monotonic()
+        )
+
+    def _discard(self, key: K) -> _Entry[V] | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+        return entry
+
+    def _purge_expired(self) -> list[tuple[K, V]]:
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if self._is_expired(entry)
+        ]
+        self.stats.expirations += len(expired)
+        return [(key, self._discard(key).value) for key in expired]
+
+    def _evict_over_limit(self) -> list[tuple[K, V]]:
+        evicted = []
+        while self._entries and (
+            (self.max_bytes is not None and self._size > self.max_bytes)
+            or (
+                self.max_entries is not None
+                and len(self._entries) > self.max_entries
+            )
+        ):
+            key, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.stats.evictions += 1
+            evicted.append((key, entry.value))
+        return evicted
+
+    def _notify(self, removed: list[tuple[K, V]]) -> None:
+        if self.on_evict is None:
+            return
+        for key, value in removed:
+            self.on_evict(key, value)
@@ -0,0 +1,212 @@
+from collections.abc import Callable, Iterable
+from datetime import date, datetime
+from types import NoneType, UnionType
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from spdb.model import BaseModel, lookup
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+if TYPE_CHECKING:
+    import pyarrow
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet export,"
+            " install it with 'pip install spdb[arrow]'"
+        )
+
+
+def column_type(annotation: Any) -> Any:
+    """Get the scalar type stored in a column of a field.
+
+    Optional values are unwrapped and relations are reduced to the raw
+    lookup value, so ``Application | str`` becomes ``str``. Lists are
+    returned as ``list[<type>]``. Returns None if the type is ambiguous.
+
+    Args:
+        annotation: Annotation of a model field.
+
+    Returns:
+        The Python type of the column values or None.
+    """
+    origin = get_origin(annotation)
+    if origin is list:
+        args = get_args(annotation)
+        item = column_type(args[0]) if args else None
+        return None if item is None else list[item]
+    if origin in (Union, UnionType):
+        types = {
+            column_type(arg)
+            for arg in get_args(annotation)
+            if arg is not NoneType
+            and not (
+                isinstance(arg, type) and issubclass(arg, PydanticBaseModel)
+            )
+            and not _is_model_list(arg)
+        }
+        return types.pop() if len(types) == 1 else None
+    if isinstance(annotation, type):
+        return annotation
+    return None
+
+
+def _is_model_list(annotation: Any) -> bool:
+    args = get_args(annotation)
+    return (
+        get_origin(annotation) is list
+        and bool(args)
+        and isinstance(args[0], type)
+        and issubclass(args[0], PydanticBaseModel)
+    )
+
+
+def _parse_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _parse_date(value: Any) -> Any:
+    if isinstance(value, str):
+        return _parse_datetime(value).date()
+    return value
+
+
+_PARSERS: dict[Any, Callable[[Any], Any]] = {
+    datetime: _parse_datetime,
+    date: _parse_date,
+}
+"""Converters of raw JSON values to the Python type of a column."""
+
+
+def _column_reader(
+    model_cls: type[BaseModel], field_name: str
+) -> Callable[[dict[str, Any]], Any]:
+    """Build a function reading a field's value from a raw item."""
+    info = model_cls.model_fields[field_name]
+    column = info.alias or field_name
+    is_lookup = field_name in model_cls.get_lookup_fields()
+    parse = _PARSERS.get(column_type(info.annotation))
+
+    def read(item: dict[str, Any]) -> Any:
+        if column in item:
+            value = item[column]
+        elif field_name in item:
+            value = item[field_name]
+        elif info.is_required():
+            return None
+        else:
+            return info.get_default(call_default_factory=True)
+        if is_lookup:
+            return lookup(value)
+        if parse is not None and value is not None:
+            return parse(value)
+        return value
+
+    return read
+
+
+def to_columns(
+    model_cls: type[BaseModel], raw_items: Iterable[dict[str, Any]]
+) -> dict[str, list[Any]]:
+    """Convert raw SharePoint items to one list of values per model field.
+
+    Values are read by column alias without building model instances, so
+    they are not validated. Lookup values are flattened with
+    :func:`spdb.model.lookup` and missing columns get the field default.
+
+    Args:
+        model_cls: Model describing the columns of the items.
+        raw_items: Raw items as returned by the provider.
+
+    Returns:
+        Mapping of field names to column values in item order.
+    """
+    readers = {
+        name: _column_reader(model_cls, name) for name in model_cls.model_fields
+    }
+    columns: dict[str, list[Any]] = {name: [] for name in readers}
+    for item in raw_items:
+        for name, read in readers.items():
+            columns[name].append(read(item))
+    return columns
+
+
+def arrow_type(annotation: Any) -> "pyarrow.DataType | None":
+    """Get the Arrow type of a field annotation, None if it is not known."""
+    _require_pyarrow()
+    python_type = column_type(annotation)
+    if get_origin(python_type) is list:
+        item = arrow_type(get_args(python_type)[0])
+        return None if item is None else pa.list_(item)
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        datetime: pa.timestamp("us", tz="UTC"),
+        date: pa.date32(),
+    }.get(python_type)
+
+
+def to_record_batch(
+    model_cls: type[BaseModel], raw_items: Iterable[dict[str, Any]]
+) -> "pyarrow.RecordBatch":
+    """Convert raw SharePoint items to an Arrow record batch.
+
+    Columns of fields with a known type (see :func:`arrow_type`) are
+    typed, the types of other columns are inferred from their values.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    columns = to_columns(model_cls, raw_items)
+    arrays = [
+        pa.array(
+            values, type=arrow_type(model_cls.model_fields[name].annotation)
+        )
+        for name, values in columns.items()
+    ]
+    return pa.RecordBatch.from_arrays(arrays, names=list(columns))
+
+
+def to_table(
+    model_cls: type[BaseModel], pages: Iterable[Iterable[dict[str, Any]]]
+) -> "pyarrow.Table":
+    """Convert pages of raw SharePoint items to an Arrow table.
+
+    Each page becomes one record batch, so only one page of raw items has
+    to be held in memory at a time.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    tables = [
+        pa.Table.from_batches([to_record_batch(model_cls, page)])
+        for page in pages
+    ]
+    if not tables:
+        return pa.Table.from_batches([to_record_batch(model_cls, [])])
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def write_parquet(table: "pyarrow.Table", path: str, **kwargs: Any) -> None:
+    """Write an Arrow table to a Parquet file.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_table(table, path, **kwargs)
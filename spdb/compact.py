@@ -0,0 +1,348 @@
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Collection, Hashable, Iterable, Iterator, Sequence
+from typing import Any, Generic, overload
+
+from spdb.model import TModel
+
+INT64_RANGE = range(-(2**63), 2**63)
+"""Values storable in a signed 64-bit ``array`` column."""
+
+
+def _code_typecode(size: int) -> str:
+    """Get the smallest unsigned ``array`` typecode holding ``size`` codes."""
+    for typecode in ("B", "H", "I"):
+        if size <= 2 ** (8 * array(typecode).itemsize):
+            return typecode
+    return "Q"
+
+
+def _dictionary_key(value: Any) -> Hashable:
+    """Get the key deduplicating a value, raising TypeError if unhashable.
+
+    Values are keyed with their type, so that ``1``, ``1.0`` and ``True``
+    are not merged into one dictionary entry.
+    """
+    if isinstance(value, list):
+        return list, tuple(_dictionary_key(v) for v in value)
+    hash(value)
+    return type(value), value
+
+
+class _ListValue(tuple):
+    """Dictionary entry of a list value, copied to a new list on access."""
+
+    __slots__ = ()
+
+
+class _Column:
+    """Column stored in a typed ``array``."""
+
+    def __init__(self, values: array):
+        self.values = values
+
+    def __getitem__(self, row: int) -> Any:
+        return self.values[row]
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self.values)
+
+
+class _BoolColumn(_Column):
+    def __getitem__(self, row: int) -> Any:
+        return bool(self.values[row])
+
+
+class _DictionaryColumn(_Column):
+    """Column of codes into a table of distinct values.
+
+    Lists are stored as tuples and copied to new lists on access, so items
+    built from the column cannot change the shared value.
+    """
+
+    def __init__(self, codes: array, values: list[Any]):
+        super().__init__(codes)
+        self.dictionary = values
+
+    def __getitem__(self, row: int) -> Any:
+        value = self.dictionary[self.values[row]]
+        return list(value) if isinstance(value, _ListValue) else value
+
+    def __sizeof__(self) -> int:
+        return (
+            super().__sizeof__()
+            + sys.getsizeof(self.dictionary)
+            + sum(sys.getsizeof(v) for v in self.dictionary)
+        )
+
+
+class _ObjectColumn(_Column):
+    """Column of values that cannot be encoded, kept as a plain list."""
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.values)
+            + sum(sys.getsizeof(v) for v in self.values)
+        )
+
+
+def _table_key(value: Any) -> Hashable:
+    """Get the dictionary key of a stored dictionary entry."""
+    return _dictionary_key(
+        list(value) if isinstance(value, _ListValue) else value
+    )
+
+
+def _merge_column(
+    column: _Column, rows: list[int], new_values: list[Any]
+) -> _Column:
+    """Build a column from rows of ``column`` and new values.
+
+    ``rows`` gives the source row of every output row, or -1 to take the
+    next value of ``new_values``. Only the new values are encoded; if one
+    does not fit the column's representation, the column is re-encoded.
+    """
+    new = iter(new_values)
+    if type(column) is _DictionaryColumn:
+        dictionary = list(column.dictionary)
+        table = {_table_key(v): code for code, v in enumerate(dictionary)}
+        codes = []
+        try:
+            for row in rows:
+                if row >= 0:
+                    codes.append(column.values[row])
+                    continue
+                value = next(new)
+                key = _dictionary_key(value)
+                code = table.get(key)
+                if code is None:
+                    code = table[key] = len(dictionary)
+                    dictionary.append(
+                        _ListValue(value) if isinstance(value, list) else value
+                    )
+                codes.append(code)
+        except TypeError:
+            pass
+        else:
+            return _DictionaryColumn(
+                array(_code_typecode(len(dictionary)), codes), dictionary
+            )
+    elif type(column) is _ObjectColumn:
+        return _ObjectColumn(
+            [column.values[row] if row >= 0 else next(new) for row in rows]
+        )
+    else:
+        fits = {
+            "b": lambda v: type(v) is bool,
+            "q": lambda v: type(v) is int and v in INT64_RANGE,
+            "d": lambda v: type(v) is float,
+        }[column.values.typecode]
+        if all(fits(v) for v in new_values):
+            values = array(
+                column.values.typecode,
+                [column.values[row] if row >= 0 else next(new) for row in rows],
+            )
+            return type(column)(values)
+    new = iter(new_values)
+    return _encode([column[row] if row >= 0 else next(new) for row in rows])
+
+
+def _encode(values: list[Any]) -> _Column:
+    """Store column values in the most compact representation."""
+    if values and all(type(v) is bool for v in values):
+        return _BoolColumn(array("b", values))
+    if values and all(type(v) is int and v in INT64_RANGE for v in values):
+        return _Column(array("q", values))
+    if values and all(type(v) is float for v in values):
+        return _Column(array("d", values))
+    table: dict[Hashable, int] = {}
+    dictionary: list[Any] = []
+    codes = []
+    try:
+        for value in values:
+            key = _dictionary_key(value)
+            code = table.get(key)
+            if code is None:
+                code = table[key] = len(dictionary)
+                dictionary.append(
+                    _ListValue(value) if isinstance(value, list) else value
+                )
+            codes.append(code)
+    except TypeError:
+        return _ObjectColumn(values)
+    return _DictionaryColumn(
+        array(_code_typecode(len(dictionary)), codes), dictionary
+    )
+
+
+class CompactList(Sequence[TModel], Generic[TModel]):
+    """Read-only sequence of models stored as column arrays.
+
+    Every field is kept in one column: booleans, integers and floats in
+    typed arrays, all other values dictionary-encoded, so repeated strings
+    and lists are stored once per column. Items are built with
+    ``model_construct`` on access, so every access returns a new instance
+    and changes to it are not stored.
+
+    Example:
+        servers = CompactList(Server, spdb.get_model_items(Server))
+        servers[0].hostname
+    """
+
+    def __init__(self, model_cls: type[TModel], items: Iterable[TModel]):
+        """
+        Args:
+            model_cls: Model class of the items.
+            items: Validated model instances to store.
+        """
+        self.model_cls = model_cls
+        fields = list(model_cls.model_fields)
+        values: dict[str, list[Any]] = {field: [] for field in fields}
+        fields_sets = []
+        length = 0
+        for obj in items:
+            for field in fields:
+                values[field].append(obj.__dict__.get(field))
+            fields_sets.append(frozenset(obj.model_fields_set))
+            length += 1
+        self._set_columns(
+            length,
+            {field: _encode(column) for field, column in values.items()},
+            _encode(fields_sets),
+        )
+
+    def _set_columns(
+        self, length: int, columns: dict[str, _Column], fields_sets: _Column
+    ) -> None:
+        self._length = length
+        self._columns = columns
+        self._fields_sets = fields_sets
+        self._positions: dict[Any, int] | None = None
+        self._sorted_ids: array | None = None
+        ids = self._columns.get("id")
+        if type(ids) is _Column and all(
+            ids.values[i] < ids.values[i + 1] for i in range(length - 1)
+        ):
+            self._sorted_ids = ids.values
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> TModel: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TModel]: ...
+
+    def __getitem__(self, index: int | slice) -> TModel | list[TModel]:
+        if isinstance(index, slice):
+            return [
+                self._build(row) for row in range(*index.indices(len(self)))
+            ]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CompactList index out of range")
+        return self._build(index)
+
+    def __iter__(self) -> Iterator[TModel]:
+        for row in range(self._length):
+            yield self._build(row)
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + sum(sys.getsizeof(c) for c in self._columns.values())
+            + sys.getsizeof(self._fields_sets)
+        )
+
+    def merge(
+        self, items: Iterable[TModel], deleted: Collection[Any] = ()
+    ) -> "CompactList[TModel]":
+        """Get a copy with items replaced by ``id`` and ``deleted`` removed.
+
+        Items with an unknown ``id`` are appended. Only the given items are
+        encoded, the other rows are copied from the column arrays.
+
+        Args:
+            items: Validated model instances to store.
+            deleted: IDs of items to remove.
+        """
+        fields = list(self.model_cls.model_fields)
+        updates = {obj.id: obj for obj in items}
+        rows = []
+        new_items = []
+        for row, item_id in enumerate(self.column_values("id")):
+            if item_id in deleted:
+                continue
+            obj = updates.pop(item_id, None)
+            if obj is None:
+                rows.append(row)
+            else:
+                rows.append(-1)
+                new_items.append(obj)
+        for obj in updates.values():
+            rows.append(-1)
+            new_items.append(obj)
+        merged = CompactList.__new__(CompactList)
+        merged.model_cls = self.model_cls
+        merged._set_columns(
+            len(rows),
+            {
+                field: _merge_column(
+                    self._columns[field],
+                    rows,
+                    [obj.__dict__.get(field) for obj in new_items],
+                )
+                for field in fields
+            },
+            _merge_column(
+                self._fields_sets,
+                rows,
+                [frozenset(obj.model_fields_set) for obj in new_items],
+            ),
+        )
+        return merged
+
+    def column_values(self, field: str) -> list[Any]:
+        """Get the values of a field in row order without building items.
+
+        List values are returned as tuples shared between rows.
+        """
+        column = self._columns[field]
+        if type(column) is _DictionaryColumn:
+            return [column.dictionary[code] for code in column.values]
+        return [column[row] for row in range(self._length)]
+
+    def get_by_ids(self, ids: Iterable[Any]) -> dict[Any, TModel]:
+        """Build the items with the given IDs, skipping unknown IDs."""
+        found = {}
+        for item_id in ids:
+            row = self._position(item_id)
+            if row is not None:
+                found[item_id] = self._build(row)
+        return found
+
+    def _position(self, item_id: Any) -> int | None:
+        """Find the row of an ID, by binary search if IDs are sorted."""
+        if self._sorted_ids is not None:
+            if type(item_id) is not int:
+                return None
+            row = bisect_left(self._sorted_ids, item_id)
+            if row < len(self._sorted_ids) and self._sorted_ids[row] == item_id:
+                return row
+            return None
+        column = self._columns.get("id")
+        if column is None:
+            return None
+        if self._positions is None:
+            self._positions = {column[row]: row for row in range(len(self))}
+        return self._positions.get(item_id)
+
+    def _build(self, row: int) -> TModel:
+        return self.model_cls.model_construct(
+            _fields_set=set(self._fields_sets[row]),
+            **{field: column[row] for field, column in self._columns.items()},
+        )
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class SPDBError(Exception):
     """Base exception for SPDB operations."""
 
@@ -8,3 +11,44 @@ class ModelLoadError(SPDBError):
     """Raised when model loading fails."""
 
     pass
+
+
+class RelationCycleError(SPDBError):
+    """Raised when relations form a cycle that cannot be fully expanded."""
+
+    pass
+
+
+class ModelWriteError(SPDBError):
+    """Raised when writing models to SharePoint fails.
+
+    Writes are sent in several batches, so some changes may have been
+    committed before the failure. They are applied to the cache and
+    reported here, so that retries do not create items again.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        updated: list[Any] | None = None,
+        created: list[Any] | None = None,
+        deleted: list[Any] | None = None,
+    ):
+        """
+        Args:
+            message: Description of the failure.
+            updated: Cached copies of the items updated before the failure.
+            created: Cached copies of the items created before the failure,
+                in the order they were passed to the write.
+            deleted: IDs of the items deleted before the failure.
+        """
+        super().__init__(message)
+        self.updated = updated or []
+        self.created = created or []
+        self.deleted = deleted or []
+
+
+class WriteConflictError(ModelWriteError):
+    """Raised when an item was changed in SharePoint since it was read."""
+
+    pass
@@ -0,0 +1,267 @@
+import sys
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from typing import Any, Generic
+
+from spdb.compact import CompactList
+from spdb.model import TModel
+
+
+def relation_key(obj: Any) -> Any:
+    """Get the value other items use to reference ``obj`` in lookup fields."""
+    return getattr(obj, "name", obj.id)
+
+
+def _index_values(value: Any) -> list[Hashable]:
+    """Get hashable index keys of a field value, one per element for lists."""
+    values = value if isinstance(value, list | tuple | set) else [value]
+    return [v for v in values if isinstance(v, Hashable)]
+
+
+class ModelIndex(Generic[TModel]):
+    """Hash indexes over a cached collection of models.
+
+    Items are indexed by ``id``, by their relation key (see
+    :func:`relation_key`) and by any number of secondary fields. Values of
+    multi-valued fields such as ``Server.roles`` are indexed element-wise.
+    Indexes are updated in place with :meth:`add` and :meth:`remove`.
+
+    Example:
+        index = ModelIndex(servers, fields=["location", "roles"])
+        index.find("roles", "Web Server")
+    """
+
+    def __init__(self, items: Iterable[TModel], fields: Iterable[str] = ()):
+        """
+        Args:
+            items: Models to index.
+            fields: Names of fields to build secondary indexes on.
+        """
+        self.by_id: dict[Any, TModel] = {}
+        self.by_key: dict[Any, TModel] = {}
+        self._secondary: dict[str, dict[Any, dict[Any, TModel]]] = {
+            field: {} for field in fields
+        }
+        for obj in items:
+            self.add(obj)
+
+    @property
+    def fields(self) -> list[str]:
+        """Names of fields with a secondary index."""
+        return list(self._secondary)
+
+    def add(self, obj: TModel) -> None:
+        """Index an item, replacing any item with the same ``id``."""
+        previous = self.by_id.get(obj.id)
+        if previous is not None:
+            self.remove(previous)
+        self.by_id[obj.id] = obj
+        self.by_key[relation_key(obj)] = obj
+        for field, index in self._secondary.items():
+            for value in _index_values(getattr(obj, field)):
+                index.setdefault(value, {})[obj.id] = obj
+
+    def remove(self, obj: TModel) -> None:
+        """Remove the item with the ``id`` of ``obj`` from all indexes."""
+        obj = self.by_id.pop(obj.id, None)
+        if obj is None:
+            return
+        key = relation_key(obj)
+        if self.by_key.get(key) is obj:
+            del self.by_key[key]
+        for field, index in self._secondary.items():
+            for value in _index_values(getattr(obj, field)):
+                bucket = index.get(value)
+                if bucket is None:
+                    continue
+                bucket.pop(obj.id, None)
+                if not bucket:
+                    del index[value]
+
+    def add_field(self, field: str) -> None:
+        """Build a secondary index on a field that is not indexed yet."""
+        if field in self._secondary:
+            return
+        index: dict[Any, dict[Any, TModel]] = {}
+        for obj in self.by_id.values():
+            for value in _index_values(getattr(obj, field)):
+                index.setdefault(value, {})[obj.id] = obj
+        self._secondary[field] = index
+
+    def find(self, field: str, value: Any) -> list[TModel]:
+        """Get items whose ``field`` equals or, for lists, contains ``value``.
+
+        Raises:
+            KeyError: If the field has no secondary index.
+        """
+        if field == "id":
+            obj = self.by_id.get(value)
+            return [] if obj is None else [obj]
+        return list(self._secondary[field].get(value, {}).values())
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __sizeof__(self) -> int:
+        # Items are shared with the cached list, only the tables are counted.
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.by_id)
+            + sys.getsizeof(self.by_key)
+            + sum(
+                sys.getsizeof(index) + sum(map(sys.getsizeof, index.values()))
+                for index in self._secondary.values()
+            )
+        )
+
+
+class RowMapping(Mapping[Any, TModel]):
+    """Mapping of keys to rows of a :class:`spdb.compact.CompactList`.
+
+    Only row positions are stored; the item of a row is built on every
+    access, like when indexing the list.
+    """
+
+    def __init__(self, items: CompactList[TModel], rows: dict[Any, int]):
+        self._items = items
+        self._rows = rows
+
+    def __getitem__(self, key: Any) -> TModel:
+        return self._items[self._rows[key]]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._rows)
+
+    def memoized(
+        self, transform: Callable[[TModel], Any] | None = None
+    ) -> "MemoMapping":
+        """Get a view keeping each item built, optionally transformed."""
+        return MemoMapping(self, transform)
+
+
+class MemoMapping(Mapping[Any, Any]):
+    """Mapping building values from another mapping once, on first access.
+
+    Meant to live for one operation, such as an expansion, so that items
+    referenced many times are shared without building every item.
+    """
+
+    def __init__(
+        self,
+        source: Mapping[Any, Any],
+        transform: Callable[[Any], Any] | None = None,
+    ):
+        self._source = source
+        self._transform = transform
+        self._values: dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        if key not in self._values:
+            value = self._source[key]
+            if self._transform is not None:
+                value = self._transform(value)
+            self._values[key] = value
+        return self._values[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._source
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+
+class CompactIndex(Generic[TModel]):
+    """Hash indexes over a :class:`spdb.compact.CompactList`.
+
+    Works like :class:`ModelIndex` but indexes row positions read from the
+    column arrays, so items are only built for the rows a lookup returns.
+    Rows of secondary index values are stored in typed arrays.
+    The index is tied to one list and cannot be updated in place; it is
+    rebuilt when the cached list is replaced.
+
+    Example:
+        index = CompactIndex(compact_servers, fields=["location"])
+        index.find("location", "DC1")
+    """
+
+    def __init__(self, items: CompactList[TModel], fields: Iterable[str] = ()):
+        """
+        Args:
+            items: Compact list to index.
+            fields: Names of fields to build secondary indexes on.
+        """
+        self._items = items
+        ids = {
+            item_id: row
+            for row, item_id in enumerate(items.column_values("id"))
+        }
+        self.by_id: RowMapping[TModel] = RowMapping(items, ids)
+        if "name" in items.model_cls.model_fields:
+            keys = {
+                key: row for row, key in enumerate(items.column_values("name"))
+            }
+            self.by_key: RowMapping[TModel] = RowMapping(items, keys)
+        else:
+            self.by_key = self.by_id
+        self._secondary: dict[str, dict[Any, array]] = {}
+        for field in fields:
+            self.add_field(field)
+
+    @property
+    def fields(self) -> list[str]:
+        """Names of fields with a secondary index."""
+        return list(self._secondary)
+
+    def add_field(self, field: str) -> None:
+        """Build a secondary index on a field that is not indexed yet."""
+        if field in self._secondary:
+            return
+        index: dict[Any, array] = {}
+        for row, value in enumerate(self._items.column_values(field)):
+            for key in dict.fromkeys(_index_values(value)):
+                rows = index.get(key)
+                if rows is None:
+                    rows = index[key] = array("q")
+                rows.append(row)
+        self._secondary[field] = index
+
+    def find(self, field: str, value: Any) -> list[TModel]:
+        """Get items whose ``field`` equals or, for lists, contains ``value``.
+
+        Raises:
+            KeyError: If the field has no secondary index.
+        """
+        if field == "id":
+            obj = self.by_id.get(value)
+            return [] if obj is None else [obj]
+        rows = self._secondary[field].get(value, ())
+        return [self._items[row] for row in rows]
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __sizeof__(self) -> int:
+        keys = (
+            sys.getsizeof(self.by_key) if self.by_key is not self.by_id else 0
+        )
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.by_id)
+            + keys
+            + sum(
+                sys.getsizeof(index) + sum(map(sys.getsizeof, index.values()))
+                for index in self._secondary.values()
+            )
+        )
@@ -0,0 +1,52 @@
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel as PydanticBaseModel
+
+
+class InternTable:
+    """Table replacing equal strings with one shared instance.
+
+    Unlike :func:`sys.intern`, the table is meant to live for one load
+    only, so strings of lists that are no longer cached can be freed.
+    Values are deduplicated in place within lists and dicts.
+
+    Example:
+        table = InternTable()
+        data = json.load(f, object_hook=table.intern_dict)
+    """
+
+    def __init__(self):
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: Any) -> Any:
+        """Get the shared instance of a string, interning list items in place.
+
+        Other values are returned unchanged.
+        """
+        if type(value) is str:
+            return self._strings.setdefault(value, value)
+        if type(value) is list:
+            for i, item in enumerate(value):
+                if type(item) is str:
+                    value[i] = self._strings.setdefault(item, item)
+        return value
+
+    def intern_dict(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Intern string values of a dict in place.
+
+        Nested dicts are not visited, which suits ``json.load``'s
+        ``object_hook`` as it is called for every nested object.
+        """
+        for key, value in data.items():
+            if type(value) is str or type(value) is list:
+                data[key] = self.intern(value)
+        return data
+
+    def intern_models(self, items: Iterable[PydanticBaseModel]) -> None:
+        """Intern string field values of validated models in place."""
+        for obj in items:
+            self.intern_dict(obj.__dict__)
@@ -0,0 +1,30 @@
+import threading
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class KeyedLocks(Generic[K]):
+    """Re-entrant locks created on demand, one per key.
+
+    Used to serialize loads of the same list while loads of different lists
+    run concurrently. A thread waiting for the lock of a key usually finds
+    the result in the cache once it acquires it, so concurrent requests are
+    coalesced into a single load.
+
+    Example:
+        with self._locks[list_name]:
+            ...
+    """
+
+    def __init__(self):
+        self._locks: dict[K, threading.RLock] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: K) -> threading.RLock:
+        lock = self._locks.get(key)
+        if lock is None:
+            with self._lock:
+                lock = self._locks.setdefault(key, threading.RLock())
+        return lock
@@ -1,31 +1,68 @@
 import json
 import logging
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
-from spdb.provider import SharePointProvider
+from spdb.cache import Cache
+from spdb.intern import InternTable
+from spdb.locks import KeyedLocks
+from spdb.provider import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_WRITE_BATCH_SIZE,
+    ETAG_COLUMN,
+    ETagMismatchError,
+    SharePointProvider,
+)
+from spdb.query import Condition
+from spdb.snapshot import SnapshotCache
 
 
 class MockSharePointProvider(SharePointProvider):
-    def __init__(self, mock_data_dir: str):
+    def __init__(
+        self,
+        mock_data_dir: str,
+        snapshot_cache: SnapshotCache | None = None,
+    ):
         self.mock_data_dir = Path(mock_data_dir)
-        self._cache: dict[str, list[dict[str, Any]]] = {}
+        self.snapshot_cache = snapshot_cache
+        self._cache: Cache[str, list[dict[str, Any]]] = Cache()
+        self._locks: KeyedLocks[str] = KeyedLocks()
         logging.debug(
             f"Initialized MockSharePointProvider with data from {self.mock_data_dir}"
         )
 
+    @property
+    def cache_namespace(self) -> str:
+        return str(self.mock_data_dir.resolve())
+
+    def _mock_file(self, list_name: str) -> Path:
+        return self.mock_data_dir / f"{list_name}.json"
+
+    def get_list_version(self, list_name: str) -> str | None:
+        """
+        Use the modification time of the mock file as the list version.
+        """
+        file_path = self._mock_file(list_name)
+        if not file_path.exists():
+            return None
+        return str(file_path.stat().st_mtime_ns)
+
     def fetch_list_items(
         self,
         list_name: str,
         select: list[str] | None = None,
         expand: list[str] | None = None,
+        where: list[Condition] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Load mock data from a JSON file instead of querying SharePoint.
 
         The JSON file must be named <list_name>.json and contain a list of items.
+        Conditions in ``where`` are evaluated locally, and when ``select`` is
+        given, items are projected to the selected columns.
         """
-        file_path = self.mock_data_dir / f"{list_name}.json"
+        file_path = self._mock_file(list_name)
 
         if not file_path.exists():
             raise FileNotFoundError(f"Mock data file not found: {file_path}")
@@ -34,10 +71,144 @@ class MockSharePointProvider(SharePointProvider):
             f"Loading mock data for list '{list_name}' from {file_path}"
         )
 
-        with file_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_items(list_name)
+
+        if where:
+            data = [
+                item
+                for item in data
+                if all(condition.matches(item) for condition in where)
+            ]
+        if select is None or "*" in select:
+            return data
+        columns = {column.split("/")[0] for column in select} | {ETAG_COLUMN}
+        return [
+            {key: value for key, value in item.items() if key in columns}
+            for item in data
+        ]
 
+    def iter_list_pages(
+        self,
+        list_name: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        where: list[Condition] | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield mock data in pages of ``page_size`` items, mimicking SharePoint paging.
+        """
+        data = self.fetch_list_items(list_name, select, expand, where)
+        for start in range(0, len(data), page_size):
+            yield data[start : start + page_size]
+
+    def _fetch_many(
+        self,
+        lists: Mapping[str, tuple[list[str] | None, list[str] | None]],
+        page_size: int,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Load mock data of several lists one after another.
+        """
+        return {
+            list_name: self.fetch_list_items(list_name, select, expand)
+            for list_name, (select, expand) in lists.items()
+        }
+
+    def _read_items(self, list_name: str) -> list[dict[str, Any]]:
+        file_path = self._mock_file(list_name)
+        with file_path.open("r", encoding="utf-8") as f:
+            data = json.load(f, object_hook=InternTable().intern_dict)
         if not isinstance(data, list):
             raise TypeError(f"Mock data in {file_path} must be a list of dicts")
-
         return data
+
+    def _write_items(self, list_name: str, items: list[dict[str, Any]]):
+        file_path = self._mock_file(list_name)
+        with file_path.open("w", encoding="utf-8") as f:
+            json.dump(items, f, indent=2)
+        self.clear_cache(list_name)
+
+    def write_list_items(
+        self,
+        list_name: str,
+        create: Sequence[dict[str, Any]] = (),
+        update: Mapping[Any, dict[str, Any]] | None = None,
+        delete: Iterable[Any] = (),
+        etags: Mapping[Any, str] | None = None,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> list[dict[str, Any]]:
+        """
+        Apply writes to the mock JSON file.
+
+        New items get consecutive IDs. Every written item gets a new ETag,
+        and updates or deletes with a stale ETag raise
+        :class:`ETagMismatchError`.
+        ``<Column>Id`` lookup values are stored as ``{"Id": ...}`` objects,
+        the shape of an expanded lookup without its ``Title``.
+        """
+        update = update or {}
+        delete = set(delete)
+        etags = etags or {}
+        file_path = self._mock_file(list_name)
+        items = self._read_items(list_name) if file_path.exists() else []
+        for item in items:
+            expected = etags.get(item["Id"])
+            if expected is not None and expected != item.get(ETAG_COLUMN):
+                raise ETagMismatchError(
+                    f"Item {item['Id']} of '{list_name}' was modified"
+                )
+        kept = []
+        for item in items:
+            if item["Id"] in delete:
+                continue
+            payload = update.get(item["Id"])
+            if payload is not None:
+                item.update(_from_lookup_ids(payload, item))
+                item[ETAG_COLUMN] = _next_etag(item.get(ETAG_COLUMN))
+            kept.append(item)
+        next_id = max((item["Id"] for item in items), default=0) + 1
+        created = []
+        for offset, payload in enumerate(create):
+            item = {
+                "Id": next_id + offset,
+                **_from_lookup_ids(payload),
+                ETAG_COLUMN: _next_etag(None),
+            }
+            kept.append(item)
+            created.append(item)
+        self._write_items(list_name, kept)
+        return created
+
+
+def _next_etag(etag: str | None) -> str:
+    """Increment the version number of a ``"<n>"`` ETag."""
+    version = int(etag.strip('"')) if etag else 0
+    return f'"{version + 1}"'
+
+
+def _from_lookup_ids(
+    payload: dict[str, Any], current: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Store ``<Column>Id`` lookup values as expanded lookup objects.
+
+    Lookup objects of ``current`` with the same ``Id`` are kept, so their
+    ``Title`` survives updates.
+    """
+    item = {}
+    for key, value in payload.items():
+        if not key.endswith("Id") or key == "Id":
+            item[key] = value
+            continue
+        column = key[: -len("Id")]
+        previous = (current or {}).get(column)
+        if not isinstance(previous, list):
+            previous = [previous]
+        known = {v["Id"]: v for v in previous if isinstance(v, dict)}
+        if isinstance(value, list):
+            item[column] = [known.get(v, {"Id": v}) for v in value]
+        elif value is None:
+            item[column] = None
+        else:
+            item[column] = known.get(value, {"Id": value})
+    return item
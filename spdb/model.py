@@ -1,3 +1,5 @@
+from collections.abc import Callable, Iterable
+from operator import itemgetter
 from types import UnionType
 from typing import (
     Annotated,
@@ -9,7 +11,7 @@ from typing import (
 )
 
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import BeforeValidator, ConfigDict
+from pydantic import BeforeValidator, ConfigDict, TypeAdapter
 
 
 def extract_model_class(
@@ -47,10 +49,49 @@ def extract_model_class(
     return None
 
 
+Resolver = Callable[[str, Any], Any]
+"""Callable resolving a raw relation value given the target model name."""
+
+
+class LazyRelation:
+    """Descriptor resolving a relation field on first attribute access.
+
+    The raw value stays in the instance ``__dict__``; the resolved value is
+    memoized in the instance's private state until the raw value changes.
+    """
+
+    def __init__(self, field_name: str, rel_model_name: str):
+        self.field_name = field_name
+        self.rel_model_name = rel_model_name
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        raw_val = obj.__dict__[self.field_name]
+        private = obj.__pydantic_private__
+        memo = private["_resolved"].get(self.field_name)
+        if memo is not None and memo[0] is raw_val:
+            return memo[1]
+        resolved = private["_resolver"](self.rel_model_name, raw_val)
+        private["_resolved"][self.field_name] = (raw_val, resolved)
+        return resolved
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.field_name] = value
+
+
 class BaseModel(PydanticBaseModel):
     """Base Model"""
 
     _list_name: ClassVar[str | None] = None
+    _cache_ttl: ClassVar[float | None] = None
+    """Seconds after which cached items of this model are reloaded."""
+    _indexes: ClassVar[tuple[str, ...]] = ()
+    """Fields indexed for :meth:`spdb.base.SPDB.find` when items are loaded."""
+    _trusted: ClassVar[bool] = False
+    """Build items with :meth:`construct_trusted` instead of validating them."""
+    _compact: ClassVar[bool] = False
+    """Cache items as column arrays, see :class:`spdb.compact.CompactList`."""
 
     model_config = ConfigDict(
         use_enum_values=True,
@@ -77,10 +118,280 @@ class BaseModel(PydanticBaseModel):
             setattr(cls, cache_key, relations)
         return getattr(cls, cache_key)
 
+    @classmethod
+    def get_list_adapter(cls) -> TypeAdapter:
+        """Get a cached ``TypeAdapter`` validating a list of this model."""
+        cache_key = f"__{cls.__name__}_list_adapter__"
+        if cache_key not in cls.__dict__:
+            setattr(cls, cache_key, TypeAdapter(list[cls]))
+        return getattr(cls, cache_key)
+
+    @classmethod
+    def get_lazy_class(cls) -> type["BaseModel"]:
+        """Get a subclass whose relation fields are :class:`LazyRelation` descriptors.
+
+        The subclass keeps the model name and list name, so it is
+        indistinguishable from the model apart from lazy attribute access.
+        """
+        cache_key = f"__{cls.__name__}_lazy_class__"
+        if not hasattr(cls, cache_key):
+            lazy_cls = type(cls)(
+                cls.__name__,
+                (cls,),
+                {
+                    "__module__": cls.__module__,
+                    "__qualname__": cls.__qualname__,
+                    "__doc__": cls.__doc__,
+                    "_list_name": cls.get_list_name(),
+                },
+            )
+            for field_name, rel_name in cls.get_relation_fields().items():
+                setattr(
+                    lazy_cls, field_name, LazyRelation(field_name, rel_name)
+                )
+            setattr(cls, cache_key, lazy_cls)
+        return getattr(cls, cache_key)
+
+    def lazy_copy(self, resolver: Resolver) -> "BaseModel":
+        """Return a shallow copy whose relations resolve on first access.
+
+        Args:
+            resolver: Called with the target model name and the raw relation
+                value; its result is memoized on the copy.
+        """
+        lazy_cls = type(self).get_lazy_class()
+        copy = lazy_cls.__new__(lazy_cls)
+        object.__setattr__(copy, "__dict__", dict(self.__dict__))
+        object.__setattr__(
+            copy, "__pydantic_fields_set__", set(self.__pydantic_fields_set__)
+        )
+        object.__setattr__(copy, "__pydantic_extra__", self.__pydantic_extra__)
+        object.__setattr__(
+            copy,
+            "__pydantic_private__",
+            {"_resolver": resolver, "_resolved": {}},
+        )
+        return copy
+
+    @classmethod
+    def get_lookup_fields(cls) -> dict[str, str]:
+        """Get mapping of fields annotated with ``LookupField`` to their aliases."""
+        cache_key = f"__{cls.__name__}_lookup_fields__"
+        if not hasattr(cls, cache_key):
+            lookups = {
+                field_name: field_info.alias or field_name
+                for field_name, field_info in cls.model_fields.items()
+                if LookupField in field_info.metadata
+            }
+            setattr(cls, cache_key, lookups)
+        return getattr(cls, cache_key)
+
+    @classmethod
+    def get_field_columns(cls) -> dict[str, str]:
+        """Get mapping of SharePoint columns and field names to field names."""
+        cache_key = f"__{cls.__name__}_field_columns__"
+        if not hasattr(cls, cache_key):
+            columns = {}
+            for field_name, field_info in cls.model_fields.items():
+                columns[field_name] = field_name
+                columns[field_info.alias or field_name] = field_name
+            setattr(cls, cache_key, columns)
+        return getattr(cls, cache_key)
+
+    @classmethod
+    def get_trusted_plan(cls) -> "_TrustedPlan":
+        """Get the precomputed field mapping of :meth:`construct_trusted_many`."""
+        cache_key = f"__{cls.__name__}_trusted_plan__"
+        if cache_key not in cls.__dict__:
+            setattr(cls, cache_key, _TrustedPlan(cls))
+        return getattr(cls, cache_key)
+
+    @classmethod
+    def construct_trusted(cls, data: dict[str, Any]) -> "BaseModel":
+        """Build an instance from a raw item without validating it.
+
+        Columns are mapped to fields and lookup values are flattened with
+        :func:`lookup`; everything else is stored as is. Only use it for
+        lists whose data is known to match the model, as missing or
+        mistyped values are not detected.
+
+        Args:
+            data: Raw SharePoint item keyed by column or field name.
+
+        Returns:
+            Instance equivalent to one created with ``model_construct``.
+        """
+        return cls.construct_trusted_many([data])[0]
+
+    @classmethod
+    def construct_trusted_many(
+        cls, raw_items: Iterable[dict[str, Any]]
+    ) -> list["BaseModel"]:
+        """Build instances from raw items without validating them.
+
+        The instance state is set directly instead of going through
+        ``model_construct``: items having every column are mapped with one
+        ``itemgetter`` call, other items field by field, filling defaults.
+        Models with private attributes or ``model_post_init`` fall back to
+        ``model_construct``.
+
+        Skipping validation is not a CPU win: most of the time of building
+        many instances goes to allocating them and to the cyclic garbage
+        collection this triggers, which validation pays the same. Trusted
+        loads take about as long as validated ones and only skip coercion,
+        whitespace stripping and validators.
+
+        Args:
+            raw_items: Raw SharePoint items keyed by column or field name.
+
+        Returns:
+            Instances in the order of ``raw_items``.
+        """
+        plan = cls.get_trusted_plan()
+        if cls.__pydantic_post_init__:
+            loaded = []
+            for data in raw_items:
+                values, fields_set = plan.values(data)
+                loaded.append(cls.model_construct(fields_set, **values))
+            return loaded
+        new = object.__new__
+        set_attr = object.__setattr__
+        names = plan.names
+        get_columns = plan.get_columns
+        lookup_fields = plan.lookup_fields
+        all_fields = plan.all_fields
+        loaded = []
+        for data in raw_items:
+            try:
+                values = dict(zip(names, get_columns(data), strict=True))
+            except KeyError:
+                values, fields_set = plan.values(data)
+            else:
+                for name in lookup_fields:
+                    values[name] = lookup(values[name])
+                fields_set = set(all_fields)
+            obj = new(cls)
+            set_attr(obj, "__dict__", values)
+            set_attr(obj, "__pydantic_fields_set__", fields_set)
+            set_attr(obj, "__pydantic_extra__", None)
+            set_attr(obj, "__pydantic_private__", None)
+            loaded.append(obj)
+        return loaded
+
+    def to_sharepoint(
+        self,
+        lookup_id: Callable[[str | None, Any], Any],
+        fields: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Serialize the item to SharePoint column values for writing.
+
+        Plain fields are keyed by their alias. Lookup fields are written as
+        ``<Alias>Id`` with the IDs of the looked-up items. The read-only
+        ``Id`` column is never included.
+
+        Args:
+            lookup_id: Called with the target model name (None if the lookup
+                has no model) and a related item or its key; returns the ID
+                of the looked-up item.
+            fields: Names of fields to include, defaults to all fields.
+
+        Returns:
+            Mapping of column names to JSON-compatible values.
+        """
+        cls = type(self)
+        lookups = cls.get_lookup_fields()
+        relations = cls.get_relation_fields()
+        names = list(cls.model_fields) if fields is None else list(fields)
+        plain = {
+            name
+            for name in names
+            if name not in lookups
+            and (cls.model_fields[name].alias or name) != "Id"
+        }
+        payload = self.model_dump(mode="json", by_alias=True, include=plain)
+        for name in names:
+            if name not in lookups:
+                continue
+            value = self.__dict__[name]
+            rel_name = relations.get(name)
+            if isinstance(value, list):
+                value = [lookup_id(rel_name, v) for v in value]
+            elif value is not None:
+                value = lookup_id(rel_name, value)
+            payload[f"{lookups[name]}Id"] = value
+        return payload
+
+    @classmethod
+    def get_select_fields(cls) -> list[str]:
+        """Get SharePoint columns to request with ``$select``.
+
+        Plain fields are selected by alias. Lookup fields select the
+        ``Id`` and ``Title`` of the looked-up item, e.g. ``Owner/Title``.
+        """
+        lookups = cls.get_lookup_fields()
+        select = []
+        for field_name, field_info in cls.model_fields.items():
+            column = field_info.alias or field_name
+            if field_name in lookups:
+                select.extend([f"{column}/Id", f"{column}/Title"])
+            else:
+                select.append(column)
+        return select
+
+    @classmethod
+    def get_expand_fields(cls) -> list[str]:
+        """Get lookup columns to request with ``$expand``."""
+        return list(cls.get_lookup_fields().values())
+
 
 TModel = TypeVar("TModel", bound=BaseModel)
 
 
+class _TrustedPlan:
+    """Field mapping of a model precomputed for trusted construction."""
+
+    def __init__(self, model_cls: type[BaseModel]):
+        lookups = model_cls.get_lookup_fields()
+        self.fields = [
+            (name, info.alias or name, name in lookups, info)
+            for name, info in model_cls.model_fields.items()
+        ]
+        self.names = tuple(name for name, *_ in self.fields)
+        self.all_fields = frozenset(self.names)
+        self.lookup_fields = tuple(
+            name for name in self.names if name in lookups
+        )
+        columns = [column for _, column, _, _ in self.fields]
+        if len(columns) == 1:
+            column = columns[0]
+            self.get_columns = lambda data: (data[column],)
+        else:
+            self.get_columns = itemgetter(*columns) if columns else tuple
+
+    def values(self, data: dict[str, Any]) -> tuple[dict[str, Any], set[str]]:
+        """Map a raw item to field values and the set of fields it provides.
+
+        Fields are read by column alias or by name; missing optional fields
+        get their default, like with ``model_construct``.
+        """
+        values: dict[str, Any] = {}
+        fields_set = set()
+        for name, column, is_lookup, info in self.fields:
+            if column in data:
+                value = data[column]
+            elif name in data:
+                value = data[name]
+            else:
+                if not info.is_required():
+                    values[name] = info.get_default(
+                        call_default_factory=True, validated_data=values
+                    )
+                continue
+            values[name] = lookup(value) if is_lookup else value
+            fields_set.add(name)
+        return values, fields_set
+
+
 def lookup(value: Any) -> Any:
     if value is None:
         return None
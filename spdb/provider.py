@@ -1,25 +1,113 @@
+import dataclasses
 import logging
-from typing import Any
+import math
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, TypeVar
 
 from office365.runtime.auth.authentication_context import (
     AuthenticationContext,
     UserCredential,
 )
+from office365.runtime.client_value_collection import ClientValueCollection
+from office365.runtime.http.request_options import RequestOptions
 from office365.sharepoint.client_context import ClientContext
+from office365.sharepoint.listitems.collection import ListItemCollection
 from office365.sharepoint.lists.list import List as SPlist
 
+from spdb.cache import Cache
+from spdb.locks import KeyedLocks
+from spdb.query import Condition, to_filter
+from spdb.snapshot import Snapshot, SnapshotCache
+from spdb.throttle import RetryPolicy, TokenBucket
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 5000
+"""Maximum page size accepted by SharePoint for a single ``$top`` request."""
+
+MODIFIED_COLUMN = "Modified"
+"""Column holding the last modification time of a SharePoint list item."""
+
+ETAG_COLUMN = "__etag"
+"""Key under which office365 exposes the ETag of a list item."""
+
+DEFAULT_WRITE_BATCH_SIZE = 100
+"""Number of item writes sent in one ``$batch`` request."""
+
+
+def _chunks(values: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split a sequence into consecutive chunks of at most ``size`` values."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _set_if_match(request: RequestOptions, etags: Mapping[str, str]) -> None:
+    """Replace the default ``If-Match: *`` of a request to an item with an ETag."""
+    etag = etags.get(request.url)
+    if etag is not None:
+        request.headers["IF-MATCH"] = etag
+
+
+def _field_value(value: Any) -> Any:
+    """Convert a payload value to what office365 expects for a field."""
+    if isinstance(value, list):
+        item_type = type(value[0]) if value else int
+        return ClientValueCollection(item_type, value)
+    return value
+
 
 class ProviderError(ValueError):
     pass
 
 
+class ETagMismatchError(ProviderError):
+    """Raised when the ETag of a written item no longer matches."""
+
+
+class PartialWriteError(ProviderError):
+    """Raised when a write fails after some of its batches were committed.
+
+    The error of the failed batch is chained as ``__cause__``.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        created: list[dict[str, Any]],
+        updated: list[Any],
+        deleted: list[Any],
+    ):
+        """
+        Args:
+            message: Description of the failure.
+            created: Properties of the items created before the failure.
+            updated: IDs of the items updated before the failure.
+            deleted: IDs of the items deleted before the failure.
+        """
+        super().__init__(message)
+        self.created = created
+        self.updated = updated
+        self.deleted = deleted
+
+
 class SharePointProvider:
+    snapshot_cache: SnapshotCache | None = None
+    """Optional persistent cache of raw list payloads shared across runs."""
+
     def __init__(
         self,
         site_url: str,
         username: str,
         password: str,
         verify: str | None = None,
+        snapshot_cache: SnapshotCache | None = None,
+        cache_ttl: float | None = None,
+        cache_max_bytes: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
     ):
         """
         Initializes the SharePointProvider with authentication details and site URL.
@@ -29,16 +117,26 @@ class SharePointProvider:
             username (str): Username for SharePoint authentication.
             password (str): Password for SharePoint authentication.
             verify (str | None): Path to SSL certificate for verification, or None to disable verification.
+            snapshot_cache (SnapshotCache | None): Persistent cache used to skip downloads on warm starts.
+            cache_ttl (float | None): Seconds after which in-memory list payloads expire.
+            cache_max_bytes (int | None): Approximate memory limit of in-memory list payloads.
+            retry_policy (RetryPolicy | None): Retries of throttled (429/503) requests, defaults to :class:`RetryPolicy`.
+            rate_limiter (TokenBucket | None): Limiter shared by all threads, or None for no client-side limit.
         """
         self.site_url = site_url
         self.username = username
         self.password = password
         self.verify = verify
+        self.snapshot_cache = snapshot_cache
 
-        self._ctx = None
-        self._authenticated = False
+        self._local = threading.local()
 
-        self._cache = {}
+        self._cache: Cache[str, list[dict[str, Any]]] = Cache(
+            ttl=cache_ttl, max_bytes=cache_max_bytes
+        )
+        self._locks: KeyedLocks[str] = KeyedLocks()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
 
         if not self.username or not self.password:
             raise ValueError("Username and password must be provided")
@@ -47,22 +145,31 @@ class SharePointProvider:
             f"SharePointProvider initialized for site '{self.site_url}' with user '{self.username}'."
         )
 
+    @property
+    def cache_namespace(self) -> str:
+        """Key under which this provider's snapshots are persisted."""
+        return self.site_url
+
     @property
     def ctx(self) -> ClientContext:
         """
         Returns the authenticated SharePoint client context.
 
+        Each thread gets its own context, because a ``ClientContext`` queues
+        pending queries and cannot be shared between concurrent requests.
+
         Returns:
             ClientContext: Authenticated SharePoint client context.
         """
-        if not self._ctx or not self._authenticated:
+        ctx = getattr(self._local, "ctx", None)
+        if ctx is None:
             logging.debug(
                 f"Attempting authentication for user '{self.username}' at '{self.site_url}'"
             )
-            self._ctx = self._authenticate()
+            ctx = self._authenticate()
             logging.info("SharePoint authentication successful.")
-            self._authenticated = True
-        return self._ctx
+            self._local.ctx = ctx
+        return ctx
 
     def _authenticate(self) -> ClientContext:
         """
@@ -83,6 +190,25 @@ class SharePointProvider:
             logging.error(f"SharePoint authentication error: {str(e)}")
             raise
 
+    def _execute(self, request: Callable[[], T], *, retry: bool = True) -> T:
+        """
+        Run a SharePoint request under the rate limiter, retrying throttled attempts.
+
+        Args:
+            request: Callable queuing and executing the query. It is called
+                again for every retry, since a failed query is not requeued.
+            retry: If False, the request is sent only once. Used for
+                requests that are not idempotent, as a throttled response
+                does not prove that the server did not apply them.
+
+        Returns:
+            The result of ``request``.
+        """
+        policy = self.retry_policy
+        if not retry:
+            policy = dataclasses.replace(policy, max_retries=0)
+        return policy.call(request, self.rate_limiter)
+
     def fetch_list(self, list_name: str) -> SPlist:
         """
         Fetches a SharePoint list by its name.
@@ -96,57 +222,512 @@ class SharePointProvider:
         logging.debug(f"Fetching SharePoint list: '{list_name}'")
         return self.ctx.web.lists.get_by_title(list_name)
 
+    def iter_list_pages(
+        self,
+        list_name: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        where: list[Condition] | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Stream items from a SharePoint list one page at a time.
+
+        Pages are requested with ``$top`` and the server ``__next`` link is
+        followed lazily, so the next page is only requested once the caller
+        has consumed the previous one.
+
+        Args:
+            list_name: The title of the SharePoint list.
+            select: Columns to retrieve, defaults to all columns.
+            expand: Lookup columns to expand.
+            page_size: Number of items requested per page.
+            where: Conditions pushed down to SharePoint as ``$filter``.
+
+        Yields:
+            Lists of dictionaries representing SharePoint list items.
+        """
+        logging.debug(
+            f"Fetching from '{list_name}' pages of {page_size} items with {select=} {expand=} {where=}"
+        )
+        items = self._items_query(list_name, select, expand, page_size, where)
+        self._execute(lambda: items.get().execute_query())
+        yield from self._iter_loaded_pages(items)
+
+    def _items_query(
+        self,
+        list_name: str,
+        select: list[str] | None,
+        expand: list[str] | None,
+        page_size: int,
+        where: list[Condition] | None = None,
+    ) -> ListItemCollection:
+        """Build a paged item query of a list without executing it."""
+        select_arg = ["*"] if select is None else select
+        items = (
+            self.fetch_list(list_name)
+            .items.select(select_arg)
+            .expand(expand or [])
+            .paged(page_size)
+        )
+        if where:
+            items = items.filter(to_filter(where))
+        return items
+
+    def _iter_loaded_pages(
+        self, items: ListItemCollection
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the loaded page of a paged query, then request the next ones.
+
+        The collection keeps every loaded item, so items of a page are
+        dropped once their properties are taken, which bounds memory to one
+        page. Only pages linked by the server's ``__next`` URL are dropped;
+        ``$skip`` paging counts the loaded items to request the next page.
+        """
+        position = 0
+        while True:
+            page = [item.properties for item in items[position : len(items)]]
+            has_next = items.has_next
+            if items._server_paged:
+                items.clear()
+            position = len(items)
+            if page:
+                yield page
+            if not has_next:
+                return
+            self._execute(lambda: items._get_next().execute_query())
+
+    def get_list_version(self, list_name: str) -> str | None:
+        """
+        Get a token that changes whenever items of a list are modified or deleted.
+
+        Args:
+            list_name: The title of the SharePoint list.
+
+        Returns:
+            The version token, or None if it cannot be determined.
+        """
+        sp_list = self._execute(
+            lambda: self.fetch_list(list_name)
+            .get()
+            .select(["LastItemModifiedDate", "LastItemDeletedDate"])
+            .execute_query()
+        )
+        modified = sp_list.properties.get("LastItemModifiedDate")
+        deleted = sp_list.properties.get("LastItemDeletedDate")
+        if modified is None:
+            return None
+        return f"{modified}|{deleted}"
+
     def fetch_list_items(
         self,
         list_name: str,
         select: list[str] | None = None,
         expand: list[str] | None = None,
+        where: list[Condition] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch all items from a SharePoint list.
 
         Args:
             list_name: The title of the SharePoint list.
+            select: Columns to retrieve, defaults to all columns.
+            expand: Lookup columns to expand.
+            where: Conditions pushed down to SharePoint as ``$filter``.
 
         Returns:
             A list of dictionaries representing SharePoint list items.
         """
-        sp_list = self.fetch_list(list_name)
-        select_arg = ["*"] if select is None else select
-        logging.debug(
-            f"Fetching from '{sp_list}' items with {select=} {expand=}"
-        )
-        items = sp_list.get().select(select_arg).expand(expand).execute_query()
-        return [item.properties for item in items]
+        return [
+            item
+            for page in self.iter_list_pages(
+                list_name, select, expand, where=where
+            )
+            for item in page
+        ]
 
     def get_list_items(
         self,
         list_name: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get all items from a SharePoint list. Uses in-memory cache if data was already retrieved.
 
+        The cache is keyed by list name only, so a list should always be
+        requested with the same ``select`` and ``expand``. When a
+        ``snapshot_cache`` is configured, a persisted snapshot is used while
+        it is fresh or while the list version is unchanged. Concurrent
+        calls for the same list wait for a single download.
+
         Args:
             list_name: The title of the SharePoint list.
+            select: Columns to retrieve, defaults to all columns.
+            expand: Lookup columns to expand.
 
         Returns:
             A list of dictionaries representing SharePoint list items.
         """
-        if list_name in self._cache:
-            return self._cache[list_name]
-        items = self.fetch_list_items(list_name)
-        self._cache[list_name] = items
+        items = self._cache.get(list_name)
+        if items is not None:
+            return items
+        with self._locks[list_name]:
+            items = self._cache.get(list_name)
+            if items is not None:
+                return items
+            items = self._load_snapshot(list_name, select, expand)
+            if items is None:
+                version = self._snapshot_version(list_name)
+                items = self.fetch_list_items(list_name, select, expand)
+                self._save_snapshot(list_name, items, version, select, expand)
+            self._cache[list_name] = items
         return items
 
-    def clear_cache(self, list_name: str | None = None) -> None:
+    def get_many_list_items(
+        self,
+        lists: Mapping[str, tuple[list[str] | None, list[str] | None]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get all items of several SharePoint lists with a single ``$batch`` request.
+
+        The first page of every list that is neither cached nor available
+        as a snapshot is requested in one batch request. Remaining pages of
+        larger lists are then requested list by list. Results are cached
+        as by :meth:`get_list_items`.
+
+        Args:
+            lists: Mapping of list titles to their ``(select, expand)``.
+            page_size: Number of items requested per page.
+
+        Returns:
+            Mapping of list titles to their items.
+        """
+        result = {}
+        pending = {}
+        with ExitStack() as stack:
+            for list_name in sorted(lists):
+                stack.enter_context(self._locks[list_name])
+            for list_name, (select, expand) in lists.items():
+                items = self._cache.get(list_name)
+                if items is None:
+                    items = self._load_snapshot(list_name, select, expand)
+                    if items is None:
+                        pending[list_name] = (select, expand)
+                        continue
+                    self._cache[list_name] = items
+                result[list_name] = items
+            if not pending:
+                return result
+            versions = {name: self._snapshot_version(name) for name in pending}
+            for list_name, items in self._fetch_many(
+                pending, page_size
+            ).items():
+                select, expand = pending[list_name]
+                self._save_snapshot(
+                    list_name, items, versions[list_name], select, expand
+                )
+                self._cache[list_name] = items
+                result[list_name] = items
+        return result
+
+    def _fetch_many(
+        self,
+        lists: Mapping[str, tuple[list[str] | None, list[str] | None]],
+        page_size: int,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Fetch several lists, requesting their first pages in one batch."""
+        logging.debug(f"Fetching first pages of {list(lists)} in one batch")
+        queries = {}
+
+        def request() -> None:
+            self.ctx.clear()
+            for list_name, (select, expand) in lists.items():
+                queries[list_name] = self._items_query(
+                    list_name, select, expand, page_size
+                ).get()
+            self.ctx.execute_batch()
+
+        self._execute(request)
+        return {
+            list_name: [
+                item for page in self._iter_loaded_pages(items) for item in page
+            ]
+            for list_name, items in queries.items()
+        }
+
+    def _snapshot_version(self, list_name: str) -> str | None:
+        """Get the list version if snapshots are enabled."""
+        if self.snapshot_cache is None:
+            return None
+        try:
+            return self.get_list_version(list_name)
+        except Exception as e:
+            logging.warning(f"Cannot get version of list '{list_name}': {e}")
+            return None
+
+    def _load_snapshot(
+        self,
+        list_name: str,
+        select: list[str] | None,
+        expand: list[str] | None,
+    ) -> list[dict[str, Any]] | None:
+        """Return persisted items if the snapshot is still valid."""
+        if self.snapshot_cache is None:
+            return None
+        snapshot = self.snapshot_cache.load(self.cache_namespace, list_name)
+        if snapshot is None or not snapshot.matches(select, expand):
+            return None
+        if self.snapshot_cache.is_fresh(snapshot):
+            logging.debug(f"Using fresh snapshot of list '{list_name}'")
+            return snapshot.items
+        version = self._snapshot_version(list_name)
+        if version is None or version != snapshot.version:
+            return None
+        logging.debug(f"Using unchanged snapshot of list '{list_name}'")
+        self._save_snapshot(list_name, snapshot.items, version, select, expand)
+        return snapshot.items
+
+    def _save_snapshot(
+        self,
+        list_name: str,
+        items: list[dict[str, Any]],
+        version: str | None,
+        select: list[str] | None,
+        expand: list[str] | None,
+    ) -> None:
+        if self.snapshot_cache is None:
+            return
+        snapshot = Snapshot(items, version, select, expand)
+        self.snapshot_cache.save(self.cache_namespace, list_name, snapshot)
+
+    def fetch_changes(
+        self,
+        list_name: str,
+        since: str,
+        select: list[str] | None = None,
+        expand: list[str] | None = None,
+    ) -> tuple[list[dict[str, Any]], set[Any]]:
+        """
+        Fetch items modified since a point in time, plus the IDs of all items.
+
+        The ID listing is used to detect deletions, since deleted items no
+        longer show up in a ``Modified`` filter. If the list is cached, the
+        changes are merged into the cached payload.
+
+        Args:
+            list_name: The title of the SharePoint list.
+            since: ISO 8601 timestamp of the last synchronization.
+            select: Columns to retrieve for changed items.
+            expand: Lookup columns to expand for changed items.
+
+        Returns:
+            Changed items and the set of IDs still present in the list.
+        """
+        modified_since = datetime.fromisoformat(since.replace("Z", "+00:00"))
+        version = self._snapshot_version(list_name)
+        changed = self.fetch_list_items(
+            list_name,
+            select,
+            expand,
+            where=[Condition(MODIFIED_COLUMN, "ge", modified_since)],
+        )
+        live_ids = {
+            item["Id"] for item in self.fetch_list_items(list_name, ["Id"])
+        }
+        logging.debug(
+            f"List '{list_name}' has {len(changed)} changed items since {since}"
+        )
+
+        with self._locks[list_name]:
+            cached = self._cache.get(list_name)
+            if cached is not None:
+                changed_ids = {item["Id"] for item in changed}
+                merged = [
+                    item
+                    for item in cached
+                    if item["Id"] in live_ids and item["Id"] not in changed_ids
+                ] + changed
+                self._cache[list_name] = merged
+                self._save_snapshot(list_name, merged, version, select, expand)
+        return changed, live_ids
+
+    def write_list_items(
+        self,
+        list_name: str,
+        create: Sequence[dict[str, Any]] = (),
+        update: Mapping[Any, dict[str, Any]] | None = None,
+        delete: Iterable[Any] = (),
+        etags: Mapping[Any, str] | None = None,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> list[dict[str, Any]]:
+        """
+        Create, update and delete list items with as few ``$batch`` requests as possible.
+
+        All operations are queued together and sent ``batch_size`` at a
+        time. Updates only change the given columns (``MERGE``). Updates and
+        deletes of items with an ETag in ``etags`` are sent with
+        ``If-Match``, so they fail if the item was changed in the meantime;
+        other items are overwritten unconditionally. Throttled batches are
+        retried unless they create items, as creating them twice would
+        duplicate them.
+
+        Args:
+            list_name: The title of the SharePoint list.
+            create: Column values of new items. Lookup columns are set
+                through ``<Column>Id`` keys.
+            update: Mapping of item IDs to the column values to set.
+            delete: IDs of items to delete.
+            etags: Mapping of item IDs to the ETags they were read with.
+            batch_size: Number of operations sent per batch request.
+
+        Returns:
+            Properties of the created items, including their ``Id``.
+
+        Raises:
+            PartialWriteError: If a batch fails after earlier batches were
+                committed, reporting what was written. Errors of the first
+                batch are raised as they are.
+        """
+        operations = [("create", None, payload) for payload in create]
+        operations += [
+            ("update", item_id, payload)
+            for item_id, payload in (update or {}).items()
+        ]
+        operations += [("delete", item_id, None) for item_id in delete]
+        if not operations:
+            return []
+        etags = etags or {}
+        sp_list = self._list_for_write(list_name)
+        type_name = sp_list.properties["ListItemEntityTypeFullName"]
+        created = []
+        written = 0
+        for chunk in _chunks(operations, batch_size):
+
+            def request(chunk=chunk) -> list[dict[str, Any]]:
+                self.ctx.clear()
+                new_items = []
+                etag_by_url = {}
+                for action, item_id, payload in chunk:
+                    if action == "create":
+                        new_items.append(
+                            sp_list.add_item(
+                                {k: _field_value(v) for k, v in payload.items()}
+                            )
+                        )
+                        continue
+                    item = sp_list.get_item_by_id(item_id)
+                    if action == "update":
+                        # Known type name spares a request for it per item
+                        item._entity_type_name = type_name
+                        for column, value in payload.items():
+                            item.set_property(column, _field_value(value))
+                        item.update()
+                    else:
+                        item.delete_object()
+                    if item_id in etags:
+                        etag_by_url[item.resource_url] = etags[item_id]
+                if etag_by_url:
+                    self.ctx.pending_request().before_execute(
+                        lambda r: _set_if_match(r, etag_by_url), once=False
+                    )
+                self.ctx.execute_batch(items_per_batch=len(chunk))
+                return [item.properties for item in new_items]
+
+            has_creates = any(action == "create" for action, _, _ in chunk)
+            try:
+                created.extend(self._execute(request, retry=not has_creates))
+            except Exception as e:
+                self.clear_cache(list_name)
+                if not written:
+                    raise
+                done = operations[:written]
+                raise PartialWriteError(
+                    f"Writing to list '{list_name}' failed after"
+                    f" {written} of {len(operations)} changes: {e}",
+                    created=created,
+                    updated=[i for a, i, _ in done if a == "update"],
+                    deleted=[i for a, i, _ in done if a == "delete"],
+                ) from e
+            written += len(chunk)
+        logging.info(
+            f"Wrote {len(operations)} changes to list '{list_name}' in"
+            f" {math.ceil(len(operations) / batch_size)} batch requests"
+        )
+        self.clear_cache(list_name)
+        return created
+
+    def create_list_items(
+        self,
+        list_name: str,
+        payloads: Sequence[dict[str, Any]],
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> list[dict[str, Any]]:
+        """
+        Create list items, see :meth:`write_list_items`.
+
+        Returns:
+            Properties of the created items, including their ``Id``.
+        """
+        return self.write_list_items(
+            list_name, create=payloads, batch_size=batch_size
+        )
+
+    def update_list_items(
+        self,
+        list_name: str,
+        updates: Mapping[Any, dict[str, Any]],
+        etags: Mapping[Any, str] | None = None,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> None:
+        """
+        Update columns of list items, see :meth:`write_list_items`.
+        """
+        self.write_list_items(
+            list_name, update=updates, etags=etags, batch_size=batch_size
+        )
+
+    def delete_list_items(
+        self,
+        list_name: str,
+        ids: Iterable[Any],
+        etags: Mapping[Any, str] | None = None,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ) -> None:
+        """
+        Delete list items, see :meth:`write_list_items`.
+        """
+        self.write_list_items(
+            list_name, delete=ids, etags=etags, batch_size=batch_size
+        )
+
+    def _list_for_write(self, list_name: str) -> SPlist:
+        """Get a list with the entity type name needed to write its items."""
+        sp_list = self.fetch_list(list_name)
+        self._execute(
+            lambda: sp_list.get()
+            .select(["ListItemEntityTypeFullName"])
+            .execute_query()
+        )
+        return sp_list
+
+    def clear_cache(
+        self, list_name: str | None = None, persistent: bool = True
+    ) -> None:
         """
-        Clears the internal cache.
+        Clears the internal cache and any persisted snapshots.
 
         Args:
             list_name: If provided, only clears the cache for the given list.
                         If None, clears the entire cache.
+            persistent: If False, persisted snapshots are kept.
         """
         if list_name:
             self._cache.pop(list_name, None)
+            if persistent and self.snapshot_cache is not None:
+                self.snapshot_cache.delete(self.cache_namespace, list_name)
         else:
             self._cache.clear()
+            if persistent and self.snapshot_cache is not None:
+                self.snapshot_cache.clear(self.cache_namespace)
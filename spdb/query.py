@@ -0,0 +1,155 @@
+import operator
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from spdb.model import BaseModel
+
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+    "in": lambda value, options: value in options,
+}
+"""Supported predicate operators, by their OData name."""
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime, converting aware values to UTC with a ``Z`` suffix.
+
+    A ``+hh:mm`` offset would not survive in the query string, as ``$filter``
+    is not URL-encoded and ``+`` is decoded as a space.
+    """
+    if value.tzinfo is None:
+        return value.isoformat()
+    value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return f"{value.isoformat()}Z"
+
+
+def format_value(value: Any) -> str:
+    """Format a Python value as an OData literal."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, datetime):
+        return f"datetime'{_format_datetime(value)}'"
+    if isinstance(value, str):
+        escaped = value.replace("'", "''")
+        return f"'{escaped}'"
+    return str(value)
+
+
+@dataclass(frozen=True)
+class Condition:
+    """A predicate on a single SharePoint column.
+
+    Conditions are expressed in terms of SharePoint columns (aliases), so a
+    provider can either push them down as an OData ``$filter`` or evaluate
+    them locally on raw items.
+
+    Example:
+        Condition("Hostname", "eq", "srv001").to_odata()
+        # "Hostname eq 'srv001'"
+    """
+
+    column: str
+    op: str = "eq"
+    value: Any = None
+
+    def __post_init__(self):
+        if self.op not in OPERATORS:
+            raise ValueError(
+                f"Unsupported operator '{self.op}', expected one of {list(OPERATORS)}"
+            )
+        if self.op == "in" and not self.value:
+            raise ValueError("Operator 'in' requires a non-empty collection")
+
+    def to_odata(self) -> str:
+        """Render the condition as an OData ``$filter`` expression."""
+        if self.op == "in":
+            options = " or ".join(
+                f"{self.column} eq {format_value(v)}" for v in self.value
+            )
+            return f"({options})"
+        return f"{self.column} {self.op} {format_value(self.value)}"
+
+    def matches(self, item: dict[str, Any]) -> bool:
+        """Evaluate the condition against a raw SharePoint item.
+
+        Multi-valued lookup columns match if any of their values match.
+        """
+        compare = OPERATORS[self.op]
+        for candidate in _resolve_column(item, self.column):
+            if candidate is None and self.op not in ("eq", "ne"):
+                continue
+            if isinstance(self.value, datetime) and isinstance(candidate, str):
+                candidate = datetime.fromisoformat(
+                    candidate.replace("Z", "+00:00")
+                )
+            if compare(candidate, self.value):
+                return True
+        return False
+
+
+def _resolve_column(item: dict[str, Any], column: str) -> list[Any]:
+    """Collect values of a column path like ``Owner/Title`` from a raw item."""
+    values = [item]
+    for part in column.split("/"):
+        resolved = []
+        for value in values:
+            if isinstance(value, list):
+                resolved.extend(
+                    v.get(part) for v in value if isinstance(v, dict)
+                )
+            elif isinstance(value, dict):
+                resolved.append(value.get(part))
+        values = resolved
+    return values
+
+
+def to_filter(conditions: list[Condition]) -> str:
+    """Combine conditions into a single OData ``$filter`` expression."""
+    return " and ".join(condition.to_odata() for condition in conditions)
+
+
+def build_conditions(
+    model_cls: type[BaseModel], where: Mapping[str, Any]
+) -> list[Condition]:
+    """Translate field-level predicates on a model into column conditions.
+
+    Keys are model field names, optionally suffixed with an operator, e.g.
+    ``{"hostname": "srv001", "id__ge": 10}``. A list, tuple or set value
+    without an explicit operator is treated as ``in``. Lookup fields are
+    compared on the ``Title`` of the looked-up item.
+
+    Args:
+        model_cls: The model the predicates refer to.
+        where: Mapping of field predicates to values.
+
+    Returns:
+        List of conditions on SharePoint columns.
+
+    Raises:
+        ValueError: If a field or operator is unknown.
+    """
+    lookups = model_cls.get_lookup_fields()
+    conditions = []
+    for key, value in where.items():
+        field_name, _, op = key.partition("__")
+        if not op:
+            op = "in" if isinstance(value, list | tuple | set) else "eq"
+        field_info = model_cls.model_fields.get(field_name)
+        if field_info is None:
+            raise ValueError(
+                f"Unknown field '{field_name}' for model {model_cls.__name__}"
+            )
+        column = field_info.alias or field_name
+        if field_name in lookups:
+            column = f"{column}/Title"
+        conditions.append(Condition(column, op, value))
+    return conditions
@@ -0,0 +1,264 @@
+import copy
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from spdb.base import SPDB
+from spdb.error import ModelWriteError
+from spdb.index import relation_key
+from spdb.model import BaseModel, TModel
+
+
+def _raw_value(value: Any) -> Any:
+    """Reduce expanded relations to their keys, so they compare by reference."""
+    if isinstance(value, list):
+        return [_raw_value(v) for v in value]
+    if isinstance(value, BaseModel):
+        return relation_key(value)
+    return value
+
+
+class Session:
+    """Unit of work writing changes of loaded models on commit.
+
+    Items read through the session are private copies whose field values
+    are snapshotted. On :meth:`commit`, only fields that differ from the
+    snapshot are sent, as ``MERGE`` payloads guarded by the ETag the item
+    was read with. All changes of a model share the same batch requests,
+    and models are written after the models they reference, so lookups to
+    newly created items resolve.
+
+    Example:
+        with Session(spdb) as session:
+            server = session.get_models_by_ids(Server, [1])[0]
+            server.location = "DC2"
+            session.add(Server(Id=0, Hostname="srv-new", Application="CRM"))
+    """
+
+    def __init__(self, spdb: SPDB, use_etags: bool = True):
+        """
+        Args:
+            spdb: SPDB instance the items are read from and written through.
+            use_etags: If True, updates and deletes fail with
+                :class:`spdb.error.WriteConflictError` when the item was
+                changed in SharePoint after it was read.
+        """
+        self.spdb = spdb
+        self.use_etags = use_etags
+        self._tracked: dict[tuple[str, Any], BaseModel] = {}
+        self._snapshots: dict[tuple[str, Any], dict[str, Any]] = {}
+        self._etags: dict[tuple[str, Any], str] = {}
+        self._new: list[BaseModel] = []
+        self._deleted: dict[tuple[str, Any], BaseModel] = {}
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def get_model_items(self, model_cls: type[TModel]) -> list[TModel]:
+        """Retrieve tracked copies of all items of a model."""
+        return [
+            self._track_copy(obj)
+            for obj in self.spdb.get_model_items(model_cls)
+        ]
+
+    def get_models_by_ids(
+        self, model_cls: type[TModel], ids: list[int | str]
+    ) -> list[TModel]:
+        """Retrieve tracked copies of items by their IDs."""
+        return [
+            self._track_copy(obj)
+            for obj in self.spdb.get_models_by_ids(model_cls, ids)
+        ]
+
+    def track(self, obj: TModel) -> TModel:
+        """Track changes of an item from now on.
+
+        Unlike items read through the session, ``obj`` itself is tracked, so
+        edits to it before :meth:`commit` also show in shared caches. The
+        ETag the item was loaded with is kept to guard its update.
+        """
+        key = self._key(obj)
+        self._tracked[key] = obj
+        self._snapshots[key] = self._snapshot(obj)
+        self._remember_etag(obj)
+        return obj
+
+    def add(self, obj: TModel) -> TModel:
+        """Create an item on commit; its ``id`` is set once it is created."""
+        self.spdb._check_model(type(obj))
+        self._new.append(obj)
+        return obj
+
+    def delete(self, obj: TModel) -> None:
+        """Delete an item on commit."""
+        for index, new in enumerate(self._new):
+            if new is obj:
+                del self._new[index]
+                return
+        key = self._key(obj)
+        if key not in self._tracked:
+            self._remember_etag(obj)
+        self._deleted[key] = obj
+
+    def dirty_fields(self, obj: BaseModel) -> list[str]:
+        """Get names of fields changed since the item was tracked."""
+        snapshot = self._snapshots.get(self._key(obj))
+        if snapshot is None:
+            return []
+        return [
+            field
+            for field, value in self._snapshot(obj).items()
+            if value != snapshot[field]
+        ]
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether committing would send any request."""
+        return bool(
+            self._new
+            or self._deleted
+            or any(self.dirty_fields(obj) for obj in self._tracked.values())
+        )
+
+    def commit(self) -> None:
+        """Write all pending changes, one batched write per model.
+
+        Raises:
+            ValueError: If a lookup value does not match a related item.
+            ModelWriteError: If writing to SharePoint fails. Changes
+                written before the failure, including those of earlier
+                batches of the failing model, are committed and no longer
+                pending, so calling :meth:`commit` again retries only the
+                remaining changes.
+        """
+        names = {type(obj).__name__ for obj in self._new}
+        names |= {key[0] for key in self._deleted}
+        names |= {
+            key[0]
+            for key, obj in self._tracked.items()
+            if self.dirty_fields(obj)
+        }
+        for model_cls in self._write_order(names):
+            self._commit_model(model_cls)
+
+    def rollback(self) -> None:
+        """Discard pending changes and restore tracked items to their snapshots."""
+        for key, obj in self._tracked.items():
+            for field in self.dirty_fields(obj):
+                obj.__dict__[field] = copy.deepcopy(self._snapshots[key][field])
+        self._new = []
+        self._deleted = {}
+
+    def _commit_model(self, model_cls: type[BaseModel]) -> None:
+        name = model_cls.__name__
+        new = [obj for obj in self._new if type(obj).__name__ == name]
+        deleted = [key[1] for key in self._deleted if key[0] == name]
+        updates = {}
+        for key, obj in self._tracked.items():
+            if key[0] != name or key in self._deleted:
+                continue
+            fields = self.dirty_fields(obj)
+            if fields:
+                payload = obj.to_sharepoint(self.spdb._lookup_id, fields)
+                updates[obj.id] = (obj, payload)
+        etags = {
+            item_id: self._etags[(name, item_id)]
+            for item_id in [*updates, *deleted]
+            if (name, item_id) in self._etags
+        }
+        try:
+            saved = self.spdb._write(model_cls, new, updates, deleted, etags)
+        except ModelWriteError as e:
+            self._written(
+                name,
+                new[: len(e.created)],
+                e.created,
+                [updates[obj.id][0] for obj in e.updated],
+                e.deleted,
+            )
+            raise
+        logging.info(
+            f"Committed {len(new)} new, {len(updates)} changed and"
+            f" {len(deleted)} deleted {name} items"
+        )
+        self._written(
+            name,
+            new,
+            saved[len(updates) :],
+            [obj for obj, _ in updates.values()],
+            deleted,
+        )
+
+    def _written(
+        self,
+        name: str,
+        new: list[BaseModel],
+        created: list[BaseModel],
+        updated: list[BaseModel],
+        deleted: list[Any],
+    ) -> None:
+        """Drop written changes of a model from the pending ones."""
+        written = {id(obj) for obj in new}
+        self._new = [obj for obj in self._new if id(obj) not in written]
+        for obj, cached in zip(new, created, strict=True):
+            obj.id = cached.id
+        for obj in [*updated, *new]:
+            self.track(obj)
+        for item_id in deleted:
+            self._deleted.pop((name, item_id), None)
+            self._tracked.pop((name, item_id), None)
+            self._snapshots.pop((name, item_id), None)
+            self._etags.pop((name, item_id), None)
+
+    def _write_order(self, names: Iterable[str]) -> list[type[BaseModel]]:
+        """Order models so that referenced models are written first."""
+        ordered: dict[str, type[BaseModel]] = {}
+        pending = set(names)
+
+        def visit(name: str, path: set[str]) -> None:
+            if name in ordered or name in path:
+                return
+            model_cls = self.spdb._models[name]
+            for rel_name in model_cls.get_relation_fields().values():
+                if rel_name in pending:
+                    visit(rel_name, path | {name})
+            ordered[name] = model_cls
+
+        for name in sorted(pending):
+            visit(name, set())
+        return list(ordered.values())
+
+    def _track_copy(self, obj: TModel) -> TModel:
+        key = self._key(obj)
+        tracked = self._tracked.get(key)
+        if tracked is None:
+            tracked = self.track(obj.model_copy(deep=True))
+        return tracked
+
+    def _remember_etag(self, obj: BaseModel) -> None:
+        """Keep the ETag an item was loaded with, read at tracking time.
+
+        Looking it up on commit would pick up the ETag of a newer version
+        loaded by a sync, or none after the cache was refreshed.
+        """
+        key = self._key(obj)
+        etag = self.spdb.get_etag(type(obj), obj.id) if self.use_etags else None
+        if etag is None:
+            self._etags.pop(key, None)
+        else:
+            self._etags[key] = etag
+
+    def _key(self, obj: BaseModel) -> tuple[str, Any]:
+        return type(obj).__name__, obj.id
+
+    def _snapshot(self, obj: BaseModel) -> dict[str, Any]:
+        return {
+            field: copy.deepcopy(_raw_value(obj.__dict__.get(field)))
+            for field in type(obj).model_fields
+        }
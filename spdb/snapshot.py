@@ -0,0 +1,125 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_SNAPSHOT_TTL = 300.0
+"""Seconds a snapshot is trusted before its list version is re-checked."""
+
+
+@dataclass
+class Snapshot:
+    """Raw payload of a SharePoint list persisted between process runs."""
+
+    items: list[dict[str, Any]]
+    version: str | None = None
+    select: list[str] | None = None
+    expand: list[str] | None = None
+    created_at: float = field(default_factory=time.time)
+
+    def matches(
+        self, select: list[str] | None, expand: list[str] | None
+    ) -> bool:
+        """Check that the snapshot was taken with the same projection."""
+        return self.select == select and self.expand == expand
+
+
+class SnapshotCache(ABC):
+    """Persistent storage for raw list payloads.
+
+    Subclass it to store snapshots elsewhere, e.g. in Redis or a blob store.
+    Snapshots are keyed by a provider namespace (usually the site URL) and
+    the list name.
+    """
+
+    ttl: float = DEFAULT_SNAPSHOT_TTL
+
+    @abstractmethod
+    def load(self, namespace: str, list_name: str) -> Snapshot | None:
+        """Return the stored snapshot, or None if there is none."""
+
+    @abstractmethod
+    def save(self, namespace: str, list_name: str, snapshot: Snapshot) -> None:
+        """Store a snapshot, replacing any previous one."""
+
+    @abstractmethod
+    def delete(self, namespace: str, list_name: str) -> None:
+        """Remove the stored snapshot if it exists."""
+
+    @abstractmethod
+    def clear(self, namespace: str) -> None:
+        """Remove all snapshots of a namespace."""
+
+    def is_fresh(self, snapshot: Snapshot) -> bool:
+        """Check whether a snapshot can be used without a version check."""
+        return time.time() - snapshot.created_at < self.ttl
+
+
+class FileSnapshotCache(SnapshotCache):
+    """Store snapshots as gzip-compressed JSON files in a directory.
+
+    Example:
+        provider = SharePointProvider(
+            url, user, password, snapshot_cache=FileSnapshotCache(".spdb")
+        )
+    """
+
+    def __init__(
+        self, directory: str | Path, ttl: float = DEFAULT_SNAPSHOT_TTL
+    ):
+        """
+        Args:
+            directory: Directory where snapshot files are written.
+            ttl: Seconds a snapshot is trusted before its version is re-checked.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _namespace_dir(self, namespace: str) -> Path:
+        digest = hashlib.sha256(namespace.encode("utf-8")).hexdigest()
+        return self.directory / digest[:16]
+
+    def _path(self, namespace: str, list_name: str) -> Path:
+        digest = hashlib.sha256(list_name.encode("utf-8")).hexdigest()
+        return self._namespace_dir(namespace) / f"{digest[:16]}.json.gz"
+
+    def load(self, namespace: str, list_name: str) -> Snapshot | None:
+        path = self._path(namespace, list_name)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return Snapshot(**json.load(f))
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning(f"Ignoring unreadable snapshot {path}: {e}")
+            return None
+
+    def save(self, namespace: str, list_name: str, snapshot: Snapshot) -> None:
+        path = self._path(namespace, list_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with (
+                os.fdopen(fd, "wb") as raw,
+                gzip.open(raw, "wt", encoding="utf-8") as f,
+            ):
+                json.dump(snapshot.__dict__, f, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        logging.debug(f"Saved snapshot of '{list_name}' to {path}")
+
+    def delete(self, namespace: str, list_name: str) -> None:
+        self._path(namespace, list_name).unlink(missing_ok=True)
+
+    def clear(self, namespace: str) -> None:
+        for path in self._namespace_dir(namespace).glob("*.json.gz"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,162 @@
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+RETRY_STATUS_CODES = frozenset({429, 503})
+"""HTTP status codes SharePoint uses to throttle clients."""
+
+
+def status_code(error: BaseException) -> int | None:
+    """Get the HTTP status code of a failed request, if it has one."""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Get the delay requested by the ``Retry-After`` header in seconds."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Client-side rate limiter shared by all threads of a provider.
+
+    Tokens are refilled at ``rate`` per second up to ``capacity``; every
+    request takes one token and waits while none are available. When the
+    server throttles a request, :meth:`pause` holds back all threads, so
+    they do not keep hitting the tenant limit in parallel.
+
+    Example:
+        limiter = TokenBucket(rate=10, capacity=20)
+        limiter.acquire()
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Args:
+            rate: Sustained number of requests per second.
+            capacity: Maximum burst of requests, defaults to ``rate``.
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(
+                    self._paused_until - now, (1 - self._tokens) / self.rate
+                )
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for at least ``seconds``."""
+        with self._lock:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + seconds
+            )
+
+
+@dataclass
+class RetryPolicy:
+    """Retry throttled requests with exponential backoff and jitter.
+
+    The delay before retry ``n`` is the server's ``Retry-After`` if given,
+    otherwise a random value up to ``backoff * 2**n`` capped at
+    ``max_backoff`` ("full jitter"), which spreads out retries of
+    concurrent clients.
+    """
+
+    max_retries: int = 5
+    backoff: float = 1.0
+    max_backoff: float = 60.0
+    status_codes: frozenset[int] = RETRY_STATUS_CODES
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Check whether a failed request may succeed when retried."""
+        return status_code(error) in self.status_codes
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """Seconds to wait before retrying after the given failed attempt."""
+        requested = retry_after(error)
+        if requested is not None:
+            return requested
+        return random.uniform(  # noqa: S311
+            0, min(self.max_backoff, self.backoff * 2**attempt)
+        )
+
+    def call(
+        self,
+        request: Callable[[], T],
+        limiter: TokenBucket | None = None,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> T:
+        """Run a request, retrying it while it is throttled.
+
+        ``request`` is called again on every attempt, so it must queue its
+        query anew rather than re-executing an already sent one.
+
+        Args:
+            request: Callable queuing and executing the request.
+            limiter: Optional rate limiter consulted before every attempt.
+            sleep: Function used to wait between attempts.
+
+        Returns:
+            The result of ``request``.
+
+        Raises:
+            Exception: The last error if it is not retryable or retries are
+                exhausted.
+        """
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return request()
+            except Exception as e:
+                if attempt >= self.max_retries or not self.is_retryable(e):
+                    raise
+                delay = self.delay(attempt, e)
+                logging.warning(
+                    f"Request throttled with status {status_code(e)}, retrying in {delay:.1f}s"
+                )
+                if limiter is not None:
+                    limiter.pause(delay)
+                sleep(delay)
+                attempt += 1
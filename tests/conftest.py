@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 import pytest
@@ -12,7 +13,18 @@ class MockMySPDB(MySPDB):
         self.provider = MockSharePointProvider(mock_data_dir=mock_data_dir)
 
 
+@pytest.fixture(scope="session")
+def data_dir() -> Path:
+    return Path(__file__).parent / "data"
+
+
+@pytest.fixture
+def writable_dir(data_dir, tmp_path) -> Path:
+    """Copy of the mock data that tests may write to."""
+    shutil.copytree(data_dir, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
 @pytest.fixture(scope="module")
-def my_mock_spdb() -> MockMySPDB:
-    data_path = Path(__file__).parent / "data"
-    return MockMySPDB(data_path)
+def my_mock_spdb(data_dir) -> MockMySPDB:
+    return MockMySPDB(data_dir)
@@ -0,0 +1,164 @@
+"""Tests for the asyncio provider and SPDB interfaces."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+from spdb.aio import AsyncSharePointProvider, AsyncSPDB
+from spdb.base import SPDB
+from spdb.mocks import MockSharePointProvider
+from spdb_example.models import Application, Server, Team
+
+
+def counting_provider(data_dir, delay=0.05):
+    """Mock provider counting list downloads and slowing them down."""
+    provider = MockSharePointProvider(data_dir)
+    original = provider.get_list_items
+    calls = []
+    lock = threading.Lock()
+
+    def get_list_items(list_name, *args, **kwargs):
+        with lock:
+            calls.append(list_name)
+        time.sleep(delay)
+        return original(list_name, *args, **kwargs)
+
+    provider.get_list_items = get_list_items
+    return provider, calls
+
+
+class TestAsyncSharePointProvider:
+    """Test single-flight requests of the async provider."""
+
+    def test_concurrent_requests_share_one_fetch(self, data_dir):
+        """Test that concurrent calls for one list trigger a single fetch."""
+        provider, calls = counting_provider(data_dir)
+        aprovider = AsyncSharePointProvider(provider)
+
+        async def main():
+            return await asyncio.gather(
+                *(aprovider.get_list_items("Server") for _ in range(5)),
+                aprovider.get_list_items("Application"),
+            )
+
+        results = asyncio.run(main())
+
+        assert sorted(calls) == ["Application", "Server"]
+        assert all(result is results[0] for result in results[:5])
+
+    def test_failure_is_shared_and_not_cached(self):
+        """Test that a failed fetch is raised to all waiters and retried."""
+        provider = Mock()
+        provider.fetch_list_items.side_effect = [
+            ConnectionError("boom"),
+            [{"Id": 1}],
+        ]
+        aprovider = AsyncSharePointProvider(provider)
+
+        async def main():
+            return await asyncio.gather(
+                aprovider.fetch_list_items("Server"),
+                aprovider.fetch_list_items("Server"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert asyncio.run(aprovider.fetch_list_items("Server")) == [{"Id": 1}]
+
+
+class TestAsyncSPDB:
+    """Test the async SPDB interface."""
+
+    def test_concurrent_cold_reads_load_once(self, data_dir):
+        """Test that concurrent cold reads load each list once."""
+        provider, calls = counting_provider(data_dir)
+        aspdb = AsyncSPDB(SPDB(provider, [Server, Application, Team]))
+
+        async def main():
+            return await asyncio.gather(
+                *(aspdb.get_model_items(Server) for _ in range(3)),
+                aspdb.get_model_items(Server, expanded=True),
+            )
+
+        *plain, expanded = asyncio.run(main())
+
+        assert sorted(calls) == ["Application", "Server"]
+        assert plain[0] is plain[1] is plain[2]
+        assert isinstance(expanded[0].application, Application)
+
+    def test_get_models_by_ids(self, data_dir):
+        """Test fetching by IDs on a cold and a warm cache."""
+        aspdb = AsyncSPDB(SPDB(MockSharePointProvider(data_dir), [Server]))
+
+        cold = asyncio.run(aspdb.get_models_by_ids(Server, [2, 1]))
+        asyncio.run(aspdb.get_model_items(Server))
+        warm = asyncio.run(aspdb.get_models_by_ids(Server, [2, 1]))
+
+        assert [s.id for s in cold] == [s.id for s in warm] == [2, 1]
+
+    def test_expansion_runs_off_the_event_loop(self, data_dir):
+        """Test that expanding and ID lookups run in worker threads."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+        aspdb = AsyncSPDB(spdb)
+        threads = []
+        expand = spdb._expand
+        index = spdb._index
+
+        def record(func):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        spdb._expand = record(expand)
+        spdb._index = record(index)
+
+        async def main():
+            await aspdb.get_model_items(Server, expanded=True)
+            await aspdb.get_models_by_ids(Server, [1], expanded=True)
+
+        asyncio.run(main())
+
+        assert threads
+        assert threading.main_thread() not in threads
+
+    def test_lazy_preloads_related_lists(self, data_dir):
+        """Test that lazy reads load and index every reachable list."""
+        provider, calls = counting_provider(data_dir, delay=0)
+        spdb = SPDB(provider, [Server, Application, Team])
+        aspdb = AsyncSPDB(spdb)
+
+        servers = asyncio.run(aspdb.get_model_items(Server, lazy=True))
+
+        assert sorted(calls) == ["Application", "Server", "Team"]
+        assert {"Application", "Team"} <= set(spdb._lookups)
+        assert isinstance(servers[0].application.owner, Team)
+        assert len(calls) == 3
+
+    def test_full_depth_preloads_related_lists(self, data_dir):
+        """Test that depth=None loads every reachable list before expanding."""
+        provider, calls = counting_provider(data_dir, delay=0)
+        spdb = SPDB(provider, [Server, Application, Team])
+        aspdb = AsyncSPDB(spdb)
+
+        servers = asyncio.run(
+            aspdb.get_model_items(Server, expanded=True, depth=None)
+        )
+
+        assert sorted(calls) == ["Application", "Server", "Team"]
+        assert isinstance(servers[0].application.owner, Team)
+        assert servers is spdb.get_model_items(Server, expanded=True, depth=2)
+
+    def test_refresh_cache(self, data_dir):
+        """Test that refreshing drops cached items."""
+        provider, calls = counting_provider(data_dir, delay=0)
+        aspdb = AsyncSPDB(SPDB(provider, [Server]))
+
+        asyncio.run(aspdb.get_model_items(Server))
+        asyncio.run(aspdb.refresh_cache(Server))
+        asyncio.run(aspdb.get_model_items(Server))
+
+        assert calls == ["Server", "Server"]
@@ -0,0 +1,106 @@
+"""Tests for the bounded, TTL-aware cache."""
+
+import pytest
+
+from spdb import cache as cache_module
+from spdb.cache import Cache, CacheBudget, approximate_size
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hits_and_misses():
+    cache = Cache()
+    cache["a"] = 1
+
+    assert cache["a"] == 1
+    assert cache.get("b") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_ttl_expiry(clock):
+    evicted = []
+    cache = Cache(ttl=10, on_evict=lambda k, v: evicted.append(k))
+    cache["a"] = 1
+    cache.set("b", 2, ttl=60)
+
+    clock[0] += 11
+
+    assert "a" not in cache
+    assert cache["b"] == 2
+    assert evicted == ["a"]
+    assert cache.stats.expirations == 1
+
+
+def test_lru_eviction_by_entries():
+    evicted = []
+    cache = Cache(max_entries=2, on_evict=lambda k, v: evicted.append(k))
+    cache["a"] = 1
+    cache["b"] = 2
+    _ = cache["a"]
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+    assert evicted == ["b"]
+    assert cache.stats.evictions == 1
+
+
+def test_lru_eviction_by_size():
+    cache = Cache(max_bytes=100, sizeof=len)
+    cache["a"] = "x" * 60
+    cache["b"] = "x" * 30
+    assert cache.size == 90
+
+    cache["c"] = "x" * 30
+
+    assert "a" not in cache
+    assert cache.size == 60
+
+
+def test_shared_budget_evicts_least_recently_used():
+    evicted = []
+    budget = CacheBudget(max_bytes=100)
+    models = Cache(
+        sizeof=len, budget=budget, on_evict=lambda k, v: evicted.append(k)
+    )
+    indexes = Cache(sizeof=len, budget=budget)
+    models["a"] = "x" * 40
+    indexes["a"] = "x" * 40
+    _ = models["a"]
+
+    indexes["b"] = "x" * 30
+
+    assert "a" not in indexes
+    assert "a" in models
+    assert budget.size == 70
+
+    models["c"] = "x" * 40
+
+    assert evicted == ["a"]
+    assert list(indexes) == ["b"]
+    assert budget.size == 70
+
+
+def test_explicit_delete_does_not_notify():
+    evicted = []
+    cache = Cache(on_evict=lambda k, v: evicted.append(k))
+    cache["a"] = 1
+    cache.pop("a")
+    cache["b"] = 2
+    cache.clear()
+
+    assert not evicted
+    assert len(cache) == 0
+
+
+def test_approximate_size_samples_lists():
+    rows = [{"Id": i, "Name": f"row-{i}"} for i in range(10_000)]
+
+    size = approximate_size(rows)
+
+    assert size > approximate_size(rows[:100]) * 50
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import Annotated
+
+import pytest
+from pydantic import Field
+
+from spdb.base import SPDB
+from spdb.columnar import column_type, to_columns
+from spdb.mocks import MockSharePointProvider
+from spdb.model import BaseModel
+from spdb_example.models import Application, Role, Server, Team
+
+
+class Ticket(BaseModel):
+    id: Annotated[int, Field(..., alias="Id")]
+    created: Annotated[datetime | None, Field(None, alias="Created")]
+
+
+def test_column_type():
+    assert column_type(Server.model_fields["application"].annotation) is str
+    assert column_type(Server.model_fields["roles"].annotation) == list[str]
+    assert column_type(Server.model_fields["location"].annotation) is str
+    assert column_type(int | str) is None
+
+
+def test_to_columns_from_raw_items():
+    raw = [
+        {
+            "Id": 1,
+            "Hostname": "srv001",
+            "Application": {"Id": 1, "Title": "CRM"},
+            "Roles": [{"Id": 1, "Title": "Web Server"}],
+        },
+        {"Id": 2, "Hostname": "srv002", "Application": None, "Location": "DC2"},
+    ]
+
+    columns = to_columns(Server, raw)
+
+    assert columns["id"] == [1, 2]
+    assert columns["application"] == ["CRM", None]
+    assert columns["roles"] == [["Web Server"], []]
+    assert columns["location"] == [None, "DC2"]
+    assert columns["is_virtual"] == [False, False]
+
+
+def test_to_columns_parses_datetimes():
+    columns = to_columns(Ticket, [{"Id": 1, "Created": "2024-05-01T10:00:00Z"}])
+
+    assert columns["created"] == [datetime(2024, 5, 1, 10, tzinfo=timezone.utc)]
+
+
+@pytest.fixture
+def spdb(data_dir):
+    return SPDB(
+        MockSharePointProvider(data_dir), [Server, Application, Role, Team]
+    )
+
+
+def test_spdb_to_columns(spdb):
+    columns = spdb.to_columns(Server)
+
+    servers = spdb.get_model_items(Server)
+    assert columns["hostname"] == [s.hostname for s in servers]
+    assert columns["roles"] == [s.roles for s in servers]
+
+
+def test_spdb_to_arrow(spdb):
+    pa = pytest.importorskip("pyarrow")
+
+    table = spdb.to_arrow(Server)
+
+    assert table.num_rows == 20
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("roles").type == pa.list_(pa.string())
+    assert table.column("application").to_pylist() == [
+        s.application for s in spdb.get_model_items(Server)
+    ]
+
+
+def test_spdb_to_arrow_paged(data_dir):
+    pytest.importorskip("pyarrow")
+    spdb = SPDB(MockSharePointProvider(data_dir), [Server], page_size=7)
+
+    table = spdb.to_arrow(Server)
+
+    assert table.num_rows == 20
+    assert table.column("id").to_pylist() == list(range(1, 21))
+
+
+def test_spdb_write_parquet(spdb, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "servers.parquet"
+
+    spdb.write_parquet(Server, path)
+
+    assert pq.read_table(path).equals(spdb.to_arrow(Server))
@@ -0,0 +1,149 @@
+import sys
+
+import pytest
+
+from spdb.base import SPDB
+from spdb.compact import CompactList
+from spdb.index import CompactIndex
+from spdb.mocks import MockSharePointProvider
+from spdb_example.models import Application, Role, Server, Team
+
+
+@pytest.fixture
+def servers(data_dir):
+    spdb = SPDB(MockSharePointProvider(data_dir), [Server])
+    return spdb.get_model_items(Server)
+
+
+def test_items_round_trip(servers):
+    compact = CompactList(Server, servers)
+
+    assert len(compact) == len(servers)
+    assert list(compact) == servers
+    assert compact[-1] == servers[-1]
+    assert compact[2:4] == servers[2:4]
+    assert compact[0].model_fields_set == servers[0].model_fields_set
+    with pytest.raises(IndexError):
+        compact[len(servers)]
+
+
+def test_strings_and_lists_are_shared(servers):
+    compact = CompactList(Server, servers)
+
+    first, second = compact[0], compact[1]
+    assert first.location is second.location
+    first.roles.append("Cache")
+    assert "Cache" not in compact[0].roles
+
+
+def test_get_by_ids(servers):
+    compact = CompactList(Server, servers)
+
+    found = compact.get_by_ids([3, 999, 1])
+
+    assert list(found) == [3, 1]
+    assert found[3] == servers[2]
+
+
+def test_get_by_ids_unsorted(servers):
+    compact = CompactList(Server, reversed(servers))
+
+    assert compact.get_by_ids([3])[3] == servers[2]
+
+
+def test_smaller_than_models(servers):
+    compact = CompactList(Server, servers * 50)
+
+    assert sys.getsizeof(compact) < sum(
+        sys.getsizeof(s.__dict__) for s in servers * 50
+    )
+
+
+def test_merge_replaces_appends_and_deletes(servers):
+    compact = CompactList(Server, servers[:3])
+    changed = servers[1].model_copy(
+        update={"location": "DC9", "roles": ["New Role"], "is_virtual": None}
+    )
+
+    merged = compact.merge([changed, servers[3]], deleted={servers[0].id})
+
+    assert list(merged) == [changed, servers[2], servers[3]]
+    assert list(compact) == servers[:3]
+    assert merged.get_by_ids([servers[3].id]) == {servers[3].id: servers[3]}
+
+
+class TestSPDBCompact:
+    @pytest.fixture
+    def spdb(self, data_dir):
+        return SPDB(
+            MockSharePointProvider(data_dir),
+            [Server, Application, Role, Team],
+            compact=True,
+        )
+
+    def test_cached_as_compact(self, spdb, servers):
+        items = spdb.get_model_items(Server)
+
+        assert isinstance(items, CompactList)
+        assert list(items) == servers
+        assert spdb.get_models_by_ids(Server, [4, 2]) == [
+            servers[3],
+            servers[1],
+        ]
+
+    def test_expand_and_find(self, spdb):
+        expanded = spdb.get_model_items(Server, expanded=True)
+
+        assert isinstance(expanded[0].application, Application)
+        assert [s.id for s in spdb.find(Server, "location", "DC1")] == [
+            s.id for s in spdb.get_model_items(Server) if s.location == "DC1"
+        ]
+
+    def test_find_and_expand_build_only_needed_rows(self, spdb, monkeypatch):
+        built = []
+        build = CompactList._build
+        monkeypatch.setattr(
+            CompactList,
+            "_build",
+            lambda self, row: built.append(self.model_cls) or build(self, row),
+        )
+        servers = spdb.get_model_items(Server)
+
+        found = spdb.find(Server, "location", "DC1")
+        assert built.count(Server) == len(found) < len(servers)
+
+        built.clear()
+        expanded = spdb.get_model_items(Server, expanded=True)
+        referenced = {s.application.name for s in expanded}
+        assert built.count(Server) == len(servers)
+        assert built.count(Application) == len(referenced)
+        assert expanded[0].application is next(
+            s.application
+            for s in expanded[1:]
+            if s.application.name == expanded[0].application.name
+        )
+
+    def test_index_follows_writes(self, writable_dir):
+        spdb = SPDB(
+            MockSharePointProvider(writable_dir), [Server, Application, Role]
+        )
+        spdb.compact = True
+        server = spdb.get_model_items(Server)[0]
+        assert spdb.find(Server, "location", "DC9") == []
+
+        spdb.save_many(Server, [server.model_copy(update={"location": "DC9"})])
+
+        assert [s.id for s in spdb.find(Server, "location", "DC9")] == [
+            server.id
+        ]
+        assert isinstance(spdb._index(Server), CompactIndex)
+
+    def test_model_opt_in(self, data_dir):
+        class CompactRole(Role):
+            _list_name = "Role"
+            _compact = True
+
+        spdb = SPDB(MockSharePointProvider(data_dir), [CompactRole, Server])
+
+        assert isinstance(spdb.get_model_items(CompactRole), CompactList)
+        assert isinstance(spdb.get_model_items(Server), list)
@@ -0,0 +1,107 @@
+"""Tests for hash indexes over cached models."""
+
+import pytest
+
+from spdb.compact import CompactList
+from spdb.index import CompactIndex, ModelIndex, relation_key
+from spdb_example.models import Role, Server
+
+
+def make_server(id_, location, roles):
+    return Server(
+        Id=id_,
+        Hostname=f"srv{id_}",
+        Application="App",
+        Location=location,
+        Roles=[{"Title": role} for role in roles],
+    )
+
+
+@pytest.fixture
+def servers():
+    return [
+        make_server(1, "DC1", ["Web", "Cache"]),
+        make_server(2, "DC1", ["Web"]),
+        make_server(3, "DC2", []),
+    ]
+
+
+def test_relation_key():
+    assert relation_key(Role(Id=1, Name="Web")) == "Web"
+    assert relation_key(make_server(7, None, [])) == 7
+
+
+def test_id_and_key_index(servers):
+    index = ModelIndex(servers)
+
+    assert index.by_id[2] is servers[1]
+    assert index.by_key[3] is servers[2]
+    assert index.find("id", 1) == [servers[0]]
+    assert index.find("id", 99) == []
+    assert len(index) == 3
+
+
+def test_secondary_and_multi_valued_index(servers):
+    index = ModelIndex(servers, fields=["location", "roles"])
+
+    assert index.find("location", "DC1") == servers[:2]
+    assert index.find("roles", "Web") == servers[:2]
+    assert index.find("roles", "Cache") == [servers[0]]
+    assert index.find("roles", "Missing") == []
+    with pytest.raises(KeyError):
+        index.find("hostname", "srv1")
+
+
+def test_add_field_on_demand(servers):
+    index = ModelIndex(servers)
+    index.add_field("hostname")
+
+    assert index.fields == ["hostname"]
+    assert index.find("hostname", "srv2") == [servers[1]]
+
+
+def test_update_in_place(servers):
+    index = ModelIndex(servers, fields=["roles"])
+    replacement = make_server(1, "DC2", ["Cache"])
+
+    index.add(replacement)
+    index.remove(servers[1])
+
+    assert index.by_id[1] is replacement
+    assert index.find("roles", "Web") == []
+    assert index.find("roles", "Cache") == [replacement]
+    assert 2 not in index.by_id
+
+
+def test_compact_index_matches_model_index(servers):
+    compact = CompactList(Server, servers)
+    index = CompactIndex(compact, fields=["location", "roles"])
+
+    assert index.by_id[2] == servers[1]
+    assert index.by_key[3] == servers[2]
+    assert 99 not in index.by_id
+    assert index.find("id", 1) == [servers[0]]
+    assert index.find("location", "DC1") == servers[:2]
+    assert index.find("roles", "Cache") == [servers[0]]
+    assert index.find("roles", "Missing") == []
+    assert len(index) == 3
+    with pytest.raises(KeyError):
+        index.find("hostname", "srv1")
+
+
+def test_compact_index_builds_only_returned_rows(servers, monkeypatch):
+    compact = CompactList(Server, servers)
+    built = []
+    build = CompactList._build
+    monkeypatch.setattr(
+        CompactList,
+        "_build",
+        lambda self, row: built.append(row) or build(self, row),
+    )
+
+    index = CompactIndex(compact, fields=["location"])
+    index.add_field("roles")
+    assert built == []
+
+    index.find("roles", "Web")
+    assert built == [0, 1]
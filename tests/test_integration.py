@@ -1,13 +1,30 @@
 """Integration tests for SPDB error handling and edge cases."""
 
-from unittest.mock import Mock
+import json
+import threading
+import time
+from typing import Annotated
+from unittest.mock import Mock, patch
 
 import pytest
+from pydantic import Field
 
+from spdb import base as base_module
+from spdb import cache as cache_module
 from spdb.base import SPDB
-from spdb.error import ModelLoadError
+from spdb.compact import CompactList
+from spdb.error import ModelLoadError, RelationCycleError
 from spdb.mocks import MockSharePointProvider
-from spdb_example.models import Application, Server
+from spdb.model import BaseModel, LookupField
+from spdb_example.models import Application, Role, Server, Team
+
+
+class Employee(BaseModel):
+    id: Annotated[int, Field(alias="Id")]
+    name: Annotated[str, Field(alias="Name")]
+    manager: Annotated[
+        "Employee | str | None", LookupField, Field(None, alias="Manager")
+    ]
 
 
 class TestSPDBErrorHandling:
@@ -38,6 +55,41 @@ class TestSPDBErrorHandling:
         with pytest.raises(ModelLoadError):
             spdb.get_model_items(Server)
 
+    def test_load_pushes_down_projection(self):
+        """Test that model columns are passed to the provider."""
+        mock_provider = Mock()
+        mock_provider.get_list_items.return_value = []
+
+        spdb = SPDB(mock_provider, [Application])
+        spdb.get_model_items(Application)
+
+        mock_provider.get_list_items.assert_called_once_with(
+            "Application",
+            select=[
+                "Id",
+                "Name",
+                "Version",
+                "Language",
+                "Is Active",
+                "Owner/Id",
+                "Owner/Title",
+                "Modified",
+            ],
+            expand=["Owner"],
+        )
+
+    def test_paged_load_provider_failure(self):
+        """Test that failures while streaming pages raise ModelLoadError."""
+        mock_provider = Mock()
+        mock_provider.iter_list_pages.side_effect = Exception(
+            "Connection failed"
+        )
+
+        spdb = SPDB(mock_provider, [Server], page_size=10)
+
+        with pytest.raises(ModelLoadError):
+            spdb.get_model_items(Server)
+
     def test_relationship_expansion_with_missing_data(self, tmp_path):
         """Test relationship expansion when referenced data is missing."""
         # Server references Application that doesn't exist
@@ -65,6 +117,122 @@ class TestSPDBErrorHandling:
 class TestSPDBPerformance:
     """Test performance characteristics and optimization."""
 
+    def test_paged_loading(self, tmp_path):
+        """Test that paged loading streams pages and skips the raw cache."""
+        data = [
+            {
+                "Id": i,
+                "Hostname": f"server-{i:04d}",
+                "Application": {"Id": 1, "Title": "Test App"},
+            }
+            for i in range(25)
+        ]
+        data.append({"Id": "invalid_id"})
+        (tmp_path / "Server.json").write_text(json.dumps(data))
+
+        provider = MockSharePointProvider(tmp_path)
+        spdb = SPDB(provider, [Server], page_size=10)
+
+        servers = spdb.get_model_items(Server)
+        assert [server.id for server in servers] == list(range(25))
+        assert "Server" not in provider._cache
+
+    def test_iter_model_items(self, tmp_path):
+        """Test streaming models page by page."""
+        data = [
+            {"Id": i, "Hostname": f"server-{i}", "Application": "App"}
+            for i in range(5)
+        ]
+        (tmp_path / "Server.json").write_text(json.dumps(data))
+
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Server])
+        pages = list(spdb.iter_model_items(Server, page_size=2))
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert "Server" not in spdb._cache
+
+    def test_batch_validation_skips_invalid_rows(self, tmp_path, monkeypatch):
+        """Test that a failing batch falls back to per-row validation."""
+        monkeypatch.setattr(base_module, "VALIDATION_BATCH_SIZE", 4)
+        data = [
+            {"Id": i, "Hostname": f"server-{i}", "Application": "App"}
+            for i in range(10)
+        ]
+        data[5] = {"Id": "invalid_id"}
+        (tmp_path / "Server.json").write_text(json.dumps(data))
+
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Server])
+        servers = spdb.get_model_items(Server)
+
+        assert [server.id for server in servers] == [0, 1, 2, 3, 4, 6, 7, 8, 9]
+
+    @pytest.mark.parametrize("model_trusted", [False, True])
+    def test_trusted_mode_matches_validation(
+        self, data_dir, monkeypatch, model_trusted
+    ):
+        """Test that trusted construction yields the validated models."""
+        validated = SPDB(MockSharePointProvider(data_dir), [Server])
+        expected = validated.get_model_items(Server)
+
+        monkeypatch.setattr(Server, "_trusted", model_trusted)
+        monkeypatch.setattr(
+            base_module, "_validate_items", Mock(side_effect=AssertionError)
+        )
+        monkeypatch.setattr(
+            Server, "get_list_adapter", Mock(side_effect=AssertionError)
+        )
+        trusted = SPDB(
+            MockSharePointProvider(data_dir),
+            [Server],
+            trusted=not model_trusted,
+        )
+
+        assert trusted.get_model_items(Server) == expected
+
+    def test_trusted_mode_runs_no_validator(self, tmp_path, monkeypatch):
+        """Test that trusted construction keeps raw values as they are."""
+        raw_items = [
+            {"Id": 1, "Hostname": " padded ", "Application": {"Title": "App"}},
+            {"Id": "2", "Hostname": "srv2", "Application": "App"},
+        ]
+        monkeypatch.setattr(
+            Server,
+            "__pydantic_validator__",
+            Mock(validate_python=Mock(side_effect=AssertionError)),
+        )
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Server], trusted=True)
+
+        servers = spdb._build_model_items(Server, raw_items)
+
+        assert [s.hostname for s in servers] == [" padded ", "srv2"]
+        assert servers[1].id == "2"
+        assert servers[0].application == "App"
+        assert servers[0].roles == []
+
+    def test_process_pool_building(self, tmp_path, caplog):
+        """Test that chunks validated in processes keep the input order."""
+        data = [
+            {"Id": i, "Hostname": f"server-{i}", "Application": "App"}
+            for i in range(20)
+        ]
+        data[3] = {"Id": "invalid_3"}
+        data[14] = {"Id": "invalid_14"}
+        (tmp_path / "Server.json").write_text(json.dumps(data))
+
+        spdb = SPDB(
+            MockSharePointProvider(tmp_path),
+            [Server],
+            processes=2,
+            process_chunk_size=6,
+        )
+        servers = spdb.get_model_items(Server)
+
+        expected = [i for i in range(20) if i not in (3, 14)]
+        assert [server.id for server in servers] == expected
+        warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+        assert len(warnings) == 1
+        assert "Skipping 2 invalid Server items" in warnings[0].message
+
     def test_caching_effectiveness(self, tmp_path):
         """Test that caching reduces provider calls."""
         mock_file = tmp_path / "Server.json"
@@ -119,3 +287,793 @@ class TestSPDBPerformance:
         subset = spdb.get_models_by_ids(Server, [1, 2, 3])
         assert len(subset) == 3
         assert all(server.id in [1, 2, 3] for server in subset)
+
+
+class TestSPDBConcurrentLoading:
+    """Test parallel loading of several lists."""
+
+    def test_lists_fetched_concurrently(self, data_dir):
+        """Test that all registered lists are fetched at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        class BarrierProvider(MockSharePointProvider):
+            def get_list_items(self, list_name, **kwargs):
+                barrier.wait()
+                return super().get_list_items(list_name, **kwargs)
+
+        spdb = SPDB(
+            BarrierProvider(data_dir),
+            [Server, Application, Role, Team],
+            max_workers=4,
+        )
+
+        spdb.load_models()
+        assert set(spdb._cache) == {"Server", "Application", "Role", "Team"}
+
+    def test_expansion_loads_only_related_models(self, data_dir):
+        """Test that expanding a model skips unrelated lists."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir),
+            [Server, Application, Role, Team],
+        )
+
+        spdb.get_model_items(Server, expanded=True)
+        assert set(spdb._cache) == {"Server", "Application", "Role"}
+
+        spdb.get_model_items(Role, expanded=True)
+        assert "Team" not in spdb._cache
+
+    def test_related_models_depth(self, data_dir):
+        """Test walking the relation graph over several hops."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir),
+            [Server, Application, Role, Team],
+        )
+
+        assert set(spdb._related_models(Server)) == {Application, Role}
+        assert set(spdb._related_models(Server, depth=2)) == {
+            Application,
+            Role,
+            Team,
+        }
+        assert spdb._related_models(Team) == []
+
+    def test_sequential_loading(self, data_dir):
+        """Test that max_workers=1 loads lists one after another."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir),
+            [Server, Application, Role, Team],
+            max_workers=1,
+        )
+
+        spdb.load_models([Application, Team])
+        assert set(spdb._cache) == {"Application", "Team"}
+
+    def test_concurrent_failure_raises(self, tmp_path):
+        """Test that a failing list aborts parallel loading."""
+        (tmp_path / "Role.json").write_text('[{"Id": 1, "Name": "Web"}]')
+
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Role, Team])
+
+        with pytest.raises(ModelLoadError):
+            spdb.load_models()
+
+    def test_batch_loading(self, data_dir):
+        """Test that lists loaded together are requested in one batch."""
+        provider = MockSharePointProvider(data_dir)
+        spdb = SPDB(provider, [Server, Application, Role], batch=True)
+
+        with patch.object(
+            provider, "_fetch_many", wraps=provider._fetch_many
+        ) as fetch_many:
+            spdb.get_model_items(Server, expanded=True)
+
+        fetch_many.assert_called_once()
+        assert set(fetch_many.call_args.args[0]) == {"Application", "Role"}
+        assert set(spdb._cache) == {"Server", "Application", "Role"}
+
+    def test_concurrent_cold_reads_fetch_once(self, data_dir):
+        """Test that threads missing the cache together share one load."""
+        calls = []
+        start = threading.Barrier(8, timeout=5)
+
+        class SlowProvider(MockSharePointProvider):
+            def fetch_list_items(self, list_name, *args, **kwargs):
+                calls.append(list_name)
+                time.sleep(0.05)
+                return super().fetch_list_items(list_name, *args, **kwargs)
+
+        spdb = SPDB(SlowProvider(data_dir), [Server, Application, Role])
+        results = []
+
+        def read():
+            start.wait()
+            results.append(spdb.get_model_items(Server, expanded=True))
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(calls) == ["Application", "Role", "Server"]
+        assert len(results) == 8
+
+
+class TestSPDBQuery:
+    """Test server-side filtering."""
+
+    def test_query_filters_items(self, data_dir):
+        """Test that predicates are evaluated by the provider."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+
+        servers = spdb.query(Server, where={"location": "DC1", "id__le": 5})
+
+        assert servers
+        assert all(s.location == "DC1" and s.id <= 5 for s in servers)
+        assert "Server" not in spdb._cache
+
+    def test_query_lookup_field_expanded(self, data_dir):
+        """Test filtering on a lookup column with expansion."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir), [Server, Application, Role]
+        )
+
+        servers = spdb.query(
+            Server, where={"application": "Inventory App"}, expanded=True
+        )
+
+        assert servers
+        assert all(s.application.name == "Inventory App" for s in servers)
+
+    def test_get_models_by_ids_cold_cache_filters_remotely(self, data_dir):
+        """Test that uncached lookups by ID fetch only matching items."""
+        provider = MockSharePointProvider(data_dir)
+        provider.get_list_items = Mock(side_effect=AssertionError)
+        spdb = SPDB(provider, [Server])
+
+        servers = spdb.get_models_by_ids(Server, [2, 4])
+
+        assert [s.id for s in servers] == [2, 4]
+        assert spdb.get_models_by_ids(Server, []) == []
+
+    def test_get_models_by_ids_cold_cache_chunks_filter(
+        self, data_dir, monkeypatch
+    ):
+        """Test that many uncached IDs are fetched in bounded filters."""
+        monkeypatch.setattr(base_module, "ID_FILTER_CHUNK_SIZE", 3)
+        provider = MockSharePointProvider(data_dir)
+        spdb = SPDB(provider, [Server])
+
+        with patch.object(
+            provider, "fetch_list_items", wraps=provider.fetch_list_items
+        ) as fetch:
+            servers = spdb.get_models_by_ids(Server, [7, 1, 5, 2, 9, 4, 1])
+
+        assert [s.id for s in servers] == [7, 1, 5, 2, 9, 4, 1]
+        assert fetch.call_count == 2
+        assert all(
+            len(call.kwargs["where"][0].value) <= 3
+            for call in fetch.call_args_list
+        )
+
+
+class TestSPDBSync:
+    """Test incremental synchronization."""
+
+    @staticmethod
+    def write_apps(path, apps):
+        (path / "Application.json").write_text(json.dumps(apps))
+
+    def test_sync_merges_changes_and_deletes(self, tmp_path):
+        """Test that only changed items are rebuilt and deletes are dropped."""
+        self.write_apps(
+            tmp_path,
+            [
+                {"Id": 1, "Name": "App1", "Modified": "2024-01-01T00:00:00Z"},
+                {"Id": 2, "Name": "App2", "Modified": "2024-01-01T00:00:00Z"},
+                {"Id": 3, "Name": "App3", "Modified": "2024-01-02T00:00:00Z"},
+            ],
+        )
+        provider = MockSharePointProvider(tmp_path)
+        spdb = SPDB(provider, [Application])
+        apps = spdb.get_model_items(Application)
+        unchanged = apps[0]
+        assert spdb._sync_marks["Application"] == "2024-01-02T00:00:00Z"
+
+        self.write_apps(
+            tmp_path,
+            [
+                {"Id": 1, "Name": "App1", "Modified": "2024-01-01T00:00:00Z"},
+                {"Id": 3, "Name": "App3b", "Modified": "2024-01-03T00:00:00Z"},
+                {"Id": 4, "Name": "App4", "Modified": "2024-01-03T00:00:00Z"},
+            ],
+        )
+        spdb.sync()
+
+        apps = spdb.get_model_items(Application)
+        assert [(a.id, a.name) for a in apps] == [
+            (1, "App1"),
+            (3, "App3b"),
+            (4, "App4"),
+        ]
+        assert apps[0] is unchanged
+        assert spdb._sync_marks["Application"] == "2024-01-03T00:00:00Z"
+        assert [i["Id"] for i in provider._cache["Application"]] == [1, 3, 4]
+
+    def test_sync_updates_indexes(self, tmp_path):
+        """Test that indexes follow changes and deletes on sync."""
+        self.write_apps(
+            tmp_path,
+            [
+                {"Id": 1, "Name": "App1", "Modified": "2024-01-01T00:00:00Z"},
+                {"Id": 2, "Name": "App2", "Modified": "2024-01-01T00:00:00Z"},
+            ],
+        )
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Application])
+        assert spdb.find(Application, "name", "App2")
+
+        self.write_apps(
+            tmp_path,
+            [{"Id": 1, "Name": "App1b", "Modified": "2024-01-02T00:00:00Z"}],
+        )
+        spdb.sync()
+
+        assert spdb.find(Application, "name", "App2") == []
+        assert [a.id for a in spdb.find(Application, "name", "App1b")] == [1]
+        assert spdb.get_models_by_ids(Application, [1, 2])[0].name == "App1b"
+
+    def test_sync_without_changes_keeps_memos(self, tmp_path):
+        """Test that a sync finding no changes keeps derived data."""
+        self.write_apps(
+            tmp_path,
+            [{"Id": 1, "Name": "App1", "Modified": "2024-01-01T00:00:00Z"}],
+        )
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Application])
+        apps = spdb.get_model_items(Application)
+        lazy = spdb.get_model_items(Application, lazy=True)
+
+        spdb.sync()
+
+        assert spdb.get_model_items(Application) is apps
+        assert spdb.get_model_items(Application, lazy=True) is lazy
+
+    def test_sync_merges_compact_rows(self, tmp_path, monkeypatch):
+        """Test that syncing a compact list encodes only changed rows."""
+        self.write_apps(
+            tmp_path,
+            [
+                {"Id": 1, "Name": "App1", "Modified": "2024-01-01T00:00:00Z"},
+                {"Id": 2, "Name": "App2", "Modified": "2024-01-01T00:00:00Z"},
+            ],
+        )
+        spdb = SPDB(
+            MockSharePointProvider(tmp_path), [Application], compact=True
+        )
+        spdb.get_model_items(Application)
+        monkeypatch.setattr(
+            CompactList, "__init__", Mock(side_effect=AssertionError)
+        )
+
+        self.write_apps(
+            tmp_path,
+            [
+                {"Id": 2, "Name": "App2b", "Modified": "2024-01-02T00:00:00Z"},
+                {"Id": 3, "Name": "App3", "Modified": "2024-01-02T00:00:00Z"},
+            ],
+        )
+        spdb.sync()
+
+        apps = spdb.get_model_items(Application)
+        assert isinstance(apps, CompactList)
+        assert [(a.id, a.name) for a in apps] == [(2, "App2b"), (3, "App3")]
+
+    def test_sync_without_modified_reloads(self, tmp_path):
+        """Test that lists without a Modified column are fully reloaded."""
+        self.write_apps(tmp_path, [{"Id": 1, "Name": "App1"}])
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Application])
+        spdb.get_model_items(Application)
+
+        self.write_apps(tmp_path, [{"Id": 1, "Name": "Renamed"}])
+        spdb.sync(Application)
+
+        assert spdb.get_model_items(Application)[0].name == "Renamed"
+
+
+class TestSPDBCacheBounds:
+    """Test cache expiry and eviction in SPDB."""
+
+    def test_eviction_drops_derived_data(self, data_dir):
+        """Test that evicting a model also drops its lookups and raw payload."""
+        provider = MockSharePointProvider(data_dir)
+        spdb = SPDB(provider, [Server, Application, Role])
+        spdb.get_model_items(Server, expanded=True)
+        assert "Application" in spdb._lookups
+
+        spdb._cache.max_entries = 1
+        spdb.get_model_items(Server)
+        spdb._cache.set("Server", spdb._cache["Server"])
+
+        assert set(spdb._cache) == {"Server"}
+        assert "Application" not in spdb._lookups
+        assert "Application" not in provider._cache
+        assert spdb.cache_stats["models"].evictions == 2
+
+    def test_memory_limit_covers_derived_data(self, data_dir):
+        """Test that indexes and expansions count towards the memory limit."""
+        provider = MockSharePointProvider(data_dir)
+        spdb = SPDB(
+            provider, [Server, Application, Role], cache_max_bytes=2**40
+        )
+        expected = spdb.get_model_items(Server, expanded=True)
+        assert spdb._lookups.size > 0
+        assert spdb._expanded.size > 0
+        limit = spdb._cache.budget.size - spdb._lookups.size // 2
+
+        spdb = SPDB(
+            provider, [Server, Application, Role], cache_max_bytes=limit
+        )
+
+        assert spdb.get_model_items(Server, expanded=True) == expected
+        assert spdb._cache.budget.size <= limit
+        assert spdb._cache.stats.evictions + spdb._lookups.stats.evictions
+
+    def test_model_ttl_reloads(self, data_dir, monkeypatch):
+        """Test that a model's own TTL overrides the SPDB default."""
+        now = [0.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(Role, "_cache_ttl", 5)
+        spdb = SPDB(MockSharePointProvider(data_dir), [Role, Team])
+
+        roles = spdb.get_model_items(Role)
+        teams = spdb.get_model_items(Team)
+        now[0] = 10
+
+        assert spdb.get_model_items(Team) is teams
+        assert spdb.get_model_items(Role) is not roles
+
+    def test_expired_model_drops_indexes(self, writable_dir, monkeypatch):
+        """Test that lookups are not answered from indexes of expired items."""
+        now = [0.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        spdb = SPDB(
+            MockSharePointProvider(writable_dir),
+            [Server, Application],
+            cache_ttl=5,
+        )
+        app = spdb.get_models_by_ids(Application, [1])[0]
+        assert spdb.find(Server, "location", "DC1")
+        assert spdb.related(app, Server)
+
+        (writable_dir / "Server.json").write_text("[]")
+        now[0] = 10
+
+        assert spdb.find(Server, "location", "DC1") == []
+        assert spdb.related(app, Server) == []
+        assert spdb.get_model_items(Server) == []
+
+    def test_expired_model_drops_expansions(self, writable_dir, monkeypatch):
+        """Test that memoized expansions expire with the items they contain."""
+        now = [0.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        spdb = SPDB(
+            MockSharePointProvider(writable_dir),
+            [Server, Application],
+            cache_ttl=5,
+        )
+        expanded = spdb.get_model_items(Server, expanded=True)
+        assert spdb.get_model_items(Server, expanded=True) is expanded
+
+        (writable_dir / "Server.json").write_text("[]")
+        now[0] = 10
+
+        assert spdb.get_model_items(Server, expanded=True) == []
+
+
+class TestSPDBIndexes:
+    """Test index-backed lookups."""
+
+    def test_find_by_multi_valued_field(self, data_dir):
+        """Test finding servers by one of their roles."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Role])
+
+        servers = spdb.find(Server, "roles", "Web Server")
+
+        assert servers
+        assert all("Web Server" in s.roles for s in servers)
+        expected = [
+            s for s in spdb.get_model_items(Server) if "Web Server" in s.roles
+        ]
+        assert servers == expected
+
+    def test_find_expanded(self, data_dir):
+        """Test that found items can be expanded."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+
+        servers = spdb.find(Server, "location", "DC1", expanded=True)
+
+        assert servers
+        assert all(isinstance(s.application, Application) for s in servers)
+
+    def test_find_unknown_field(self, data_dir):
+        """Test that unknown fields are rejected."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server])
+
+        with pytest.raises(ValueError, match="Unknown field"):
+            spdb.find(Server, "missing", 1)
+
+    def test_declared_indexes_built_on_load(self, data_dir, monkeypatch):
+        """Test that fields in _indexes are indexed with the model."""
+        monkeypatch.setattr(Server, "_indexes", ("location",))
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server])
+
+        spdb.get_model_items(Server)
+
+        assert spdb._lookups["Server"].fields == [
+            "location",
+            "application",
+            "roles",
+        ]
+
+    def test_get_models_by_ids_follows_requested_order(self, data_dir):
+        """Test ID lookups on a cached model."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server])
+        spdb.get_model_items(Server)
+
+        servers = spdb.get_models_by_ids(Server, [3, 1, 999])
+
+        assert [s.id for s in servers] == [3, 1]
+
+
+class TestSPDBReverseRelations:
+    """Test back-reference navigation."""
+
+    def test_related_servers_of_application(self, data_dir):
+        """Test finding all servers running an application."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+        app = spdb.get_models_by_ids(Application, [1])[0]
+
+        servers = spdb.related(app, Server)
+
+        assert servers
+        assert all(s.application == app.name for s in servers)
+        assert len(servers) == sum(
+            s.application == app.name for s in spdb.get_model_items(Server)
+        )
+
+    def test_related_multi_valued(self, data_dir):
+        """Test back-references through a list relation."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Role])
+        role = spdb.find(Role, "name", "Database")[0]
+
+        servers = spdb.related(role, Server, expanded=True)
+
+        assert servers
+        assert all(role in s.roles for s in servers)
+
+    def test_related_follows_refresh(self, tmp_path):
+        """Test that back-references are rebuilt after refresh_cache."""
+        (tmp_path / "Application.json").write_text(
+            '[{"Id": 1, "Name": "App", "Owner": {"Id": 1, "Title": "Ops"}}]'
+        )
+        (tmp_path / "Team.json").write_text('[{"Id": 1, "Name": "Ops"}]')
+        provider = MockSharePointProvider(tmp_path)
+        spdb = SPDB(provider, [Application, Team])
+        team = spdb.get_model_items(Team)[0]
+        assert len(spdb.related(team, Application)) == 1
+
+        (tmp_path / "Application.json").write_text("[]")
+        provider.clear_cache()
+        spdb.refresh_cache(Application)
+
+        assert spdb.related(team, Application) == []
+
+    def test_related_without_relation(self, data_dir):
+        """Test that unrelated models are rejected."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Team])
+        team = spdb.get_model_items(Team)[0]
+
+        with pytest.raises(ValueError, match="no relation to Team"):
+            spdb.related(team, Server)
+
+
+class TestSPDBLazyExpansion:
+    """Test relation resolution on attribute access."""
+
+    def test_lazy_loads_related_list_on_access(self, data_dir):
+        """Test that related lists are loaded only when a relation is read."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir), [Server, Application, Role, Team]
+        )
+
+        servers = spdb.get_model_items(Server, lazy=True)
+        assert set(spdb._cache) == {"Server"}
+        assert isinstance(servers[0], Server)
+        assert type(servers[0]).__name__ == "Server"
+
+        application = servers[0].application
+        assert isinstance(application, Application)
+        assert servers[0].application is application
+        assert set(spdb._cache) == {"Server", "Application"}
+
+        assert isinstance(application.owner, Team)
+        assert all(isinstance(r, Role) for r in servers[0].roles)
+
+    def test_lazy_keeps_cached_items_raw(self, data_dir):
+        """Test that lazy copies do not alter cached items."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+
+        lazy_server = spdb.get_model_items(Server, lazy=True)[0]
+        _ = lazy_server.application
+        cached = spdb.get_model_items(Server)[0]
+
+        assert isinstance(cached.application, str)
+        assert lazy_server.model_dump() == cached.model_dump()
+
+    def test_lazy_assignment_resets_resolution(self, data_dir):
+        """Test that assigning a relation is resolved again on access."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+        server = spdb.get_models_by_ids(Server, [1], lazy=True)[0]
+        other = spdb.get_models_by_ids(Application, [2])[0]
+
+        server.application = other.name
+
+        assert server.application.id == other.id
+
+    def test_repeated_lazy_reads_are_memoized(self, data_dir):
+        """Test that lazy copies are built once until a model changes."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+
+        first = spdb.get_model_items(Server, lazy=True)
+        assert spdb.get_model_items(Server, lazy=True) is first
+        assert spdb.cache_stats["lazy"].hits == 1
+
+        _ = first[0].application
+        spdb.refresh_cache(Application)
+        second = spdb.get_model_items(Server, lazy=True)
+
+        assert second is not first
+        assert second[0].model_dump() == first[0].model_dump()
+
+    def test_lazy_missing_reference_stays_raw(self, tmp_path):
+        """Test that unknown references resolve to the raw value."""
+        (tmp_path / "Server.json").write_text(
+            '[{"Id": 1, "Hostname": "srv", "Application": "Missing"}]'
+        )
+        (tmp_path / "Application.json").write_text("[]")
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Server, Application])
+
+        server = spdb.get_model_items(Server, lazy=True)[0]
+
+        assert server.application == "Missing"
+
+
+class TestSPDBExpandedMemo:
+    """Test memoization of expanded collections."""
+
+    def test_repeated_expanded_reads_are_memoized(self, data_dir):
+        """Test that expanded lists are computed once."""
+        spdb = SPDB(MockSharePointProvider(data_dir), [Server, Application])
+
+        first = spdb.get_model_items(Server, expanded=True)
+        second = spdb.get_model_items(Server, expanded=True)
+
+        assert second is first
+        assert spdb.cache_stats["expanded"].hits == 1
+
+    def test_refresh_invalidates_dependents(self, data_dir):
+        """Test that refreshing a related model drops dependent expansions."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir), [Server, Application, Role, Team]
+        )
+        servers = spdb.get_model_items(Server, expanded=True)
+        roles = spdb.get_model_items(Role, expanded=True)
+        applications = spdb.get_model_items(Application, expanded=True)
+
+        spdb.refresh_cache(Team)
+
+        assert spdb.get_model_items(Role, expanded=True) is roles
+        assert spdb.get_model_items(Server, expanded=True) is not servers
+        assert (
+            spdb.get_model_items(Application, expanded=True) is not applications
+        )
+
+    def test_sync_invalidates_expansion(self, tmp_path):
+        """Test that synced changes show up in expanded results."""
+        (tmp_path / "Server.json").write_text(
+            '[{"Id": 1, "Hostname": "srv", "Application": "App"}]'
+        )
+        apps = tmp_path / "Application.json"
+        apps.write_text(
+            '[{"Id": 1, "Name": "App", "Version": "1", "Modified": "2024-01-01"}]'
+        )
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Server, Application])
+        assert (
+            spdb.get_model_items(Server, expanded=True)[0].application.version
+            == "1"
+        )
+
+        apps.write_text(
+            '[{"Id": 1, "Name": "App", "Version": "2", "Modified": "2024-01-02"}]'
+        )
+        spdb.sync(Application)
+
+        server = spdb.get_model_items(Server, expanded=True)[0]
+        assert server.application.version == "2"
+
+
+class TestSPDBDepthExpansion:
+    """Test multi-level expansion."""
+
+    def test_depth_two_expands_nested_relations(self, data_dir):
+        """Test that related items are expanded one more level."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir), [Server, Application, Role, Team]
+        )
+
+        servers = spdb.get_model_items(Server, expanded=True, depth=2)
+
+        for server in servers:
+            assert isinstance(server.application, Application)
+            assert isinstance(server.application.owner, Team)
+        shallow = spdb.get_model_items(Server, expanded=True)
+        assert all(isinstance(s.application.owner, str) for s in shallow)
+
+    def test_related_instances_are_shared(self, data_dir):
+        """Test that servers of one application share its instance."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir), [Server, Application, Role, Team]
+        )
+
+        servers = spdb.get_model_items(Server, expanded=True, depth=2)
+
+        by_app = {}
+        for server in servers:
+            by_app.setdefault(server.application.id, []).append(
+                server.application
+            )
+        shared = [apps for apps in by_app.values() if len(apps) > 1]
+        assert shared
+        assert all(app is apps[0] for apps in shared for app in apps)
+        expanded_apps = spdb.get_model_items(Application, expanded=True)
+        assert servers[0].application in expanded_apps
+
+    def test_full_depth(self, data_dir):
+        """Test that depth=None expands every reachable level."""
+        spdb = SPDB(
+            MockSharePointProvider(data_dir), [Server, Application, Role, Team]
+        )
+
+        servers = spdb.get_model_items(Server, expanded=True, depth=None)
+
+        assert servers is spdb.get_model_items(Server, expanded=True, depth=2)
+
+    def write_employees(self, directory, managers):
+        (directory / "Employee.json").write_text(
+            json.dumps(
+                [
+                    {
+                        "Id": i,
+                        "Name": name,
+                        "Manager": manager and {"Title": manager},
+                    }
+                    for i, (name, manager) in enumerate(managers.items(), 1)
+                ]
+            )
+        )
+
+    def test_self_reference_full_depth(self, tmp_path):
+        """Test that depth=None follows self-references as deep as the data."""
+        self.write_employees(
+            tmp_path, {"Ann": None, "Bob": "Ann", "Cid": "Bob"}
+        )
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Employee])
+
+        employees = spdb.get_model_items(Employee, expanded=True, depth=None)
+
+        assert employees is spdb.get_model_items(
+            Employee, expanded=True, depth=2
+        )
+        assert employees[2].manager.manager.name == "Ann"
+        assert employees[2].manager.manager.manager is None
+
+    def test_cycle_detection(self, tmp_path):
+        """Test that items referencing each other in a cycle are reported."""
+        self.write_employees(
+            tmp_path, {"Ann": "Cid", "Bob": "Ann", "Cid": "Bob", "Dan": "Ann"}
+        )
+        spdb = SPDB(MockSharePointProvider(tmp_path), [Employee])
+
+        with pytest.raises(RelationCycleError) as exc_info:
+            spdb.get_model_items(Employee, expanded=True, depth=None)
+
+        assert str(exc_info.value) == (
+            "Relation cycle detected: Employee 1 -> Employee 3 -> Employee 2"
+            " -> Employee 1"
+        )
+        employees = spdb.get_model_items(Employee, expanded=True, depth=2)
+        assert employees[3].manager.manager.name == "Cid"
+
+
+class TestSPDBWrites:
+    """Test bulk writes and in-place cache updates."""
+
+    def read_list(self, directory, list_name):
+        return json.loads((directory / f"{list_name}.json").read_text())
+
+    def test_update_in_place(self, writable_dir):
+        """Test that updates are written and merged into the cache."""
+        provider = MockSharePointProvider(writable_dir)
+        spdb = SPDB(provider, [Server, Application, Role])
+        servers = spdb.get_model_items(Server)
+        expanded = spdb.get_model_items(Server, expanded=True)
+        moved = expanded[0].model_copy(update={"location": "DC9"})
+
+        with patch.object(provider, "get_list_items") as get_list_items:
+            (saved,) = spdb.save_many(Server, [moved])
+            cached = spdb.get_model_items(Server)
+            found = spdb.find(Server, "location", "DC9")
+
+        get_list_items.assert_not_called()
+        assert saved.application == servers[0].application
+        assert cached[0] is saved
+        assert len(cached) == len(servers)
+        assert found == [saved]
+        raw = self.read_list(writable_dir, "Server")[0]
+        assert raw["Location"] == "DC9"
+        assert raw["Application"] == {"Id": 1, "Title": "Inventory App"}
+        assert spdb.get_model_items(Server, expanded=True) is not expanded
+
+    def test_create_assigns_ids(self, writable_dir):
+        """Test that new items get IDs and expanded lookups become IDs."""
+        spdb = SPDB(
+            MockSharePointProvider(writable_dir), [Server, Application, Role]
+        )
+        count = len(spdb.get_model_items(Server))
+        app = spdb.get_model_items(Application)[1]
+        server = Server(
+            Id=0,
+            Hostname="srv-new",
+            Application=app,
+            Roles=[{"Title": "Database"}],
+        )
+
+        (saved,) = spdb.save_many(Server, [server])
+
+        assert saved.id == 21
+        assert saved.application == app.name
+        assert saved.roles == ["Database"]
+        assert spdb.get_models_by_ids(Server, [21]) == [saved]
+        assert len(spdb.get_model_items(Server)) == count + 1
+        raw = self.read_list(writable_dir, "Server")[-1]
+        assert raw["Application"] == {"Id": app.id}
+        assert raw["Roles"] == [{"Id": 2}]
+
+    def test_delete(self, writable_dir):
+        """Test that deleted items leave the cache and reverse lookups."""
+        spdb = SPDB(
+            MockSharePointProvider(writable_dir), [Server, Application, Role]
+        )
+        app = spdb.get_model_items(Application)[0]
+        servers = spdb.related(app, Server)
+
+        spdb.delete_many(Server, [servers[0], servers[1].id])
+
+        assert spdb.related(app, Server) == servers[2:]
+        remaining = {
+            item["Id"] for item in self.read_list(writable_dir, "Server")
+        }
+        assert servers[0].id not in remaining
+        assert servers[1].id not in remaining
+
+    def test_unknown_lookup_value(self, writable_dir):
+        """Test that lookups must reference existing items."""
+        spdb = SPDB(
+            MockSharePointProvider(writable_dir), [Server, Application, Role]
+        )
+        server = spdb.get_model_items(Server)[0].model_copy(
+            update={"application": "Missing App"}
+        )
+
+        with pytest.raises(ValueError, match="Unknown Application"):
+            spdb.save_many(Server, [server])
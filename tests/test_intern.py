@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from spdb.base import SPDB
+from spdb.intern import InternTable
+from spdb.mocks import MockSharePointProvider
+from spdb_example.models import Server
+
+
+def test_intern_shares_equal_strings():
+    table = InternTable()
+    first = "".join(["DC", "1"])
+    second = "".join(["DC", "1"])
+
+    assert first is not second
+    assert table.intern(first) is table.intern(second)
+    assert len(table) == 1
+
+
+def test_intern_dict_in_json_object_hook():
+    raw = '[{"Roles": ["Web", "Db"], "Os": "Linux"}, {"Roles": ["Web"], "Os": "Linux"}]'
+
+    items = json.loads(raw, object_hook=InternTable().intern_dict)
+
+    assert items[0]["Os"] is items[1]["Os"]
+    assert items[0]["Roles"][0] is items[1]["Roles"][0]
+
+
+def test_loaded_models_share_values(data_dir):
+    spdb = SPDB(MockSharePointProvider(data_dir), [Server])
+
+    servers = spdb.get_model_items(Server)
+
+    dc1 = [s for s in servers if s.location == "DC1"]
+    assert len(dc1) > 1
+    assert all(s.location is dc1[0].location for s in dc1)
+    web = [r for s in servers for r in s.roles if r == "Web Server"]
+    assert all(r is web[0] for r in web)
+
+
+@pytest.mark.parametrize(
+    ("trusted", "compact", "interned"),
+    [(True, False, True), (False, False, False), (True, True, False)],
+)
+def test_interning_only_where_it_helps(
+    tmp_path, monkeypatch, trusted, compact, interned
+):
+    calls = []
+    monkeypatch.setattr(
+        InternTable, "intern_models", lambda self, items: calls.append(items)
+    )
+    spdb = SPDB(
+        MockSharePointProvider(tmp_path),
+        [Server],
+        trusted=trusted,
+        compact=compact,
+    )
+
+    spdb.build_model_items(
+        Server, [{"Id": 1, "Hostname": "srv", "Application": "App"}]
+    )
+
+    assert bool(calls) is interned
+
+
+def test_trusted_models_share_values(tmp_path):
+    spdb = SPDB(MockSharePointProvider(tmp_path), [Server], trusted=True)
+    raw_items = [
+        {"Id": i, "Hostname": f"srv{i}", "Application": "".join(["A", "pp"])}
+        for i in range(3)
+    ]
+
+    servers = spdb.build_model_items(Server, raw_items)
+
+    assert all(s.application is servers[0].application for s in servers)
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from pydantic import Field
 
-from spdb.model import BaseModel
+from spdb.model import BaseModel, LookupField
 
 
 def test_no_relation():
@@ -123,3 +123,116 @@ def test_single_list_relation_annotated():
     )
 
     assert not TestModelRelated.get_relation_fields()
+
+
+def test_select_and_expand_fields():
+    class TestModelRelated(BaseModel):
+        id: str
+        name: str
+
+    class TestModel(BaseModel):
+        id: Annotated[int, Field(alias="Id")]
+        name: str
+        parent: Annotated[
+            TestModelRelated | str, LookupField, Field(alias="Parent")
+        ]
+        tags: Annotated[list[str], LookupField, Field(alias="Tags")]
+
+    assert TestModel.get_lookup_fields() == {
+        "parent": "Parent",
+        "tags": "Tags",
+    }
+    assert TestModel.get_select_fields() == [
+        "Id",
+        "name",
+        "Parent/Id",
+        "Parent/Title",
+        "Tags/Id",
+        "Tags/Title",
+    ]
+    assert TestModel.get_expand_fields() == ["Parent", "Tags"]
+
+    assert TestModelRelated.get_select_fields() == ["id", "name"]
+    assert not TestModelRelated.get_expand_fields()
+
+
+def test_construct_trusted():
+    class TestModel(BaseModel):
+        id: Annotated[int, Field(alias="Id")]
+        name: str
+        parent: Annotated[str | None, LookupField, Field(None, alias="Parent")]
+        tags: Annotated[
+            list[str], LookupField, Field(default_factory=list, alias="Tags")
+        ]
+
+    obj = TestModel.construct_trusted(
+        {
+            "Id": 1,
+            "name": "first",
+            "Parent": {"Id": 2, "Title": "second"},
+            "Modified": "2024-01-01T00:00:00Z",
+        }
+    )
+
+    assert obj == TestModel(Id=1, name="first", Parent="second")
+    assert obj.tags == []
+
+
+def test_construct_trusted_many_sets_present_fields():
+    class TestModel(BaseModel):
+        id: Annotated[int, Field(alias="Id")]
+        parent: Annotated[str | None, LookupField, Field(None, alias="Parent")]
+
+    full, partial = TestModel.construct_trusted_many(
+        [{"Id": 1, "Parent": {"Id": 2, "Title": "second"}}, {"Id": 3}]
+    )
+
+    assert full.parent == "second"
+    assert full.model_fields_set == {"id", "parent"}
+    assert partial.parent is None
+    assert partial.model_fields_set == {"id"}
+
+
+def test_construct_trusted_keeps_private_attributes():
+    class TestModel(BaseModel):
+        id: Annotated[int, Field(alias="Id")]
+        _seen: bool = False
+
+    obj = TestModel.construct_trusted({"Id": 1})
+
+    assert obj.id == 1
+    assert obj._seen is False
+
+
+def test_to_sharepoint():
+    class TestModelRelated(BaseModel):
+        id: Annotated[int, Field(alias="Id")]
+        name: str
+
+    class TestModel(BaseModel):
+        id: Annotated[int, Field(alias="Id")]
+        name: Annotated[str, Field(alias="Name")]
+        parent: Annotated[
+            TestModelRelated | str | None,
+            LookupField,
+            Field(None, alias="Parent"),
+        ]
+        tags: Annotated[
+            list[str], LookupField, Field(default_factory=list, alias="Tags")
+        ]
+
+    related = TestModelRelated(Id=7, name="seven")
+    obj = TestModel(Id=1, Name="first", Parent=related, Tags=[{"Title": "a"}])
+    lookup_ids = {(None, "a"): 3}
+
+    def lookup_id(model_name, value):
+        if isinstance(value, BaseModel):
+            return value.id
+        return lookup_ids[(model_name, value)]
+
+    assert obj.to_sharepoint(lookup_id) == {
+        "Name": "first",
+        "ParentId": 7,
+        "TagsId": [3],
+    }
+    assert obj.to_sharepoint(lookup_id, fields=["name"]) == {"Name": "first"}
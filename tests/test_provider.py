@@ -1,11 +1,82 @@
 """Tests for SharePointProvider and MockSharePointProvider."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
+from requests import HTTPError, Response
 
+from spdb import cache as cache_module
 from spdb.mocks import MockSharePointProvider
-from spdb.provider import ProviderError, SharePointProvider
+from spdb.provider import (
+    PartialWriteError,
+    ProviderError,
+    SharePointProvider,
+)
+
+
+class FakePagedItems:
+    """Minimal stand-in for a paged office365 list item collection."""
+
+    def __init__(self, pages, server_paged=True):
+        self._pages = list(pages)
+        self._data = []
+        self._server_paged = server_paged
+        self.requests = 0
+        self.max_loaded = 0
+
+    def select(self, _):
+        return self
+
+    def expand(self, _):
+        return self
+
+    def paged(self, _):
+        return self
+
+    def get(self):
+        return self
+
+    def _get_next(self):
+        return self
+
+    def execute_query(self):
+        self.requests += 1
+        page = self._pages.pop(0)
+        self._data.extend(Mock(properties=item) for item in page)
+        self.max_loaded = max(self.max_loaded, len(self._data))
+        return self
+
+    def clear(self):
+        self._data = []
+        return self
+
+    @property
+    def has_next(self):
+        return bool(self._pages)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+
+class ThrottledPagedItems(FakePagedItems):
+    """Paged items whose first request is throttled with HTTP 429."""
+
+    def __init__(self, pages):
+        super().__init__(pages)
+        self.throttled = 0
+
+    def execute_query(self):
+        if not self.throttled:
+            self.throttled += 1
+            response = Response()
+            response.status_code = 429
+            response.headers["Retry-After"] = "0"
+            raise HTTPError(response=response)
+        return super().execute_query()
 
 
 class TestSharePointProvider:
@@ -38,6 +109,26 @@ class TestSharePointProvider:
             with pytest.raises(ProviderError, match="Authentication failed"):
                 _ = provider.ctx
 
+    def test_context_is_per_thread(self):
+        """Test that each thread authenticates its own client context."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+
+        with patch.object(
+            provider, "_authenticate", side_effect=lambda: Mock()
+        ) as mock_auth:
+            main_ctx = provider.ctx
+            assert provider.ctx is main_ctx
+
+            contexts = []
+            worker = threading.Thread(
+                target=lambda: contexts.append(provider.ctx)
+            )
+            worker.start()
+            worker.join()
+
+        assert contexts[0] is not main_ctx
+        assert mock_auth.call_count == 2
+
     def test_cache_functionality(self):
         """Test that caching works correctly."""
         provider = SharePointProvider("https://site.com", "user", "password")
@@ -55,6 +146,182 @@ class TestSharePointProvider:
             assert mock_fetch.call_count == 1  # No additional calls
             assert result1 == result2
 
+    def test_iter_list_pages_follows_next(self):
+        """Test that pages are requested lazily, one at a time."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        fake_items = FakePagedItems([[{"Id": 1}, {"Id": 2}], [{"Id": 3}]])
+
+        with patch.object(provider, "fetch_list") as mock_fetch_list:
+            mock_fetch_list.return_value.items = fake_items
+            pages = provider.iter_list_pages("TestList", page_size=2)
+
+            assert next(pages) == [{"Id": 1}, {"Id": 2}]
+            assert fake_items.requests == 1
+            assert next(pages) == [{"Id": 3}]
+            assert fake_items.requests == 2
+            assert list(pages) == []
+        assert fake_items.max_loaded == 2
+
+    def test_iter_list_pages_keeps_items_for_skip_paging(self):
+        """Test that items stay loaded when pages are requested by offset."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        fake_items = FakePagedItems(
+            [[{"Id": 1}, {"Id": 2}], [{"Id": 3}]], server_paged=False
+        )
+
+        with patch.object(provider, "fetch_list") as mock_fetch_list:
+            mock_fetch_list.return_value.items = fake_items
+            pages = list(provider.iter_list_pages("TestList", page_size=2))
+
+        assert pages == [[{"Id": 1}, {"Id": 2}], [{"Id": 3}]]
+        assert len(fake_items) == 3
+
+    def test_throttled_page_is_retried(self):
+        """Test that a throttled page request is queued and sent again."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        fake_items = ThrottledPagedItems([[{"Id": 1}], [{"Id": 2}]])
+
+        with patch.object(provider, "fetch_list") as mock_fetch_list:
+            mock_fetch_list.return_value.items = fake_items
+            result = provider.fetch_list_items("TestList")
+
+        assert result == [{"Id": 1}, {"Id": 2}]
+        assert fake_items.throttled == 1
+        assert fake_items.requests == 2
+
+    def test_fetch_list_items_collects_all_pages(self):
+        """Test that fetch_list_items returns items from every page."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        fake_items = FakePagedItems([[{"Id": 1}], [{"Id": 2}]])
+
+        with patch.object(provider, "fetch_list") as mock_fetch_list:
+            mock_fetch_list.return_value.items = fake_items
+            result = provider.fetch_list_items("TestList")
+
+        assert result == [{"Id": 1}, {"Id": 2}]
+
+    def test_get_many_list_items_batches_first_pages(self):
+        """Test that first pages of several lists share one batch request."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        provider._cache["Cached"] = [{"Id": 0}]
+        fake_lists = {
+            "First": FakePagedItems([[{"Id": 1}], [{"Id": 2}]]),
+            "Second": FakePagedItems([[{"Id": 3}]]),
+        }
+        ctx = Mock()
+        ctx.execute_batch.side_effect = lambda: [
+            items.execute_query() for items in fake_lists.values()
+        ]
+
+        with (
+            patch.object(provider, "_authenticate", return_value=ctx),
+            patch.object(provider, "fetch_list") as mock_fetch_list,
+        ):
+            mock_fetch_list.side_effect = lambda name: Mock(
+                items=fake_lists[name]
+            )
+            result = provider.get_many_list_items(
+                {
+                    "First": (["Id"], None),
+                    "Second": (["Id"], None),
+                    "Cached": (["Id"], None),
+                }
+            )
+
+        assert result == {
+            "Cached": [{"Id": 0}],
+            "First": [{"Id": 1}, {"Id": 2}],
+            "Second": [{"Id": 3}],
+        }
+        ctx.execute_batch.assert_called_once()
+        assert fake_lists["First"].requests == 2
+        assert provider.get_list_items("Second") == [{"Id": 3}]
+
+    def test_get_many_list_items_keeps_cached_expiry(self, monkeypatch):
+        """Test that prefetching a cached list does not extend its TTL."""
+        now = [0.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        provider = SharePointProvider(
+            "https://site.com", "user", "password", cache_ttl=10
+        )
+        provider._cache["Cached"] = [{"Id": 0}]
+
+        now[0] = 8.0
+        provider.get_many_list_items({"Cached": (["Id"], None)})
+        now[0] = 12.0
+
+        assert "Cached" not in provider._cache
+
+    def test_update_list_items_sends_chunked_batches(self):
+        """Test that updates are sent in batches of batch_size items."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        provider._cache["TestList"] = [{"Id": 1}]
+        ctx = Mock()
+        sp_list = Mock(properties={"ListItemEntityTypeFullName": "SP.Item"})
+
+        with (
+            patch.object(provider, "_authenticate", return_value=ctx),
+            patch.object(provider, "fetch_list", return_value=sp_list),
+        ):
+            provider.update_list_items(
+                "TestList",
+                {i: {"Title": f"item {i}", "TagsId": [i]} for i in range(5)},
+                batch_size=2,
+            )
+
+        assert ctx.execute_batch.call_count == 3
+        assert sp_list.get_item_by_id.call_count == 5
+        item = sp_list.get_item_by_id.return_value
+        assert item.update.call_count == 5
+        assert item.set_property.call_args_list[0].args == ("Title", "item 0")
+        assert "TestList" not in provider._cache
+
+    def write_with_batches(self, *results, **kwargs):
+        """Write 3 creates and 2 updates in batches of 2 with given results."""
+        provider = SharePointProvider("https://site.com", "user", "password")
+        ctx = Mock()
+        ctx.execute_batch.side_effect = results
+        sp_list = Mock(properties={"ListItemEntityTypeFullName": "SP.Item"})
+        ids = iter(range(1, 100))
+        sp_list.add_item.side_effect = lambda _: Mock(
+            properties={"Id": next(ids)}
+        )
+        with (
+            patch.object(provider, "_authenticate", return_value=ctx),
+            patch.object(provider, "fetch_list", return_value=sp_list),
+        ):
+            provider.write_list_items(
+                "TestList",
+                create=[{"Title": "a"}, {"Title": "b"}, {"Title": "c"}],
+                update={7: {"Title": "x"}, 8: {"Title": "y"}},
+                batch_size=2,
+                **kwargs,
+            )
+        return ctx
+
+    def test_write_reports_committed_batches(self):
+        """Test that a failing batch reports the batches written before it."""
+        with pytest.raises(PartialWriteError) as info:
+            self.write_with_batches(None, None, HTTPError("boom"))
+
+        assert [props["Id"] for props in info.value.created] == [1, 2, 3]
+        assert info.value.updated == [7]
+        assert info.value.deleted == []
+        assert isinstance(info.value.__cause__, HTTPError)
+
+    def test_throttled_creates_are_not_retried(self):
+        """Test that only batches without creates are retried."""
+        response = Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "0"
+        throttled = HTTPError(response=response)
+
+        ctx = self.write_with_batches(None, None, throttled, None)
+        assert ctx.execute_batch.call_count == 4
+
+        with pytest.raises(HTTPError):
+            self.write_with_batches(throttled, None)
+
     def test_clear_cache(self):
         """Test cache clearing functionality."""
         provider = SharePointProvider("https://site.com", "user", "password")
@@ -101,3 +368,27 @@ class TestMockSharePointProvider:
         assert len(result) == 1
         assert result[0]["Id"] == 1
         assert result[0]["Name"] == "Test Item"
+
+    def test_iter_list_pages(self, tmp_path):
+        """Test that mock data is split into pages."""
+        mock_file = tmp_path / "TestList.json"
+        mock_file.write_text('[{"Id": 1}, {"Id": 2}, {"Id": 3}]')
+
+        mock_provider = MockSharePointProvider(tmp_path)
+        pages = list(mock_provider.iter_list_pages("TestList", page_size=2))
+
+        assert pages == [[{"Id": 1}, {"Id": 2}], [{"Id": 3}]]
+
+    def test_select_projects_columns(self, tmp_path):
+        """Test that selected columns are projected from mock data."""
+        mock_file = tmp_path / "TestList.json"
+        mock_file.write_text(
+            '[{"Id": 1, "Name": "Test", "Hidden": "x", "Owner": {"Title": "A"}}]'
+        )
+
+        mock_provider = MockSharePointProvider(tmp_path)
+        result = mock_provider.fetch_list_items(
+            "TestList", select=["Id", "Owner/Title"], expand=["Owner"]
+        )
+
+        assert result == [{"Id": 1, "Owner": {"Title": "A"}}]
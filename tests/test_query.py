@@ -0,0 +1,88 @@
+"""Tests for OData filter conditions."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from spdb.query import Condition, build_conditions, to_filter
+from spdb_example.models import Application, Server
+
+
+def test_condition_to_odata():
+    assert Condition("Hostname", "eq", "srv001").to_odata() == (
+        "Hostname eq 'srv001'"
+    )
+    assert Condition("Name", "ne", "O'Brien").to_odata() == (
+        "Name ne 'O''Brien'"
+    )
+    assert (
+        Condition("Is Virtual", "eq", value=True).to_odata()
+        == "Is Virtual eq 1"
+    )
+    assert Condition("Id", "in", [1, 2]).to_odata() == "(Id eq 1 or Id eq 2)"
+    assert Condition("Location", "eq", None).to_odata() == "Location eq null"
+    modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert Condition("Modified", "gt", modified).to_odata() == (
+        "Modified gt datetime'2024-01-01T00:00:00Z'"
+    )
+    offset = datetime.fromisoformat("2024-01-01T02:00:00.500000+02:00")
+    assert Condition("Modified", "ge", offset).to_odata() == (
+        "Modified ge datetime'2024-01-01T00:00:00.500000Z'"
+    )
+
+
+def test_to_filter_joins_conditions():
+    conditions = [Condition("Id", "ge", 10), Condition("Location", "eq", "DC1")]
+    assert to_filter(conditions) == "Id ge 10 and Location eq 'DC1'"
+
+
+def test_invalid_conditions():
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        Condition("Id", "like", 1)
+    with pytest.raises(ValueError, match="non-empty"):
+        Condition("Id", "in", [])
+
+
+def test_condition_matches():
+    item = {
+        "Id": 3,
+        "Location": None,
+        "Application": {"Id": 1, "Title": "Inventory App"},
+        "Roles": [{"Title": "Web Server"}, {"Title": "Cache"}],
+        "Modified": "2024-02-01T00:00:00Z",
+    }
+
+    assert Condition("Id", "in", [1, 3]).matches(item)
+    assert not Condition("Id", "gt", 3).matches(item)
+    assert Condition("Location", "eq", None).matches(item)
+    assert not Condition("Location", "lt", "DC2").matches(item)
+    assert Condition("Application/Title", "eq", "Inventory App").matches(item)
+    assert Condition("Roles/Title", "eq", "Cache").matches(item)
+    assert not Condition("Roles/Title", "eq", "Database").matches(item)
+    assert Condition(
+        "Modified", "gt", datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ).matches(item)
+
+
+def test_build_conditions_maps_aliases():
+    conditions = build_conditions(
+        Server,
+        {
+            "ip_address": "10.0.0.1",
+            "id__lt": 100,
+            "application": "Inventory App",
+            "roles": ["Cache", "Database"],
+        },
+    )
+
+    assert conditions == [
+        Condition("Ip Address", "eq", "10.0.0.1"),
+        Condition("Id", "lt", 100),
+        Condition("Application/Title", "eq", "Inventory App"),
+        Condition("Roles/Title", "in", ["Cache", "Database"]),
+    ]
+
+
+def test_build_conditions_unknown_field():
+    with pytest.raises(ValueError, match="Unknown field 'missing'"):
+        build_conditions(Application, {"missing": 1})
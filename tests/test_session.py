@@ -0,0 +1,200 @@
+"""Tests for the unit of work session."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from spdb.base import SPDB
+from spdb.error import ModelWriteError, WriteConflictError
+from spdb.mocks import MockSharePointProvider
+from spdb.provider import PartialWriteError
+from spdb.session import Session
+from spdb_example.models import Application, Role, Server, Team
+
+
+@pytest.fixture
+def spdb(writable_dir):
+    return SPDB(
+        MockSharePointProvider(writable_dir), [Server, Application, Role, Team]
+    )
+
+
+def read_list(directory, list_name):
+    return json.loads((directory / f"{list_name}.json").read_text())
+
+
+class TestSession:
+    """Test change tracking and committing of a session."""
+
+    def test_commit_sends_only_dirty_fields(self, spdb):
+        """Test that updates carry only the changed columns."""
+        session = Session(spdb)
+        server = session.get_models_by_ids(Server, [1])[0]
+        server.location = "DC9"
+
+        assert session.dirty_fields(server) == ["location"]
+        assert spdb.get_models_by_ids(Server, [1])[0].location == "DC1"
+        with patch.object(
+            spdb.provider,
+            "write_list_items",
+            wraps=spdb.provider.write_list_items,
+        ) as write:
+            session.commit()
+
+        write.assert_called_once()
+        assert write.call_args.kwargs["update"] == {1: {"Location": "DC9"}}
+        assert spdb.get_models_by_ids(Server, [1])[0].location == "DC9"
+        assert not session.has_changes
+
+    def test_relation_changes(self, spdb, writable_dir):
+        """Test that changed lookups are sent as lookup IDs."""
+        session = Session(spdb)
+        server = session.get_models_by_ids(Server, [1])[0]
+        server.roles = [*server.roles, "Cache"]
+
+        session.commit()
+
+        raw = read_list(writable_dir, "Server")[0]
+        assert [role["Id"] for role in raw["Roles"]] == [1, 2, 3]
+        assert raw["Roles"][0]["Title"] == "Web Server"
+
+    def test_new_items_are_written_in_dependency_order(
+        self, spdb, writable_dir
+    ):
+        """Test that referenced new items are created first."""
+        spdb.load_models([Server, Application])
+        with Session(spdb) as session:
+            app = session.add(
+                Application(Id=0, Name="New App", Owner="Platform")
+            )
+            server = session.add(
+                Server(Id=0, Hostname="srv-new", Application=app)
+            )
+
+        assert app.id == 6
+        assert server.id == 21
+        raw = read_list(writable_dir, "Server")[-1]
+        assert raw["Application"] == {"Id": app.id}
+        assert spdb.get_models_by_ids(Server, [21])[0].application == "New App"
+
+    def test_etag_conflict(self, spdb, writable_dir):
+        """Test that stale items are not overwritten."""
+        spdb.save_many(Server, spdb.get_models_by_ids(Server, [1]))
+        spdb.refresh_cache()
+        session = Session(spdb)
+        server = session.get_models_by_ids(Server, [1])[0]
+        assert spdb.get_etag(Server, 1) == '"1"'
+
+        other = SPDB(
+            MockSharePointProvider(writable_dir), [Server, Application, Role]
+        )
+        concurrent = other.get_models_by_ids(Server, [1])[0]
+        other.save_many(
+            Server, [concurrent.model_copy(update={"location": "DC5"})]
+        )
+        server.location = "DC9"
+
+        with pytest.raises(WriteConflictError):
+            session.commit()
+        assert read_list(writable_dir, "Server")[0]["Location"] == "DC5"
+
+    @pytest.mark.parametrize("reload", ["sync", "refresh_cache"])
+    def test_etag_is_kept_from_read(self, spdb, writable_dir, reload):
+        """Test that reloading after the read does not bypass the ETag."""
+        spdb.save_many(Server, spdb.get_models_by_ids(Server, [1]))
+        spdb.refresh_cache()
+        session = Session(spdb)
+        server = session.get_models_by_ids(Server, [1])[0]
+
+        other = SPDB(
+            MockSharePointProvider(writable_dir), [Server, Application, Role]
+        )
+        concurrent = other.get_models_by_ids(Server, [1])[0]
+        other.save_many(
+            Server, [concurrent.model_copy(update={"location": "DC5"})]
+        )
+        getattr(spdb, reload)()
+        spdb.get_model_items(Server)
+        server.location = "DC9"
+
+        with pytest.raises(WriteConflictError):
+            session.commit()
+        assert read_list(writable_dir, "Server")[0]["Location"] == "DC5"
+
+    def test_rollback_on_error(self, spdb):
+        """Test that an exception discards and reverts pending changes."""
+        with pytest.raises(RuntimeError), Session(spdb) as session:
+            server = session.get_models_by_ids(Server, [1])[0]
+            server.location = "DC9"
+            session.delete(session.get_models_by_ids(Server, [2])[0])
+            raise RuntimeError
+
+        assert server.location == "DC1"
+        assert not session.has_changes
+        assert len(spdb.get_model_items(Server)) == 20
+
+    def test_delete(self, spdb, writable_dir):
+        """Test that deleted items are removed on commit."""
+        with Session(spdb) as session:
+            session.delete(session.get_models_by_ids(Server, [2])[0])
+
+        assert spdb.get_models_by_ids(Server, [2]) == []
+        assert 2 not in {i["Id"] for i in read_list(writable_dir, "Server")}
+
+    def test_retry_after_failure_does_not_rewrite(self, spdb, writable_dir):
+        """Test that models committed before a failure are not sent again."""
+        spdb.load_models([Server, Application])
+        session = Session(spdb)
+        session.add(Application(Id=0, Name="NewApp", Owner="Platform"))
+        server = session.add(
+            Server(Id=0, Hostname="srv-new", Application="Missing")
+        )
+        session.delete(session.get_models_by_ids(Server, [2])[0])
+
+        with pytest.raises(ValueError, match="Missing"):
+            session.commit()
+        server.application = "NewApp"
+        session.commit()
+
+        names = [a["Name"] for a in read_list(writable_dir, "Application")]
+        assert names.count("NewApp") == 1
+        assert server.id == 21
+        assert 2 not in {i["Id"] for i in read_list(writable_dir, "Server")}
+        assert not session.has_changes
+
+    def test_partial_write_is_not_repeated(self, spdb, writable_dir):
+        """Test that items created before a failed batch are not recreated."""
+        spdb.load_models([Server, Application])
+        write = spdb.provider.write_list_items
+
+        def fail_after_first_create(list_name, create=(), **kwargs):
+            created = write(list_name, create=create[:1])
+            raise PartialWriteError(
+                "boom", created=created, updated=[], deleted=[]
+            ) from ConnectionError("boom")
+
+        session = Session(spdb)
+        first = session.add(
+            Server(Id=0, Hostname="srv-a", Application="Sales Portal")
+        )
+        second = session.add(
+            Server(Id=0, Hostname="srv-b", Application="Sales Portal")
+        )
+        with (
+            patch.object(
+                spdb.provider,
+                "write_list_items",
+                side_effect=fail_after_first_create,
+            ),
+            pytest.raises(ModelWriteError) as info,
+        ):
+            session.commit()
+
+        assert [obj.id for obj in info.value.created] == [first.id] == [21]
+        assert spdb.get_models_by_ids(Server, [21])[0].hostname == "srv-a"
+        session.commit()
+
+        hostnames = [i["Hostname"] for i in read_list(writable_dir, "Server")]
+        assert hostnames.count("srv-a") == hostnames.count("srv-b") == 1
+        assert second.id == 22
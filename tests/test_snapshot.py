@@ -0,0 +1,105 @@
+"""Tests for persistent snapshot caching of provider results."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from spdb.mocks import MockSharePointProvider
+from spdb.snapshot import FileSnapshotCache, Snapshot, SnapshotCache
+
+ITEMS = [{"Id": 1, "Name": "Test"}]
+
+
+def test_file_snapshot_roundtrip(tmp_path):
+    cache = FileSnapshotCache(tmp_path)
+    cache.save("https://site", "List", Snapshot(ITEMS, "v1", ["Id"], None))
+
+    snapshot = cache.load("https://site", "List")
+    assert snapshot.items == ITEMS
+    assert snapshot.version == "v1"
+    assert snapshot.matches(["Id"], None)
+    assert not snapshot.matches(["*"], None)
+    assert cache.load("https://other", "List") is None
+
+    cache.delete("https://site", "List")
+    assert cache.load("https://site", "List") is None
+
+
+def test_file_snapshot_clear_namespace(tmp_path):
+    cache = FileSnapshotCache(tmp_path)
+    cache.save("https://site", "A", Snapshot(ITEMS))
+    cache.save("https://site", "B", Snapshot(ITEMS))
+    cache.save("https://other", "A", Snapshot(ITEMS))
+
+    cache.clear("https://site")
+
+    assert cache.load("https://site", "A") is None
+    assert cache.load("https://site", "B") is None
+    assert cache.load("https://other", "A") is not None
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    cache = FileSnapshotCache(tmp_path)
+    cache.save("https://site", "List", Snapshot(ITEMS))
+    cache._path("https://site", "List").write_bytes(b"not gzip")
+
+    assert cache.load("https://site", "List") is None
+
+
+def test_warm_start_skips_fetch(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "List.json").write_text('[{"Id": 1, "Name": "Test"}]')
+    cache = FileSnapshotCache(tmp_path / "cache")
+
+    MockSharePointProvider(data_dir, cache).get_list_items("List")
+
+    provider = MockSharePointProvider(data_dir, cache)
+    with patch.object(provider, "fetch_list_items") as mock_fetch:
+        assert provider.get_list_items("List") == ITEMS
+        mock_fetch.assert_not_called()
+
+
+def test_stale_snapshot_checks_version(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    data_file = data_dir / "List.json"
+    data_file.write_text('[{"Id": 1, "Name": "Test"}]')
+    cache = FileSnapshotCache(tmp_path / "cache", ttl=0)
+
+    MockSharePointProvider(data_dir, cache).get_list_items("List")
+
+    provider = MockSharePointProvider(data_dir, cache)
+    with patch.object(provider, "fetch_list_items") as mock_fetch:
+        assert provider.get_list_items("List") == ITEMS
+        mock_fetch.assert_not_called()
+
+    data_file.write_text('[{"Id": 1, "Name": "Changed"}]')
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    provider = MockSharePointProvider(data_dir, cache)
+    assert provider.get_list_items("List") == [{"Id": 1, "Name": "Changed"}]
+
+
+def test_clear_cache_drops_snapshot(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "List.json").write_text('[{"Id": 1, "Name": "Test"}]')
+    cache = FileSnapshotCache(tmp_path / "cache")
+    provider = MockSharePointProvider(data_dir, cache)
+
+    provider.get_list_items("List")
+    provider.clear_cache("List")
+
+    assert cache.load(provider.cache_namespace, "List") is None
+
+
+def test_incomplete_snapshot_cache_cannot_be_created():
+    class LoadOnlyCache(SnapshotCache):
+        def load(self, namespace, list_name):
+            return None
+
+    with pytest.raises(TypeError):
+        LoadOnlyCache()
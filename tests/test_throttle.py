@@ -0,0 +1,100 @@
+"""Tests for retry and rate limiting of SharePoint requests."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from requests import HTTPError, Response
+
+from spdb.throttle import RetryPolicy, TokenBucket, retry_after
+
+
+def throttled(status=429, retry_after_header=None):
+    response = Response()
+    response.status_code = status
+    if retry_after_header is not None:
+        response.headers["Retry-After"] = retry_after_header
+    return HTTPError(f"{status} Error", response=response)
+
+
+class TestRetryAfter:
+    """Test parsing of the Retry-After header."""
+
+    def test_seconds(self):
+        assert retry_after(throttled(retry_after_header="7")) == 7.0
+
+    def test_http_date_in_the_past(self):
+        error = throttled(retry_after_header="Wed, 21 Oct 2015 07:28:00 GMT")
+        assert retry_after(error) == 0.0
+
+    def test_missing(self):
+        assert retry_after(throttled()) is None
+        assert retry_after(ValueError("no response")) is None
+
+
+class TestRetryPolicy:
+    """Test retrying of throttled requests."""
+
+    def test_retries_throttled_request(self):
+        """Test that Retry-After is honored and the request is re-issued."""
+        request = Mock(
+            side_effect=[
+                throttled(retry_after_header="2"),
+                throttled(503),
+                "ok",
+            ]
+        )
+        sleep = Mock()
+        policy = RetryPolicy(backoff=0.5)
+
+        assert policy.call(request, sleep=sleep) == "ok"
+        assert request.call_count == 3
+        first, second = (c.args[0] for c in sleep.call_args_list)
+        assert first == 2.0
+        assert 0 <= second <= 1.0
+
+    def test_other_errors_are_raised(self):
+        request = Mock(side_effect=throttled(404))
+        sleep = Mock()
+
+        with pytest.raises(HTTPError):
+            RetryPolicy().call(request, sleep=sleep)
+        assert request.call_count == 1
+        sleep.assert_not_called()
+
+    def test_retries_exhausted(self):
+        request = Mock(side_effect=throttled(429))
+
+        with pytest.raises(HTTPError):
+            RetryPolicy(max_retries=2).call(request, sleep=Mock())
+        assert request.call_count == 3
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(backoff=1.0, max_backoff=3.0)
+        assert all(policy.delay(10, throttled()) <= 3.0 for _ in range(20))
+
+
+class TestTokenBucket:
+    """Test the client-side rate limiter."""
+
+    def test_limits_rate(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+
+        assert time.monotonic() - start >= 0.045
+
+    def test_pause_holds_back_requests(self):
+        bucket = TokenBucket(rate=1000)
+        bucket.pause(0.05)
+
+        start = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - start >= 0.045
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate=0)